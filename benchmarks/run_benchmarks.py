@@ -0,0 +1,222 @@
+"""
+Benchmarks XMLParser + convert_tender_to_ocds over the notices at the top
+level of the repository.
+
+    python benchmarks/run_benchmarks.py                  # all bundled notices
+    python benchmarks/run_benchmarks.py -r 10 -o results.json
+    python benchmarks/run_benchmarks.py --compare before.json -o after.json
+    python benchmarks/run_benchmarks.py --lean             # free each tree before assembly
+
+Reports per-file and aggregate latency, notices per second and peak RSS,
+and saves everything as JSON so runs of different commits can be compared
+with --compare. Unless --no-allocations is given, each file is also
+converted once under tracemalloc, which reports the Python heap blocks the
+conversion keeps and its Python heap peak. tracemalloc does not see the
+memory libxml2 allocates for the trees, so these figures are not the total
+memory of a conversion; peak RSS covers both.
+"""
+import argparse
+import gc
+import glob
+import json
+import logging
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from lxml import etree  # noqa: E402
+
+from src.mapper import XMLParser, TEDtoOCDSConverter  # noqa: E402
+
+DEFAULT_NOTICES = os.path.join(REPO_ROOT, "*.xml")
+
+
+def convert(path, lean=False):
+    parser = XMLParser(path)
+    return TEDtoOCDSConverter(parser, lean=lean).convert_tender_to_ocds()
+
+
+def peak_rss_kb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def time_file(path, repeat, lean=False):
+    parse_times = []
+    convert_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parser = XMLParser(path)
+        parsed = time.perf_counter()
+        TEDtoOCDSConverter(parser, lean=lean).convert_tender_to_ocds()
+        done = time.perf_counter()
+        parse_times.append(parsed - start)
+        convert_times.append(done - parsed)
+    total_times = [p + c for p, c in zip(parse_times, convert_times)]
+    return {
+        "parse_ms": 1000 * statistics.median(parse_times),
+        "convert_ms": 1000 * statistics.median(convert_times),
+        "median_ms": 1000 * statistics.median(total_times),
+        "min_ms": 1000 * min(total_times),
+        "mean_ms": 1000 * statistics.mean(total_times),
+    }
+
+
+def trace_python_heap(path, lean=False):
+    """
+    Runs one conversion under tracemalloc. Returns the number of Python heap
+    blocks the conversion allocated and still holds at its end (the release,
+    caches), and the Python heap peak while it ran. Memory that libxml2
+    allocates for the tree is not traced.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    release = convert(path, lean)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    retained = sum(
+        stat.count_diff for stat in after.compare_to(before, "lineno") if stat.count_diff > 0
+    )
+    del release
+    return {"py_retained_blocks": retained, "py_peak_kb": peak // 1024}
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(paths, repeat, warmup, allocations, lean=False):
+    for path in paths[:warmup]:
+        convert(path, lean)
+
+    files = {}
+    for path in paths:
+        result = {"size_kb": round(os.path.getsize(path) / 1024, 1)}
+        result.update(time_file(path, repeat, lean))
+        if allocations:
+            result.update(trace_python_heap(path, lean))
+        files[os.path.basename(path)] = result
+
+    total_ms = sum(result["median_ms"] for result in files.values())
+    aggregate = {
+        "files": len(files),
+        "total_ms": total_ms,
+        "median_ms": statistics.median(result["median_ms"] for result in files.values()),
+        "notices_per_sec": len(files) / (total_ms / 1000) if total_ms else None,
+        "peak_rss_kb": peak_rss_kb(),
+    }
+    if allocations:
+        aggregate["py_retained_blocks"] = sum(
+            result["py_retained_blocks"] for result in files.values()
+        )
+        aggregate["py_peak_kb"] = max(result["py_peak_kb"] for result in files.values())
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "date": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "lxml": ".".join(map(str, etree.LXML_VERSION)),
+            "repeat": repeat,
+            "lean": lean,
+        },
+        "aggregate": aggregate,
+        "files": files,
+    }
+
+
+def print_report(results, baseline=None):
+    base_files = baseline["files"] if baseline else {}
+    header = (
+        f"{'file':<24}{'size KB':>9}{'median ms':>11}{'min ms':>9}"
+        f"{'py blocks':>11}{'py peak KB':>12}"
+    )
+    if baseline:
+        header += f"{'change':>9}"
+    print(header)
+    for name, result in results["files"].items():
+        line = (
+            f"{name:<24}{result['size_kb']:>9}{result['median_ms']:>11.2f}"
+            f"{result['min_ms']:>9.2f}{result.get('py_retained_blocks', ''):>11}"
+            f"{result.get('py_peak_kb', ''):>12}"
+        )
+        if name in base_files:
+            line += f"{change(base_files[name]['median_ms'], result['median_ms']):>9}"
+        print(line)
+
+    aggregate = results["aggregate"]
+    print()
+    print(f"files:           {aggregate['files']}")
+    print(f"total:           {aggregate['total_ms']:.1f} ms")
+    print(f"notices/sec:     {aggregate['notices_per_sec']:.1f}")
+    print(f"peak RSS:        {aggregate['peak_rss_kb'] / 1024:.1f} MB")
+    if "py_retained_blocks" in aggregate:
+        # tracemalloc only sees the Python heap, not libxml2's trees
+        print(f"py heap blocks:  {aggregate['py_retained_blocks']}")
+        print(f"py heap peak:    {aggregate['py_peak_kb'] / 1024:.1f} MB")
+    if baseline:
+        base = baseline["aggregate"]
+        print(
+            f"vs {baseline['meta'].get('commit')}: total "
+            f"{change(base['total_ms'], aggregate['total_ms'])}, notices/sec "
+            f"{change(base['notices_per_sec'], aggregate['notices_per_sec'])}"
+        )
+
+
+def change(before, after):
+    if not before:
+        return ""
+    return f"{100 * (after - before) / before:+.1f}%"
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    arg_parser.add_argument("notices", nargs="*", help="notice files (default: the bundled notices)")
+    arg_parser.add_argument("-r", "--repeat", type=int, default=5, help="timed runs per file (default: %(default)s)")
+    arg_parser.add_argument("--warmup", type=int, default=3, help="files converted once before timing (default: %(default)s)")
+    arg_parser.add_argument("--no-allocations", action="store_true", help="skip the tracemalloc run of the Python heap")
+    arg_parser.add_argument("--lean", action="store_true", help="convert in the memory-lean mode")
+    arg_parser.add_argument("-o", "--output", help="save the results as JSON")
+    arg_parser.add_argument("--compare", help="results JSON of an earlier run to compare with")
+    args = arg_parser.parse_args(argv)
+
+    # Warnings about the notices themselves are noise here; errors still show.
+    logging.disable(logging.WARNING)
+
+    paths = sorted(args.notices or glob.glob(DEFAULT_NOTICES))
+    if not paths:
+        arg_parser.error("no notice files found")
+
+    results = run(paths, args.repeat, args.warmup, not args.no_allocations, args.lean)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+    print_report(results, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
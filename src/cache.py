@@ -0,0 +1,176 @@
+# src/cache.py
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+# Puts between re-reading the total size, which other processes change too
+SIZE_REFRESH_INTERVAL = 100
+# Hits between writing the access times, so that hits stay read-only
+ACCESS_FLUSH_INTERVAL = 100
+
+
+def mapper_version():
+    """
+    A stamp of the code that shapes the output: the hash of the mapper, the
+    code tables, the release records, the serializers and the conversion
+    entry points, so cached releases and manifest entries are never reused
+    after any of them changed.
+    """
+    try:
+        import codelists
+        import mapper
+        import read_write
+        import records
+        import serialization
+    except ImportError:
+        from src import codelists, mapper, read_write, records, serialization
+    digest = hashlib.sha256()
+    for module in (mapper, codelists, records, serialization, read_write):
+        with open(module.__file__, "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()[:16]
+
+
+class ConversionCache:
+    """
+    On-disk cache of serialized releases in SQLite, keyed by the SHA-256 of
+    the notice bytes, the mapper version, the JSON format and the id mode.
+    Entries are evicted least recently used first once the cache grows beyond
+    max_bytes. The access times of hits are kept in memory and written in one
+    transaction by flush(), so that concurrent workers only take the write
+    lock when they store or evict, not on every hit.
+    The connection is opened lazily, so the cache can be handed to worker
+    processes, which each open their own.
+    """
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES, version=None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.version = version or mapper_version()
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._size = None
+        self._puts = 0
+        self._accessed = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_size"] = None
+        state["_accessed"] = {}
+        return state
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS releases ("
+                "key TEXT PRIMARY KEY, release BLOB NOT NULL, "
+                "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS releases_accessed ON releases (accessed)"
+            )
+            self._connection = connection
+        return self._connection
+
+    def key(self, xml_data, serializer, deterministic_ids=False):
+        digest = hashlib.sha256(xml_data).hexdigest()
+        json_format = f"{serializer.name}-{'pretty' if serializer.pretty else 'compact'}"
+        ids = "deterministic" if deterministic_ids else "random"
+        return f"{digest}:{self.version}:{json_format}:{ids}"
+
+    def get(self, key):
+        row = self.connection.execute(
+            "SELECT release FROM releases WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._accessed[key] = time.time()
+        if len(self._accessed) >= ACCESS_FLUSH_INTERVAL:
+            self.flush()
+        return row[0]
+
+    def flush(self):
+        """Writes the access times of the hits since the last flush."""
+        if not self._accessed:
+            return
+        accessed = [(timestamp, key) for key, timestamp in self._accessed.items()]
+        self._accessed = {}
+        connection = self.connection
+        connection.execute("BEGIN")
+        try:
+            connection.executemany(
+                "UPDATE releases SET accessed = ? WHERE key = ?", accessed
+            )
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def put(self, key, encoded):
+        self.flush()
+        self.connection.execute(
+            "INSERT OR REPLACE INTO releases (key, release, size, accessed) VALUES (?, ?, ?, ?)",
+            (key, encoded, len(encoded), time.time()),
+        )
+        self._puts += 1
+        if self._size is None or self._puts % SIZE_REFRESH_INTERVAL == 0:
+            self._size = self.size()
+        else:
+            self._size += len(encoded)
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def size(self):
+        return self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM releases"
+        ).fetchone()[0]
+
+    def evict(self):
+        """Drops the least recently used entries until the cache is 90% of max_bytes."""
+        self.flush()
+        target = int(self.max_bytes * 0.9)
+        size = self.size()
+        connection = self.connection
+        while size > target:
+            rows = connection.execute(
+                "SELECT key, size FROM releases ORDER BY accessed LIMIT 100"
+            ).fetchall()
+            if not rows:
+                break
+            dropped = []
+            for key, entry_size in rows:
+                dropped.append((key,))
+                size -= entry_size
+                if size <= target:
+                    break
+            connection.executemany("DELETE FROM releases WHERE key = ?", dropped)
+        self._size = size
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Evicted cache entries, %d bytes left", size)
+
+    def clear(self):
+        self.connection.execute("DELETE FROM releases")
+        self._size = 0
+        self._accessed = {}
+
+    def close(self):
+        self.flush()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
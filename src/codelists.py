@@ -0,0 +1,216 @@
+# src/codelists.py
+"""
+Code tables of the eForms code lists used by the mapper, built once at
+import. They are read-only mappings; copy a value before putting it into
+a release.
+"""
+from types import MappingProxyType
+
+# BT-03 form type: release tags and tender status
+FORM_TYPES = MappingProxyType({
+    "planning": MappingProxyType({"tag": ("tender",), "tender_status": "planned"}),
+    "competition": MappingProxyType({"tag": ("tender",), "tender_status": "active"}),
+    "change": MappingProxyType({"tag": ("tenderUpdate",), "tender_status": None}),
+    "result": MappingProxyType({"tag": ("award", "contract"), "tender_status": "complete"}),
+    "dir-awa-pre": MappingProxyType({"tag": ("award", "contract"), "tender_status": "complete"}),
+    "cont-modif": MappingProxyType({
+        "tag": ("awardUpdate", "contractUpdate"),
+        "tender_status": None,
+    }),
+})
+
+UNKNOWN_FORM_TYPE = MappingProxyType({"tag": (), "tender_status": "planned"})
+
+DPS_TYPES = MappingProxyType({
+    "dps-nlist": "closed",
+    "dps-openall": "open",
+})
+
+CONTRACTING_ENTITY_DESCRIPTIONS = MappingProxyType({
+    "cont-ent": "Contracting Entity",
+    # Add other codes and descriptions as needed
+})
+
+ACTIVITY_DESCRIPTIONS = MappingProxyType({
+    "airport": "Airport-related activities",
+    "defence": "Defence",
+    "econ-aff": "Economic affairs",
+    "education": "Education",
+    "electricity": "Electricity-related activities",
+    "env-pro": "Environmental protection",
+    "gas-heat": "Production, transport or distribution of gas or heat",
+    "gas-oil": "Extraction of gas or oil",
+    "gen-pub": "General public services",
+    "hc-am": "Housing and community amenities",
+    "health": "Health",
+    "port": "Port-related activities",
+    "post": "Postal services",
+    "pub-os": "Public order and safety",
+    "rail": "Railway services",
+    "rcr": "Recreation, culture and religion",
+    "soc-pro": "Social protection",
+    "solid-fuel": "Exploration or extraction of coal or other solid fuels",
+    "urttb": "Urban railway, tramway, trolleybus or bus services",
+    "water": "Water-related activities",
+})
+
+BUYER_LEGAL_TYPE_DESCRIPTIONS = MappingProxyType({
+    "body-pl": "Body governed by public law",
+    "body-pl-cga": "Body governed by public law, controlled by a central government authority",
+    "body-pl-la": "Body governed by public law, controlled by a local authority",
+    "body-pl-ra": "Body governed by public law, controlled by a regional authority",
+    "cga": "Central government authority",
+    "def-cont": "Defence contractor",
+    "eu-ins-bod-ag": "EU institution, body or agency",
+    "eu-int-org": "European Institution/Agency or International Organisation",
+    "grp-p-aut": "Group of public authorities",
+    "int-org": "International organisation",
+    "la": "Local authority",
+    "org-sub": "Organisation awarding a contract subsidised by a contracting authority",
+    "org-sub-cga": "Organisation awarding a contract subsidised by a central government authority",
+    "org-sub-la": "Organisation awarding a contract subsidised by a local authority",
+    "org-sub-ra": "Organisation awarding a contract subsidised by a regional authority",
+    "pub-undert": "Public undertaking",
+    "pub-undert-cga": "Public undertaking, controlled by a central government authority",
+    "pub-undert-la": "Public undertaking, controlled by a local authority",
+    "pub-undert-ra": "Public undertaking, controlled by a regional authority",
+    "ra": "Regional authority",
+    "rl-aut": "Regional or local authority",
+    "spec-rights-entity": "Entity with special or exclusive rights",
+})
+
+ACTIVITY_COFOG_CODES = MappingProxyType({
+    "gas-oil": "04.2.2",  # Fuel and energy
+    "coal": "04.2.1",  # Mining, manufacturing and construction
+    "electricity": "04.2.2",  # Fuel and energy
+    "gas-heat": "04.2.2",  # Fuel and energy
+    "port": "04.5.2",  # Transport
+    "railway": "04.5.2",  # Transport
+    "urban-transport": "04.5.2",  # Transport
+    "airport": "04.5.2",  # Transport
+    "water": "06.3.0",  # Water supply
+    "environment": "05.0.0",  # Environmental protection
+    "housing": "06.1.0",  # Housing development
+    "health": "07.0.0",  # Health
+    "recreation": "08.0.0",  # Recreation, culture and religion
+    "education": "09.0.0",  # Education
+    "social": "10.0.0",  # Social protection
+    "public-services": "01.0.0",  # General public services
+    "public-order": "03.0.0",  # Public order and safety
+    "defence": "02.0.0",  # Defence
+    "economic": "04.0.0",  # Economic affairs
+    "postal": "04.7.0",  # Other industries
+})
+
+COFOG_UN_CODES = MappingProxyType({
+    "04.2.2": "12",  # Crude petroleum and natural gas
+    "04.2.1": "11",  # Coal and peat
+    "04.5.2": "64",  # Passenger transport services
+    "06.3.0": "18",  # Natural water
+    "05.0.0": "94",  # Sewage and waste collection, treatment and disposal and other environmental protection services
+    "06.1.0": "72",  # Real estate services
+    "07.0.0": "93",  # Human health and social care services
+    "08.0.0": "96",  # Recreational, cultural and sporting services
+    "09.0.0": "92",  # Education services
+    "10.0.0": "93",  # Human health and social care services
+    "01.0.0": "91",  # Public administration and other services provided to the community as a whole; compulsory social security services
+    "03.0.0": "91",  # Public administration and other services provided to the community as a whole; compulsory social security services
+    "02.0.0": "91",  # Public administration and other services provided to the community as a whole; compulsory social security services
+    "04.0.0": "83",  # Professional, technical and business services (except research, development, legal and accounting services)
+    "04.7.0": "68",  # Postal and courier services
+})
+
+AWARD_CRITERION_NUMBER_WEIGHTS = MappingProxyType({
+    "percentageExact": "percentageExact",
+    # Add more mappings if needed
+})
+
+AWARD_CRITERION_NUMBER_FIXED = MappingProxyType({
+    "total": "total",
+    # Add more mappings if needed
+})
+
+AWARD_CRITERION_NUMBER_THRESHOLDS = MappingProxyType({
+    "maximumBids": "maximumBids",
+    # Add more mappings if needed
+})
+
+STRATEGIC_PROCUREMENT_GOALS = MappingProxyType({
+    "inn-pur": "economic.innovativePurchase",
+    # Add more mappings if required
+})
+
+LANGUAGE_CODES = MappingProxyType({
+    "ENG": "en",
+    "FRA": "fr",
+    "DEU": "de",
+    "ITA": "it",
+    "ESP": "es",
+    "NLD": "nl",
+    "BGR": "bg",
+    "CES": "cs",
+    "DAN": "da",
+    "ELL": "el",
+    "EST": "et",
+    "FIN": "fi",
+    "HUN": "hu",
+    "HRV": "hr",
+    "LAT": "lv",
+    "LIT": "lt",
+    "MLT": "mt",
+    "POL": "pl",
+    "POR": "pt",
+    "RON": "ro",
+    "SLK": "sk",
+    "SLV": "sl",
+    "SWE": "sv",
+    "NOR": "no",
+    "ISL": "is",
+})
+
+ACCESS_DETAILS = MappingProxyType({
+    "ipr-iss": "Restricted. Intellectual property rights issues",
+    # Add more mappings as needed
+})
+
+PROCUREMENT_METHODS = MappingProxyType({
+    "open": MappingProxyType({"method": "open", "details": "Open procedure"}),
+    "restricted": MappingProxyType({
+        "method": "selective",
+        "details": "Restricted procedure",
+    }),
+    "negotiated": MappingProxyType({"method": "limited", "details": "Negotiated procedure"}),
+    # Add more mappings as needed
+})
+
+DIRECT_AWARD_JUSTIFICATIONS = MappingProxyType({
+    "ecom-excl": "Specific exclusion in the field of electronic communications",
+    "urgent": "Urgent needs due to unforeseen circumstances",
+    # Add more mappings as needed
+})
+
+NON_AWARD_REASONS = MappingProxyType({
+    "no-rece": "No tenders, requests to participate or projects were received",
+    # Add other mappings as needed
+})
+
+CVD_CONTRACT_TYPES = MappingProxyType({
+    "oth-serv-contr": "other service contract",
+    # Add other mappings as required
+})
+
+MODIFICATION_REASONS = MappingProxyType({
+    "add-wss": "Need for additional works, services or supplies by the original contractor.",
+    # More values as needed
+})
+
+SOCIAL_PROCUREMENT_GOALS = MappingProxyType({
+    "et-eq": "social.ethnicEquality",
+    # Add more mappings as required
+})
+
+RECEIVED_SUBMISSION_MEASURES = MappingProxyType({
+    "t-sme": "smeBids",
+    "t-esea": "eeaBids", 
+    "t-out-eu": "nonEeaBids"  # Example mapping; add more as needed
+})
@@ -0,0 +1,132 @@
+# src/manifest.py
+import hashlib
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_fingerprinted(path):
+    """
+    Reads a notice file and returns its bytes with the size, mtime and
+    SHA-256 the manifest records for them. The stat is taken before the
+    read, so a file that changes meanwhile looks changed on the next run.
+    """
+    stat = os.stat(path)
+    with open(path, "rb") as file:
+        data = file.read()
+    fingerprint = {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": hashlib.sha256(data).hexdigest(),
+    }
+    return data, fingerprint
+
+
+class Manifest:
+    """
+    Records, for every converted notice file, its size, mtime and SHA-256,
+    the output it produced and the mapper version and options that produced
+    it, so a later run over the same archive only converts what changed.
+    Stored as JSON; paths are kept as given to the converter.
+    """
+
+    def __init__(self, path, version, options=""):
+        self.path = path
+        self.version = version
+        self.options = options
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                self.entries = json.load(file).get("files", {})
+        self.outputs = {entry["output"]: xml_input_path for xml_input_path, entry in self.entries.items()}
+
+    def is_current(self, xml_input_path, output_path=None):
+        """
+        True when the file was converted before by this mapper version and
+        options, its output still exists and its content is unchanged. With
+        output_path, the recorded output must also be that file, so a run
+        into another output directory converts everything again. The file is
+        only hashed when its size or mtime differ from the manifest.
+        """
+        entry = self.entries.get(xml_input_path)
+        if entry is None:
+            return False
+        if entry["version"] != self.version or entry["options"] != self.options:
+            return False
+        if output_path is not None and entry["output"] != output_path:
+            return False
+        if not os.path.exists(entry["output"]):
+            return False
+        stat = os.stat(xml_input_path)
+        if stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]:
+            return True
+        if stat.st_size != entry["size"] or file_sha256(xml_input_path) != entry["sha256"]:
+            return False
+        # Touched but unchanged: remember the new mtime to skip the hash next time
+        entry["mtime_ns"] = stat.st_mtime_ns
+        return True
+
+    def pending(self, xml_input_paths, output_paths=None):
+        """
+        Returns the files that are new, changed or converted by another mapper
+        version. output_paths maps each file to the output this run writes;
+        files recorded with another output are pending too.
+        """
+        output_paths = output_paths or {}
+        return [
+            path for path in xml_input_paths
+            if not self.is_current(path, output_paths.get(path))
+        ]
+
+    def record(self, xml_input_path, output_path, fingerprint=None):
+        """
+        Records the file as converted to output_path. fingerprint is the one
+        read_fingerprinted() returned for the bytes that were converted; the
+        file is fingerprinted now when it is not given. Another file recorded
+        with the same output no longer has it, so it is dropped and converted
+        again on the next run.
+        """
+        entry = self.entries.get(xml_input_path)
+        if entry is not None and entry["output"] != output_path:
+            self.outputs.pop(entry["output"], None)
+        previous = self.outputs.get(output_path)
+        if previous is not None and previous != xml_input_path:
+            del self.entries[previous]
+            logger.warning("%s overwrote the output of %s", xml_input_path, previous)
+        self.outputs[output_path] = xml_input_path
+        if fingerprint is None:
+            stat = os.stat(xml_input_path)
+            fingerprint = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": file_sha256(xml_input_path),
+            }
+        self.entries[xml_input_path] = {
+            **fingerprint,
+            "output": output_path,
+            "version": self.version,
+            "options": self.options,
+        }
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary_path = self.path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump({"files": self.entries}, file, indent=2, sort_keys=True)
+        os.replace(temporary_path, self.path)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Saved manifest with %d files to %s", len(self.entries), self.path)
@@ -1,135 +1,1032 @@
+import hashlib
 import logging
+import time
 import uuid
-import json
+from collections import OrderedDict
+from contextlib import nullcontext
 from lxml import etree
 from datetime import datetime
 import dateutil.parser
 
+try:
+    from codelists import (
+        ACCESS_DETAILS,
+        ACTIVITY_COFOG_CODES,
+        ACTIVITY_DESCRIPTIONS,
+        AWARD_CRITERION_NUMBER_FIXED,
+        AWARD_CRITERION_NUMBER_THRESHOLDS,
+        AWARD_CRITERION_NUMBER_WEIGHTS,
+        BUYER_LEGAL_TYPE_DESCRIPTIONS,
+        COFOG_UN_CODES,
+        CONTRACTING_ENTITY_DESCRIPTIONS,
+        CVD_CONTRACT_TYPES,
+        DIRECT_AWARD_JUSTIFICATIONS,
+        DPS_TYPES,
+        FORM_TYPES,
+        LANGUAGE_CODES,
+        MODIFICATION_REASONS,
+        NON_AWARD_REASONS,
+        PROCUREMENT_METHODS,
+        RECEIVED_SUBMISSION_MEASURES,
+        SOCIAL_PROCUREMENT_GOALS,
+        STRATEGIC_PROCUREMENT_GOALS,
+        UNKNOWN_FORM_TYPE,
+    )
+    from records import Award, Bid, Contract, Lot, Party, Record
+    from serialization import get_serializer
+except ImportError:
+    from src.codelists import (
+        ACCESS_DETAILS,
+        ACTIVITY_COFOG_CODES,
+        ACTIVITY_DESCRIPTIONS,
+        AWARD_CRITERION_NUMBER_FIXED,
+        AWARD_CRITERION_NUMBER_THRESHOLDS,
+        AWARD_CRITERION_NUMBER_WEIGHTS,
+        BUYER_LEGAL_TYPE_DESCRIPTIONS,
+        COFOG_UN_CODES,
+        CONTRACTING_ENTITY_DESCRIPTIONS,
+        CVD_CONTRACT_TYPES,
+        DIRECT_AWARD_JUSTIFICATIONS,
+        DPS_TYPES,
+        FORM_TYPES,
+        LANGUAGE_CODES,
+        MODIFICATION_REASONS,
+        NON_AWARD_REASONS,
+        PROCUREMENT_METHODS,
+        RECEIVED_SUBMISSION_MEASURES,
+        SOCIAL_PROCUREMENT_GOALS,
+        STRATEGIC_PROCUREMENT_GOALS,
+        UNKNOWN_FORM_TYPE,
+    )
+    from src.records import Award, Bid, Contract, Lot, Party, Record
+    from src.serialization import get_serializer
+
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.DEBUG)
 
 
 def parse_iso_date(date_str):
     try:
         return dateutil.parser.isoparse(date_str)
     except ValueError as e:
-        logging.error(f"Error parsing date: {date_str} - {e}")
+        logger.error("Error parsing date: %s - %s", date_str, e)
         return None
 
 
+def is_empty(value):
+    return value is None or (isinstance(value, (dict, list)) and not value)
+
+
+NSMAP = {
+    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
+    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
+    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
+    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
+    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
+    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
+}
+
+
+class XPathCache:
+    """
+    Bounded LRU cache of compiled etree.XPath objects, keyed by expression and
+    namespace map. Shared by all XMLParser instances, so a batch of notices
+    compiles each expression only once.
+    """
+
+    def __init__(self, maxsize=2048, namespaces=None):
+        self.maxsize = maxsize
+        self.namespaces = namespaces or NSMAP
+        self.hits = 0
+        self.misses = 0
+        self._compiled = OrderedDict()
+
+    def get(self, xpath, namespaces=None):
+        if namespaces is None or namespaces == self.namespaces:
+            key = xpath
+            namespaces = self.namespaces
+        else:
+            key = (xpath, frozenset(namespaces.items()))
+        compiled = self._compiled.get(key)
+        if compiled is not None:
+            self.hits += 1
+            self._compiled.move_to_end(key)
+            return compiled
+        self.misses += 1
+        compiled = etree.XPath(xpath, namespaces=namespaces)
+        self._compiled[key] = compiled
+        if len(self._compiled) > self.maxsize:
+            self._compiled.popitem(last=False)
+        return compiled
+
+    def clear(self):
+        self._compiled.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._compiled),
+            "maxsize": self.maxsize,
+        }
+
+
+class ElementIndex:
+    """
+    Maps the identifiers of a notice (ORG-, UBO-, LOT-, RES-, TEN-, CON-,
+    TPA-) to their elements, so that cross references can be resolved without
+    an XPath scan of the document for every reference. Built in one pass over
+    the tree.
+    """
+
+    def __init__(self, root):
+        self.organizations = {}
+        self.beneficial_owners = {}
+        self.lots = {}
+        self.lot_results = {}
+        self.lot_tenders = {}
+        self.settled_contracts = {}
+        self.tendering_parties = {}
+        self.lot_results_by_contract = {}
+        self.settled_contracts_by_tender = {}
+        self.build(root)
+
+    def build(self, root):
+        cac, cbc, efac = NSMAP["cac"], NSMAP["cbc"], NSMAP["efac"]
+        id_tag = f"{{{cbc}}}ID"
+        organization_tag = f"{{{efac}}}Organization"
+        organizations_tag = f"{{{efac}}}Organizations"
+        owner_tag = f"{{{efac}}}UltimateBeneficialOwner"
+        lot_tag = f"{{{cac}}}ProcurementProjectLot"
+        lot_result_tag = f"{{{efac}}}LotResult"
+        lot_tender_tag = f"{{{efac}}}LotTender"
+        settled_contract_tag = f"{{{efac}}}SettledContract"
+        tendering_party_tag = f"{{{efac}}}TenderingParty"
+        notice_result_tag = f"{{{efac}}}NoticeResult"
+        org_id_path = f"{{{efac}}}Company/{{{cac}}}PartyIdentification/{id_tag}"
+
+        for element in root.iter(
+            organization_tag,
+            owner_tag,
+            lot_tag,
+            lot_result_tag,
+            lot_tender_tag,
+            settled_contract_tag,
+            tendering_party_tag,
+        ):
+            tag = element.tag
+            if tag == organization_tag:
+                element_id = element.findtext(org_id_path)
+                if element_id:
+                    self.organizations.setdefault(element_id, element)
+                continue
+
+            # Organizations refer to their owners by ID; the owners themselves
+            # are listed next to the organizations.
+            if tag == owner_tag:
+                if element.getparent().tag == organizations_tag:
+                    element_id = element.findtext(id_tag)
+                    if element_id:
+                        self.beneficial_owners.setdefault(element_id, element)
+                continue
+
+            # LotTender, SettledContract and TenderingParty are also used as
+            # ID references elsewhere; only the NoticeResult children count.
+            if (
+                tag in (lot_tender_tag, settled_contract_tag, tendering_party_tag)
+                and element.getparent().tag != notice_result_tag
+            ):
+                continue
+            element_id = element.findtext(id_tag)
+            if not element_id:
+                continue
+
+            if tag == lot_tag:
+                self.lots.setdefault(element_id, element)
+            elif tag == lot_result_tag:
+                self.lot_results.setdefault(element_id, element)
+                for contract_id in element.iterfind(
+                    f"{settled_contract_tag}/{id_tag}"
+                ):
+                    self.lot_results_by_contract.setdefault(
+                        contract_id.text, []
+                    ).append(element)
+            elif tag == lot_tender_tag:
+                self.lot_tenders.setdefault(element_id, element)
+            elif tag == settled_contract_tag:
+                self.settled_contracts.setdefault(element_id, element)
+                for tender_id in element.iterfind(f"{lot_tender_tag}/{id_tag}"):
+                    self.settled_contracts_by_tender.setdefault(
+                        tender_id.text, []
+                    ).append(element)
+            else:
+                self.tendering_parties.setdefault(element_id, element)
+
+    def organization_name(self, org_id):
+        organization = self.organizations.get(org_id)
+        if organization is None:
+            return None
+        return organization.findtext(
+            "efac:Company/cac:PartyName/cbc:Name", namespaces=NSMAP
+        )
+
+
 class XMLParser:
+    xpath_cache = XPathCache()
+
     def __init__(self, xml_file):
-        self.tree = etree.parse(xml_file)
-        self.root = self.tree.getroot()
-        self.nsmap = {
-            "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-            "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-            "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-            "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-            "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-            "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        }
-        logging.info(f"XMLParser initialized with file: {xml_file}")
+        self._attach(etree.parse(xml_file).getroot())
+        logger.info("XMLParser initialized with file: %s", xml_file)
+
+    @classmethod
+    def from_element(cls, root):
+        """Wraps an already parsed notice element, e.g. one from iter_notices()."""
+        parser = cls.__new__(cls)
+        parser._attach(root)
+        return parser
+
+    def _attach(self, root):
+        self.tree = root.getroottree()
+        self.root = root
+        self.nsmap = dict(NSMAP)
+        self._index = None
+
+    def close(self):
+        """
+        Drops the parsed tree and the element index, so their memory can be
+        freed while the parser object itself is still referenced.
+        """
+        self.tree = None
+        self.root = None
+        self._index = None
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = ElementIndex(self.root)
+        return self._index
+
+    def xpath(self, element, xpath, namespaces=None):
+        return self.xpath_cache.get(xpath, namespaces)(element)
 
     def find_text(self, element, xpath, namespaces=None):
-        namespaces = namespaces or self.nsmap
         try:
-            nodes = element.xpath(xpath, namespaces=namespaces)
+            nodes = self.xpath(element, xpath, namespaces)
             return nodes[0].text if nodes else None
-        except etree.XPathEvalError as e:
-            logging.error(f"Invalid XPath expression: {xpath} - {e}")
+        except etree.XPathError as e:
+            logger.error("Invalid XPath expression: %s - %s", xpath, e)
             return None
 
     def find_attribute(self, element, xpath, attribute, default=None):
         if xpath.startswith("//"):
-            xpath = ".\\" + xpath
-        node = element.find(xpath, namespaces=self.nsmap)
-        return node.get(attribute) if node is not None else default
+            xpath = "." + xpath
+        nodes = self.xpath(element, xpath)
+        return nodes[0].get(attribute) if nodes else default
 
     def find_node(self, element, xpath, namespaces=None):
-        node = element.find(xpath, namespaces=namespaces if namespaces else self.nsmap)
-        return node
+        nodes = self.xpath(element, xpath, namespaces)
+        return nodes[0] if nodes else None
 
     def find_nodes(self, element, xpath, namespaces=None):
-        return element.findall(
-            xpath, namespaces=namespaces if namespaces else self.nsmap
-        )
+        return self.xpath(element, xpath, namespaces)
+
+
+NOTICE_TAGS = (
+    "{*}PriorInformationNotice",
+    "{*}ContractNotice",
+    "{*}ContractAwardNotice",
+)
+
+
+def iter_notices(source, tags=NOTICE_TAGS):
+    """
+    Streams the notices of a bulk XML export (or of a single notice file) and
+    yields an XMLParser for one notice at a time. Each notice is cleared once
+    the caller moves on, and the notices before it are removed from the tree,
+    so memory use does not grow with the size of the export.
+    """
+    context = etree.iterparse(source, events=("end",), tag=tags, huge_tree=True)
+    for _, notice in context:
+        parent = notice.getparent()
+        if parent is not None:
+            while notice.getprevious() is not None:
+                del parent[0]
+        yield XMLParser.from_element(notice)
+        notice.clear(keep_tail=True)
+    del context
+
+
+def handles(scope="notice", scheme=None, reads=(), writes=()):
+    """
+    Declares the walk scope of a field handler and the release sections it
+    depends on. The handler is called once for every element of that scope;
+    lot handlers can be restricted to the lots whose cbc:ID has the given
+    schemeName ('Lot', 'Part' or 'LotsGroup').
+    writes names the sections the handler creates objects in (parties, lots,
+    awards, contracts, bids, documents, or tender for the other tender
+    fields); reads names the sections where it only looks up or updates
+    objects that other handlers created.
+    """
+
+    def decorator(method):
+        method.scope = scope
+        method.scheme = scheme
+        method.reads = frozenset(reads)
+        method.writes = frozenset(writes)
+        return method
+
+    return decorator
+
+
+def plan_handlers(handlers):
+    """
+    Orders field handlers for dispatch. Repeated handlers run once, and a
+    handler that reads a section runs after every handler that writes it.
+    Otherwise the given order is kept, since handlers writing the same
+    section depend on each other's order (e.g. the order of the parties).
+    Raises ValueError for a handler without declared sections or for
+    declarations that depend on each other in a cycle.
+    """
+    unique = list({handler.__name__: handler for handler in handlers}.values())
+    for handler in unique:
+        if not hasattr(handler, "writes"):
+            raise ValueError(f"Handler {handler.__name__} does not declare its sections")
+
+    writers = {}
+    for handler in unique:
+        for section in handler.writes:
+            writers.setdefault(section, []).append(handler.__name__)
+    position = {handler.__name__: i for i, handler in enumerate(unique)}
+    after = {handler.__name__: set() for handler in unique}
+    for handler in unique:
+        for section in handler.reads - handler.writes:
+            after[handler.__name__].update(writers.get(section, ()))
+        after[handler.__name__].discard(handler.__name__)
+
+    # Kahn's algorithm, always taking the earliest ready handler
+    planned = []
+    done = set()
+    remaining = {handler.__name__: handler for handler in unique}
+    while remaining:
+        ready = [name for name in remaining if after[name] <= done]
+        if not ready:
+            raise ValueError(f"Handler dependencies form a cycle: {sorted(remaining)}")
+        name = min(ready, key=position.__getitem__)
+        planned.append(remaining.pop(name))
+        done.add(name)
+    return planned
+
+
+def true_flag(text):
+    """Converter for indicators that only map when they are 'true'."""
+    return True if text.lower() == "true" else None
+
+
+class FieldMapping:
+    """
+    A simple BT field: the XPath of its value relative to the scope element,
+    the dot-separated OCDS path it maps to (relative to the lot, or to the
+    tender for the notice scope) and a converter for the text. Fields whose
+    converter returns None are left out.
+    """
+
+    __slots__ = ("bt", "scope", "scheme", "xpath", "target", "converter")
+
+    def __init__(self, bt, xpath, target, converter=None, scope="notice", scheme=None):
+        self.bt = bt
+        self.xpath = xpath
+        self.target = target
+        self.converter = converter
+        self.scope = scope
+        self.scheme = scheme
+
+
+class FieldMappingPlan:
+    """
+    Compiles field mappings once into per-scope lists of XPath objects, so
+    every scope element is evaluated in one pass that fills all of its simple
+    fields.
+    """
+
+    def __init__(self, mappings, namespaces=None):
+        self.mappings = tuple(mappings)
+        self.fields = {}
+        for mapping in self.mappings:
+            self.fields.setdefault((mapping.scope, mapping.scheme), []).append(
+                (
+                    etree.XPath(mapping.xpath, namespaces=namespaces or NSMAP),
+                    tuple(mapping.target.split(".")),
+                    mapping.converter,
+                )
+            )
+
+    def extract(self, element, scope="notice", scheme=None):
+        """Returns the values found under element as a nested dict of OCDS paths."""
+        values = {}
+        for xpath, path, converter in self.fields.get((scope, scheme), ()):
+            nodes = xpath(element)
+            if not nodes:
+                continue
+            text = nodes[0] if isinstance(nodes[0], str) else nodes[0].text
+            if not text:
+                continue
+            value = converter(text) if converter else text
+            if value is None:
+                continue
+            target = values
+            for key in path[:-1]:
+                target = target.setdefault(key, {})
+            target[path[-1]] = value
+        return values
+
+
+def qualified_tag(name, namespaces=None):
+    """Returns the Clark notation of a prefixed name, e.g. cac:Party."""
+    prefix, local = name.split(":")
+    return f"{{{(namespaces or NSMAP)[prefix]}}}{local}"
+
+
+class PartyRoleResolver:
+    """
+    Finds the organizations a notice references by cac:PartyIdentification
+    and the roles those references give them, in one traversal. References
+    are (element, parent, role) with prefixed names; the parent, when given,
+    restricts elements that also occur in other contexts, such as cac:Party.
+    """
+
+    def __init__(self, references, namespaces=None):
+        self.references = tuple(references)
+        self.roles = {}
+        for tag, parent, role in self.references:
+            parent_tag = qualified_tag(parent, namespaces) if parent else None
+            self.roles.setdefault(qualified_tag(tag, namespaces), {})[parent_tag] = role
+        self.id_path = (
+            f"{qualified_tag('cac:PartyIdentification', namespaces)}/{qualified_tag('cbc:ID', namespaces)}"
+        )
+
+    def resolve(self, root):
+        """Returns the roles of every referenced organization id, in document order."""
+        party_roles = {}
+        for element in root.iter(*self.roles):
+            roles_by_parent = self.roles[element.tag]
+            role = roles_by_parent.get(None)
+            if role is None:
+                parent = element.getparent()
+                if parent is None:
+                    continue
+                role = roles_by_parent.get(parent.tag)
+                if role is None:
+                    continue
+            org_id = element.findtext(self.id_path)
+            if org_id:
+                roles = party_roles.setdefault(org_id, [])
+                if role not in roles:
+                    roles.append(role)
+        return party_roles
+
+
+class TreeWalker:
+    """
+    Walks a notice once and groups the elements the field handlers work on,
+    so that handlers no longer scan the whole tree from the root themselves.
+    Handlers without a declared scope get the notice root.
+    """
+
+    SCOPE_TAGS = {
+        "lot": f"{{{NSMAP['cac']}}}ProcurementProjectLot",
+        "lot_result": f"{{{NSMAP['efac']}}}LotResult",
+        "lot_tender": f"{{{NSMAP['efac']}}}LotTender",
+        "settled_contract": f"{{{NSMAP['efac']}}}SettledContract",
+        "organization": f"{{{NSMAP['efac']}}}Organization",
+    }
+    NOTICE_RESULT_TAG = f"{{{NSMAP['efac']}}}NoticeResult"
+    ID_TAG = f"{{{NSMAP['cbc']}}}ID"
+
+    def __init__(self, root):
+        self.root = root
+        self.scopes = {scope: [] for scope in self.SCOPE_TAGS}
+        self.scopes["notice"] = [root]
+        self.has_notice_result = False
+        self.walk()
+
+    def walk(self):
+        scope_by_tag = {tag: scope for scope, tag in self.SCOPE_TAGS.items()}
+        for element in self.root.iter(self.NOTICE_RESULT_TAG, *scope_by_tag):
+            if element.tag == self.NOTICE_RESULT_TAG:
+                self.has_notice_result = True
+                continue
+            scope = scope_by_tag[element.tag]
+            # LotTender and SettledContract are also used as ID references
+            # inside LotResult and SettledContract; only the elements
+            # directly under NoticeResult carry data.
+            if (
+                scope in ("lot_tender", "settled_contract")
+                and element.getparent().tag != self.NOTICE_RESULT_TAG
+            ):
+                continue
+            self.scopes[scope].append(element)
+
+    def elements(self, scope, scheme=None):
+        if scheme is None:
+            return self.scopes[scope]
+        key = (scope, scheme)
+        if key not in self.scopes:
+            self.scopes[key] = [
+                element
+                for element in self.scopes[scope]
+                if self.scheme_name(element) == scheme
+            ]
+        return self.scopes[key]
+
+    def scheme_name(self, element):
+        id_element = element.find(self.ID_TAG)
+        return id_element.get("schemeName") if id_element is not None else None
+
+    def dispatch(self, handlers, profiler=None):
+        """
+        Runs every handler over the elements of its scope. Handlers run one
+        after the other in the given order, so their side effects happen in
+        the same order as when each of them scanned the tree on its own.
+        With a profiler, the time, elements and exceptions of each handler
+        are recorded under its name.
+        """
+        for handler in handlers:
+            elements = self.elements(
+                getattr(handler, "scope", "notice"), getattr(handler, "scheme", None)
+            )
+            if profiler is not None:
+                start = time.perf_counter()
+            errors = 0
+            for element in elements:
+                try:
+                    handler(element)
+                except Exception as e:
+                    errors += 1
+                    logger.error("Error in %s: %s", handler.__name__, e)
+            if profiler is not None:
+                profiler.record(
+                    handler.__name__, "handler", time.perf_counter() - start,
+                    elements=len(elements), errors=errors,
+                )
+
+
+class IndexedList(list):
+    """
+    A list of OCDS objects that keeps a dict index by "id" next to the ordered
+    items. The first object appended with a given id wins, like a linear scan.
+    """
+
+    def __init__(self, items=()):
+        super().__init__()
+        self._index = {}
+        self.extend(items)
+
+    def _index_item(self, item):
+        if isinstance(item, (dict, Record)) and "id" in item:
+            self._index.setdefault(item["id"], item)
+
+    def _reindex(self):
+        self._index = {}
+        for item in self:
+            self._index_item(item)
+
+    def get(self, item_id, default=None):
+        return self._index.get(item_id, default)
+
+    def append(self, item):
+        super().append(item)
+        self._index_item(item)
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def insert(self, position, item):
+        super().insert(position, item)
+        self._reindex()
+
+    def __setitem__(self, position, item):
+        super().__setitem__(position, item)
+        self._reindex()
+
+    def __delitem__(self, position):
+        super().__delitem__(position)
+        self._reindex()
+
+    def remove(self, item):
+        super().remove(item)
+        self._reindex()
+
+    def pop(self, *args):
+        item = super().pop(*args)
+        self._reindex()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._index = {}
+
+    def __reduce__(self):
+        # Releases sent back from worker processes are pickled; rebuild the
+        # index from the items instead of extending a half-built instance.
+        return (self.__class__, (list(self),))
+
+
+def merge_roles(roles, new_roles):
+    """Adds new_roles to roles, keeping the first-seen order without duplicates."""
+    return list(dict.fromkeys(roles + new_roles))
+
+
+class IdFactory:
+    """
+    Mints the ids the notice does not provide itself (the release, documents,
+    amendments, ...). By default they are random uuid4s. With a seed, usually
+    the notice identifier, they are uuid5s of the seed, a label and the path
+    of the source element, so converting the same notice again gives the
+    same ids. Only the path of the notice element is kept, not the element,
+    so the factory does not hold the tree alive once it is released.
+    """
+
+    NAMESPACE = uuid.UUID("5b0e3c4a-8f6e-5d1c-9a43-2f7d6c1e0b9a")
+
+    def __init__(self, seed=None, root_path=""):
+        self.seed = seed
+        self.root_path = root_path
+        self.counts = {}
+
+    @classmethod
+    def for_notice(cls, parser):
+        root = parser.root
+        seed = "/".join(
+            filter(None, (parser.find_text(root, "./cbc:ID"), parser.find_text(root, "./cbc:VersionID")))
+        )
+        if not seed:
+            seed = hashlib.sha256(etree.tostring(root)).hexdigest()
+        return cls(seed, root.getroottree().getpath(root))
+
+    @property
+    def deterministic(self):
+        return self.seed is not None
+
+    def new_id(self, label, element=None):
+        if self.seed is None:
+            return str(uuid.uuid4())
+        path = ""
+        if element is not None:
+            # relative to the notice, which may sit inside a bulk export
+            path = element.getroottree().getpath(element)[len(self.root_path):]
+        name = f"{self.seed}/{label}{path}"
+        count = self.counts[name] = self.counts.get(name, 0) + 1
+        if count > 1:
+            name = f"{name}#{count}"
+        return str(uuid.uuid5(self.NAMESPACE, name))
+
+
+class ReleaseBuilder:
+    """
+    Holds the parties, lots, awards, contracts, documents and bids of the
+    release being built, with an id index next to each ordered list, and the
+    upsert/merge operations the field handlers use on them.
+    """
+
+    def __init__(self, ids=None):
+        self.ids = ids or IdFactory()
+        self.parties = IndexedList()
+        self.lots = IndexedList()
+        self.awards = IndexedList()
+        self.documents = IndexedList()
+        self.bids = IndexedList()
+        # Contracts by id; join_results() links them to their awards.
+        self.contracts = {}
+
+    def party(self, org_id, roles=None):
+        organization = self.parties.get(org_id)
+        if organization is not None:
+            if roles:
+                organization["roles"] = merge_roles(organization.get("roles", []), roles)
+            return organization
+        organization = Party(id=org_id, roles=roles if roles else [])
+        self.parties.append(organization)
+        return organization
+
+    def upsert(self, items, new_item, merge):
+        """
+        Appends new_item to items, or merges it into the item with the same id
+        with merge(existing, new_item). Plain lists are scanned.
+        """
+        if isinstance(items, IndexedList):
+            existing = items.get(new_item["id"])
+        else:
+            existing = next(
+                (item for item in items if item["id"] == new_item["id"]), None
+            )
+        if existing is None:
+            items.append(new_item)
+            return new_item
+        merge(existing, new_item)
+        return existing
+
+    def award(self, award_id):
+        return self.awards.get(award_id)
+
+    def replace_award(self, new_award):
+        new_award = Award.of(new_award)
+        existing = self.awards.get(new_award["id"])
+        if existing is None:
+            self.awards.append(new_award)
+        else:
+            position = next(
+                i for i, award in enumerate(self.awards) if award is existing
+            )
+            self.awards[position] = new_award
+
+    def bid(self, bid_id, create=True):
+        bid = self.bids.get(bid_id)
+        if bid is None and create:
+            bid = Bid(id=bid_id)
+            self.bids.append(bid)
+        return bid
+
+    def contract(self, contract_id):
+        return self.contracts.get(contract_id)
+
+    def add_contract(self, contract):
+        contract = Contract.of(contract)
+        # A later contract with the same id replaces the earlier one in the
+        # release, keeping the position of the first.
+        self.contracts[contract["id"]] = contract
+        return contract
+
+    def all_contracts(self):
+        return list(self.contracts.values())
 
 
 class TEDtoOCDSConverter:
     EU_ORG_ID = "ORG-EU"
+    form_type_mapping = FORM_TYPES
 
-
-    def __init__(self, parser):
+    def __init__(self, parser=None, profiler=None, deterministic_ids=False, lean=False):
+        """
+        A converter can be kept for the life of a worker process and reused
+        for every notice through reset(); the parser can then be omitted here.
+        With deterministic_ids, the ids the converter mints are derived from
+        the notice identifier and the element path instead of being random.
+        With lean, the parser's tree is dropped as soon as everything has been
+        extracted from it, and the converter keeps nothing of the notice once
+        the release is returned.
+        """
+        self.profiler = profiler
+        self.deterministic_ids = deterministic_ids
+        self.lean = lean
+        self.reset(parser)
+        logger.info("TEDtoOCDSConverter initialized with mapping.")
+
+    def reset(self, parser):
+        """Starts a new notice: attaches the parser and drops the previous release."""
         self.parser = parser
-        self.form_type_mapping = {
-            "planning": {"tag": ["tender"], "tender_status": "planned"},
-            "competition": {"tag": ["tender"], "tender_status": "active"},
-            "change": {"tag": ["tenderUpdate"], "tender_status": None},
-            "result": {"tag": ["award", "contract"], "tender_status": "complete"},
-            "dir-awa-pre": {"tag": ["award", "contract"], "tender_status": "complete"},
-            "cont-modif": {
-                "tag": ["awardUpdate", "contractUpdate"],
-                "tender_status": None,
-            },
+        deterministic = self.deterministic_ids and parser is not None
+        self.release = ReleaseBuilder(IdFactory.for_notice(parser) if deterministic else None)
+        self.awards = self.release.awards
+        self.parties = self.release.parties
+        self.tender = {
+            "lots": self.release.lots,
+            "bids": {"statistics": [], "details": self.release.bids},
+            "lotGroups": [],
+            "documents": self.release.documents,
         }
-        self.awards = []
-        self.parties = []
-        self.tender = {"lots": [], "bids": {"statistics": []}, "lotGroups": []}
         self.budget_finances = []
-        logging.info("TEDtoOCDSConverter initialized with mapping.")
+        return self
+
+    # Notice types that never carry results, and what marks a handler as part
+    # of the result pipeline: its walk scope or the release sections it uses.
+    RESULT_FREE_FORM_TYPES = frozenset({"planning", "competition"})
+    RESULT_SCOPES = frozenset({"lot_result", "lot_tender", "settled_contract"})
+    RESULT_SECTIONS = frozenset({"awards", "contracts", "bids"})
+
+    # Field handlers dispatched by convert_tender_to_ocds, each declaring its
+    # scope and release sections with @handles. handler_plan() orders them.
+    HANDLERS = (
+        "map_notice_fields",
+        "fetch_bt710_bt711_bid_statistics",
+        "fetch_bt712_complaints_statistics",
+        "fetch_bt09_cross_border_law",
+        "fetch_bt111_lot_buyer_categories",
+        "fetch_bt766_dynamic_purchasing_system_lot",
+        "fetch_bt766_dynamic_purchasing_system_part",
+        "fetch_bt775_social_procurement",
+        "fetch_bt06_lot_strategic_procurement",
+        "fetch_award_criteria",
+        "handle_bt14_and_bt707",
+        "fetch_opp_050_buyers_group_lead",
+        "fetch_opt_300_contract_signatory",
+        "fetch_opt_301_tenderer_maincont",
+        "fetch_lot_tender",
+        "fetch_bt3202_contract_tender_reference",
+        "fetch_bt47_participants",
+        "fetch_bt5010_lot_financing",
+        "fetch_bt5011_contract_financing",
+        "fetch_bt508_buyer_profile",
+        "fetch_bt60_lot_funding",
+        "fetch_bt610_activity_entity",
+        "fetch_bt740_contracting_entity",
+        "fetch_opp_051_awarding_cpb_buyer",
+        "fetch_opp_052_acquiring_cpb_buyer",
+        "fetch_opt_030_service_type",
+        "fetch_opt_170_tender_leader",
+        "fetch_party_roles",
+        "fetch_opt_301_lot_employ_legis",
+        "fetch_opt_301_lot_environ_legis",
+        "fetch_opt_301_lotresult_financing",
+        "fetch_opt_322_lotresult_technical_identifier",
+        "fetch_bt144_not_awarded_reason",
+        "fetch_bt1451_winner_decision_date",
+        "fetch_bt163_concession_value_description",
+        "fetch_bt660_framework_re_estimated_value",
+        "fetch_bt709_framework_maximum_value",
+        "fetch_bt720_tender_value",
+        "fetch_bt735_cvd_contract_type",
+        "fetch_bt145_contract_conclusion_date",
+        "fetch_bt150_contract_identifier",
+        "fetch_opp_080_public_transport_distance",
+        "fetch_opt_301_part_employ_legis",
+        "fetch_bt142_winner_chosen",
+        "fetch_bt13713_lotresult",
+        "fetch_opt_320_lotresult_tender_reference",
+        "map_lot_fields",
+        "fetch_bt67a_exclusion_grounds",
+        "fetch_bt760_lot_result_received_submissions",
+        "fetch_bt769_multiple_tenders",
+        "fetch_bt762_change_reason_description",
+        "fetch_bt125i_previous_planning_identifier",
+        "fetch_organization",
+    )
+
+    # Simple fields that map one value to one OCDS path, filled for every
+    # scope element by map_notice_fields and map_lot_fields.
+    FIELD_MAPPINGS = FieldMappingPlan(
+        (
+            FieldMapping(
+                "BT-31",
+                ".//cac:TenderingTerms/cac:LotDistribution/cbc:MaximumLotsSubmittedNumeric",
+                "lotDetails.maximumLotsBidPerSupplier",
+                int,
+            ),
+            FieldMapping(
+                "BT-33",
+                ".//cac:TenderingTerms/cac:LotDistribution/cbc:MaximumLotsAwardedNumeric",
+                "lotDetails.maximumLotsAwardedPerSupplier",
+                int,
+            ),
+            FieldMapping(
+                "BT-88",
+                ".//cac:TenderingProcess/cbc:Description",
+                "procurementMethodDetails",
+            ),
+            FieldMapping(
+                "BT-63",
+                "./cac:TenderingTerms/cbc:VariantConstraintCode[@listName='permission']",
+                "submissionTerms.variantPolicy",
+                scope="lot",
+                scheme="Lot",
+            ),
+            FieldMapping(
+                "BT-661",
+                "./cac:TenderingProcess/cac:EconomicOperatorShortList/cbc:LimitationDescription",
+                "secondStage.maximumCandidates",
+                true_flag,
+                scope="lot",
+                scheme="Lot",
+            ),
+            FieldMapping(
+                "BT-76",
+                "./cac:TenderingTerms/cac:TendererQualificationRequest"
+                "[not(cac:SpecificTendererRequirement)]/cbc:CompanyLegalForm",
+                "contractTerms.tendererLegalForm",
+                scope="lot",
+                scheme="Lot",
+            ),
+        )
+    )
+
+    # OPT-300 and OPT-301 organization references outside the results,
+    # applied by fetch_party_roles.
+    PARTY_ROLES = PartyRoleResolver(
+        (
+            ("cac:Party", "cac:ContractingParty", "buyer"),
+            ("cac:MediationParty", None, "mediationBody"),
+            ("cac:AppealReceiverParty", None, "reviewBody"),
+            ("cac:AppealInformationParty", None, "reviewContactPoint"),
+            ("cac:TenderEvaluationParty", None, "evaluationBody"),
+            ("cac:TenderRecipientParty", None, "submissionReceiptBody"),
+            ("cac:AdditionalInformationParty", None, "processContactPoint"),
+            ("cac:DocumentProviderParty", None, "processContactPoint"),
+            ("cac:IssuerParty", "cac:EmploymentLegislationDocumentReference", "informationService"),
+            ("cac:IssuerParty", "cac:EnvironmentalLegislationDocumentReference", "informationService"),
+        )
+    )
+
+    @classmethod
+    def is_result_handler(cls, handler):
+        return (
+            getattr(handler, "scope", "notice") in cls.RESULT_SCOPES
+            or bool((handler.reads | handler.writes) & cls.RESULT_SECTIONS)
+        )
+
+    @classmethod
+    def handler_plan(cls, with_results=True):
+        """
+        Returns the HANDLERS names in dispatch order, planned once per class.
+        Without results, the result pipeline (awards, contracts, bids and the
+        NoticeResult elements) is left out.
+        """
+        if "_handler_plans" not in cls.__dict__:
+            cls._handler_plans = {}
+        if with_results not in cls._handler_plans:
+            handlers = [getattr(cls, name) for name in cls.HANDLERS]
+            if not with_results:
+                handlers = [handler for handler in handlers if not cls.is_result_handler(handler)]
+            cls._handler_plans[with_results] = tuple(
+                handler.__name__ for handler in plan_handlers(handlers)
+            )
+        return cls._handler_plans[with_results]
+
+    def phase(self, name):
+        """Times a conversion phase when the converter has a profiler."""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.phase(name)
+
+    @handles(writes=("parties",))
+    def fetch_party_roles(self, root_element):
+        """Adds the roles of PARTY_ROLES to the referenced organizations."""
+        for org_id, roles in self.PARTY_ROLES.resolve(root_element).items():
+            self.release.party(org_id, roles)
+
+    @handles(writes=("tender",))
+    def map_notice_fields(self, root_element):
+        """
+        Fills the simple tender fields of FIELD_MAPPINGS (BT-31, BT-33, BT-88),
+        then BT-763, which only sets the maximum lots per tenderer when BT-31
+        does not give it.
+        """
+        for key, value in self.FIELD_MAPPINGS.extract(root_element).items():
+            if isinstance(value, dict):
+                self.tender.setdefault(key, {}).update(value)
+            else:
+                self.tender[key] = value
+        self.fetch_bt763_lots_all_required(root_element)
 
-    def fetch_bt710_bt711_bid_statistics(self, root_element):
-        notice_results = root_element.xpath(
-            ".//efac:NoticeResult", namespaces=self.parser.nsmap
+    @handles("lot", scheme="Lot", writes=("lots",))
+    def map_lot_fields(self, lot):
+        """Fills the simple lot fields of FIELD_MAPPINGS (BT-63, BT-661, BT-76)."""
+        lot_info = self.FIELD_MAPPINGS.extract(lot, "lot", "Lot")
+        if lot_info:
+            lot_info["id"] = self.parser.find_text(lot, "./cbc:ID", namespaces=self.parser.nsmap)
+            self.add_or_update_lot(self.tender["lots"], lot_info)
+
+    @handles("lot_result", writes=("bids",))
+    def fetch_bt710_bt711_bid_statistics(self, lot_result):
+        statistics = self.tender["bids"]["statistics"]
+        lot_id = self.parser.find_text(
+            lot_result, "./efac:TenderLot/cbc:ID", namespaces=self.parser.nsmap
         )
-        stat_id = 1
 
-        for notice_result in notice_results:
-            lot_results = notice_result.xpath(
-                ".//efac:LotResult", namespaces=self.parser.nsmap
+        lower_tender_amount = self.parser.find_text(
+            lot_result, "./cbc:LowerTenderAmount", namespaces=self.parser.nsmap
+        )
+        lower_tender_currency = self.parser.find_attribute(
+            lot_result, "./cbc:LowerTenderAmount", "currencyID"
+        )
+        if lower_tender_amount and lower_tender_currency:
+            statistics.append(
+                {
+                    "id": str(len(statistics) + 1),
+                    "measure": "lowestValidBidValue",
+                    "value": float(lower_tender_amount),
+                    "currency": lower_tender_currency,
+                    "relatedLot": lot_id,
+                }
             )
-            for lot_result in lot_results:
-                lot_id = self.parser.find_text(
-                    lot_result, "./efac:TenderLot/cbc:ID", namespaces=self.parser.nsmap
-                )
-
-                lower_tender_amount = self.parser.find_text(
-                    lot_result, "./cbc:LowerTenderAmount", namespaces=self.parser.nsmap
-                )
-                lower_tender_currency = self.parser.find_attribute(
-                    lot_result, "./cbc:LowerTenderAmount", "currencyID"
-                )
-                if lower_tender_amount and lower_tender_currency:
-                    self.tender["bids"]["statistics"].append(
-                        {
-                            "id": str(stat_id),
-                            "measure": "lowestValidBidValue",
-                            "value": float(lower_tender_amount),
-                            "currency": lower_tender_currency,
-                            "relatedLot": lot_id,
-                        }
-                    )
-                    stat_id += 1
 
-                higher_tender_amount = self.parser.find_text(
-                    lot_result, "./cbc:HigherTenderAmount", namespaces=self.parser.nsmap
-                )
-                higher_tender_currency = self.parser.find_attribute(
-                    lot_result, "./cbc:HigherTenderAmount", "currencyID"
-                )
-                if higher_tender_amount and higher_tender_currency:
-                    self.tender["bids"]["statistics"].append(
-                        {
-                            "id": str(stat_id),
-                            "measure": "highestValidBidValue",
-                            "value": float(higher_tender_amount),
-                            "currency": higher_tender_currency,
-                            "relatedLot": lot_id,
-                        }
-                    )
-                    stat_id += 1
+        higher_tender_amount = self.parser.find_text(
+            lot_result, "./cbc:HigherTenderAmount", namespaces=self.parser.nsmap
+        )
+        higher_tender_currency = self.parser.find_attribute(
+            lot_result, "./cbc:HigherTenderAmount", "currencyID"
+        )
+        if higher_tender_amount and higher_tender_currency:
+            statistics.append(
+                {
+                    "id": str(len(statistics) + 1),
+                    "measure": "highestValidBidValue",
+                    "value": float(higher_tender_amount),
+                    "currency": higher_tender_currency,
+                    "relatedLot": lot_id,
+                }
+            )
 
+    @handles(writes=("tender",))
     def fetch_bt09_cross_border_law(self, root_element):
         cross_border_docs = root_element.xpath(
             ".//cac:TenderingTerms/cac:ProcurementLegislationDocumentReference[cbc:ID='CrossBorderLaw']",
@@ -142,86 +1039,69 @@ class TEDtoOCDSConverter:
             if law_description:
                 self.tender["crossBorderLaw"] = law_description
 
-    def fetch_bt111_lot_buyer_categories(self, root_element):
-        lots = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
+    @handles("lot", scheme="Lot", reads=("lots",))
+    def fetch_bt111_lot_buyer_categories(self, lot):
+        lot_id = self.parser.find_text(
+            lot, "./cbc:ID", namespaces=self.parser.nsmap
+        )
+        subsequent_req = lot.xpath(
+            ".//cac:FrameworkAgreement/cac:SubsequentProcessTenderRequirement[cbc:Name='buyer-categories']/cbc:Description",
             namespaces=self.parser.nsmap,
         )
-        for lot in lots:
-            lot_id = self.parser.find_text(
-                lot, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            subsequent_req = lot.xpath(
-                ".//cac:FrameworkAgreement/cac:SubsequentProcessTenderRequirement[cbc:Name='buyer-categories']/cbc:Description",
-                namespaces=self.parser.nsmap,
-            )
-            description = subsequent_req[0].text if subsequent_req else None
-            if description:
-                for lot_info in self.tender.get("lots", []):
-                    if lot_info["id"] == lot_id:
-                        lot_info.setdefault("techniques", {}).setdefault(
-                            "frameworkAgreement", {}
-                        )["buyerCategories"] = description
-
-    def fetch_bt766_dynamic_purchasing_system_lot(self, root_element):
-        lots = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
+        description = subsequent_req[0].text if subsequent_req else None
+        if description:
+            for lot_info in self.tender.get("lots", []):
+                if lot_info["id"] == lot_id:
+                    lot_info.setdefault("techniques", {}).setdefault(
+                        "frameworkAgreement", {}
+                    )["buyerCategories"] = description
+
+    @handles("lot", scheme="Lot", writes=("lots",))
+    def fetch_bt766_dynamic_purchasing_system_lot(self, lot):
+        lot_id = self.parser.find_text(
+            lot, "./cbc:ID", namespaces=self.parser.nsmap
+        )
+        dps_code = self.parser.find_text(
+            lot,
+            "./cac:TenderingProcess/cac:ContractingSystem/cbc:ContractingSystemTypeCode[@listName='dps-usage']",
             namespaces=self.parser.nsmap,
         )
-        for lot in lots:
-            lot_id = self.parser.find_text(
-                lot, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            dps_code = self.parser.find_text(
-                lot,
-                "./cac:TenderingProcess/cac:ContractingSystem/cbc:ContractingSystemTypeCode[@listName='dps-usage']",
-                namespaces=self.parser.nsmap,
-            )
-            if dps_code and dps_code.lower() != "none":
-                lot_info = {
-                    "id": lot_id,
-                    "techniques": {
-                        "hasDynamicPurchasingSystem": True,
-                        "dynamicPurchasingSystem": {
-                            "type": self.map_dps_code(dps_code)
-                        },
+        if dps_code and dps_code.lower() != "none":
+            lot_info = {
+                "id": lot_id,
+                "techniques": {
+                    "hasDynamicPurchasingSystem": True,
+                    "dynamicPurchasingSystem": {
+                        "type": self.map_dps_code(dps_code)
                     },
-                }
-                self.add_or_update_lot(self.tender["lots"], lot_info)
+                },
+            }
+            self.add_or_update_lot(self.tender["lots"], lot_info)
 
     def map_dps_code(self, code):
-        mapping = {
-            "dps-nlist": "closed",
-            "dps-openall": "open",
-        }
-        return mapping.get(code, code)
+        return DPS_TYPES.get(code, code)
 
-    def fetch_bt766_dynamic_purchasing_system_part(self, root_element):
-        parts = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']",
+    @handles("lot", scheme="Part", writes=("tender",))
+    def fetch_bt766_dynamic_purchasing_system_part(self, part):
+        dps_code = self.parser.find_text(
+            part,
+            "./cac:TenderingProcess/cac:ContractingSystem/cbc:ContractingSystemTypeCode[@listName='dps-usage']",
             namespaces=self.parser.nsmap,
         )
-        for part in parts:
-            dps_code = self.parser.find_text(
-                part,
-                "./cac:TenderingProcess/cac:ContractingSystem/cbc:ContractingSystemTypeCode[@listName='dps-usage']",
-                namespaces=self.parser.nsmap,
+        if dps_code and dps_code.lower() != "none":
+            self.tender.setdefault("techniques", {}).update(
+                {
+                    "hasDynamicPurchasingSystem": True,
+                    "dynamicPurchasingSystem": {
+                        "type": self.map_dps_code(dps_code)
+                    },
+                }
             )
-            if dps_code and dps_code.lower() != "none":
-                self.tender.setdefault("techniques", {}).update(
-                    {
-                        "hasDynamicPurchasingSystem": True,
-                        "dynamicPurchasingSystem": {
-                            "type": self.map_dps_code(dps_code)
-                        },
-                    }
-                )
 
-    def fetch_opt_300_contract_signatory(self, root_element):
-        logger.info("Fetching OPT-300 Contract Signatory Identifier Reference")
-        signatory_parties = root_element.findall(
-            ".//efac:NoticeResult/efac:SettledContract/cac:SignatoryParty",
-            namespaces=self.parser.nsmap,
+    @handles("settled_contract", reads=("contracts",), writes=("parties",))
+    def fetch_opt_300_contract_signatory(self, contract):
+        signatory_parties = contract.findall(
+            "./cac:SignatoryParty", namespaces=self.parser.nsmap
         )
         for signatory_party in signatory_parties:
             signatory_id = self.parser.find_text(
@@ -231,206 +1111,130 @@ class TEDtoOCDSConverter:
             )
             if signatory_id:
                 org = self.get_or_create_organization(self.parties, signatory_id, roles=["buyer"])
-                org_name = self.parser.find_text(
-                    root_element,
-                    f".//efac:Organization[efac:Company/cac:PartyIdentification/cbc:ID='{signatory_id}']/efac:Company/cac:PartyName/cbc:Name",
-                    namespaces=self.parser.nsmap,
-                )
+                org_name = self.parser.index.organization_name(signatory_id)
                 if org_name:
                     org["name"] = org_name
-                contract_id = self.parser.find_text(
-                    signatory_party, "./../../cbc:ID", namespaces=self.parser.nsmap
-                )
-                for award in self.awards:
-                    if contract_id in [c["id"] for c in award.get("contracts", [])]:
-                        award.setdefault("buyers", []).append({"id": signatory_id})
 
-    def fetch_bt712_complaints_statistics(self, root_element):
-        notice_results = root_element.xpath(
-            ".//efac:NoticeResult", namespaces=self.parser.nsmap
+    @handles("lot_result", writes=("bids",))
+    def fetch_bt712_complaints_statistics(self, lot_result):
+        statistics = self.tender["bids"]["statistics"]
+        lot_id = self.parser.find_text(
+            lot_result, "./efac:TenderLot/cbc:ID", namespaces=self.parser.nsmap
         )
-        stat_id = len(self.tender["bids"]["statistics"]) + 1
-
-        for notice_result in notice_results:
-            lot_results = notice_result.xpath(
-                ".//efac:LotResult", namespaces=self.parser.nsmap
-            )
-            for lot_result in lot_results:
-                lot_id = self.parser.find_text(
-                    lot_result, "./efac:TenderLot/cbc:ID", namespaces=self.parser.nsmap
-                )
-
-                appeal_stats = lot_result.xpath(
-                    ".//efac:AppealRequestsStatistics", namespaces=self.parser.nsmap
-                )
-                for stats in appeal_stats:
-                    stats_code = self.parser.find_text(
-                        stats, "./efbc:StatisticsCode", namespaces=self.parser.nsmap
-                    )
-                    stats_number = self.parser.find_text(
-                        stats, "./efbc:StatisticsNumeric", namespaces=self.parser.nsmap
-                    )
-
-                    if stats_code == "complainants" and stats_number:
-                        self.tender["bids"]["statistics"].append(
-                            {
-                                "id": str(stat_id),
-                                "measure": "complainants",
-                                "value": int(stats_number),
-                                "relatedLot": lot_id,
-                            }
-                        )
-                        stat_id += 1
 
-    def fetch_bt31_max_lots_submitted(self, root_element):
-        """
-        Fetches BT-31: The maximum number of lots for which one tenderer can submit tenders
-        and maps to tender.lotDetails.maximumLotsBidPerSupplier.
-        """
-        max_lots_submitted = self.parser.find_text(
-            root_element,
-            ".//cac:TenderingTerms/cac:LotDistribution/cbc:MaximumLotsSubmittedNumeric",
-            namespaces=self.parser.nsmap,
+        appeal_stats = lot_result.xpath(
+            ".//efac:AppealRequestsStatistics", namespaces=self.parser.nsmap
         )
-        if max_lots_submitted:
-            self.tender.setdefault("lotDetails", {})["maximumLotsBidPerSupplier"] = int(
-                max_lots_submitted
+        for stats in appeal_stats:
+            stats_code = self.parser.find_text(
+                stats, "./efbc:StatisticsCode", namespaces=self.parser.nsmap
+            )
+            stats_number = self.parser.find_text(
+                stats, "./efbc:StatisticsNumeric", namespaces=self.parser.nsmap
             )
-            logging.info(f"Extracted Maximum Lots Submitted: {max_lots_submitted}")
-        else:
-            logging.warning("Maximum Lots Submitted information not found.")
 
-    def fetch_bt33_max_lots_awarded(self, root_element):
-        """
-        Fetches BT-33: The maximum number of lots for which contract(s) can be awarded to one tenderer
-        and maps to tender.lotDetails.maximumLotsAwardedPerSupplier.
-        """
-        max_lots_awarded = self.parser.find_text(
-            root_element,
-            ".//cac:TenderingTerms/cac:LotDistribution/cbc:MaximumLotsAwardedNumeric",
-            namespaces=self.parser.nsmap,
-        )
-        if max_lots_awarded:
-            self.tender.setdefault("lotDetails", {})[
-                "maximumLotsAwardedPerSupplier"
-            ] = int(max_lots_awarded)
-            logging.info(f"Extracted Maximum Lots Awarded: {max_lots_awarded}")
-        else:
-            logging.warning("Maximum Lots Awarded information not found.")
+            if stats_code == "complainants" and stats_number:
+                statistics.append(
+                    {
+                        "id": str(len(statistics) + 1),
+                        "measure": "complainants",
+                        "value": int(stats_number),
+                        "relatedLot": lot_id,
+                    }
+                )
 
     def fetch_bt763_lots_all_required(self, root_element):
         """
         Fetches BT-763: The tenderer must submit tenders for all lots.
-        and sets tender.lotDetails.maximumLotsBidPerSupplier to float('inf') if value is 'all'.
+        When the value is 'all' and BT-31 gave no maximum, sets
+        tender.lotDetails.maximumLotsBidPerSupplier to the number of lots.
         """
         part_presentation_code = self.parser.find_text(
             root_element,
             ".//cac:TenderingProcess/cbc:PartPresentationCode[@listName='tenderlot-presentation']",
             namespaces=self.parser.nsmap,
         )
-        if part_presentation_code == "all":
-            self.tender.setdefault("lotDetails", {})["maximumLotsBidPerSupplier"] = (
-                float("inf")
-            )
-            logging.info("Set Maximum Lots Bid Per Supplier to all lots (infinity).")
-        else:
-            logging.warning("Part Presentation Code indicating all lots not found.")
-
-    def fetch_bt5010_lot_financing(self, root_element):
-        logger.info("Fetching BT-5010 Lot EU Funds Financing Identifier")
-        lots = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
+        if part_presentation_code != "all":
+            return
+        lot_count = sum(
+            1
+            for lot in self.parser.index.lots.values()
+            if lot.find("cbc:ID", self.parser.nsmap).get("schemeName") == "Lot"
+        )
+        if lot_count:
+            self.tender.setdefault("lotDetails", {}).setdefault(
+                "maximumLotsBidPerSupplier", lot_count
+            )
+
+    @handles("lot", scheme="Lot", reads=("parties",))
+    def fetch_bt5010_lot_financing(self, lot):
+        lot_id = self.parser.find_text(lot, "./cbc:ID")
+        financings = lot.xpath(
+            ".//efac:Funding/efbc:FinancingIdentifier", namespaces=self.parser.nsmap
+        )
+        for financing in financings:
+            financing_id = financing.text
+            self.update_eu_funder(financing_id, lot_id)
+
+    @handles("settled_contract", reads=("parties", "awards"))
+    def fetch_bt5011_contract_financing(self, contract):
+        contract_id = self.parser.find_text(
+            contract, "./cbc:ID", namespaces=self.parser.nsmap
+        )
+        financings = contract.findall(
+            ".//efac:Funding/efbc:FinancingIdentifier", namespaces=self.parser.nsmap
+        )
+        for financing in financings:
+            financing_id = financing.text
+            self.update_eu_funder(financing_id, contract_id, level="contract")
+
+    @handles("lot_tender", reads=("awards",), writes=("contracts",))
+    def fetch_opp_080_public_transport_distance(self, lot_tender):
+        tender_id = self.parser.find_text(
+            lot_tender, "./cbc:ID", namespaces=self.parser.nsmap
+        )
+        distance = self.parser.find_text(
+            lot_tender,
+            "./efbc:PublicTransportationCumulatedDistance",
             namespaces=self.parser.nsmap,
         )
-        for lot in lots:
-            lot_id = self.parser.find_text(lot, "./cbc:ID")
-            financings = lot.xpath(
-                ".//efac:Funding/efbc:FinancingIdentifier", namespaces=self.parser.nsmap
-            )
-            for financing in financings:
-                financing_id = financing.text
-                self.update_eu_funder(financing_id, lot_id)
-
-    def fetch_bt5011_contract_financing(self, root_element):
-        logger.info("Fetching BT-5011 Contract EU Funds Financing Identifier")
-        settled_contracts = root_element.findall(
-            ".//efac:NoticeResult/efac:SettledContract", namespaces=self.parser.nsmap
-        )
-        for contract in settled_contracts:
-            contract_id = self.parser.find_text(
-                contract, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            financings = contract.findall(
-                ".//efac:Funding/efbc:FinancingIdentifier", namespaces=self.parser.nsmap
-            )
-            for financing in financings:
-                financing_id = financing.text
-                self.update_eu_funder(financing_id, contract_id, level="contract")
-
-    def fetch_opp_080_public_transport_distance(self, root_element):
-        notice_results = root_element.findall(
-            ".//efac:NoticeResult", namespaces=self.parser.nsmap
-        )
-        for notice_result in notice_results:
-            lot_tenders = notice_result.findall(
-                ".//efac:LotTender", namespaces=self.parser.nsmap
+        if tender_id and distance:
+            settled_contracts = self.parser.index.settled_contracts_by_tender.get(
+                tender_id
             )
-            for lot_tender in lot_tenders:
-                tender_id = self.parser.find_text(
-                    lot_tender, "./cbc:ID", namespaces=self.parser.nsmap
-                )
-                distance = self.parser.find_text(
-                    lot_tender,
-                    "./efbc:PublicTransportationCumulatedDistance",
-                    namespaces=self.parser.nsmap,
+            if settled_contracts:
+                settled_contract = settled_contracts[0]
+                contract_id = self.parser.find_text(
+                    settled_contract, "./cbc:ID", namespaces=self.parser.nsmap
                 )
-                if tender_id and distance:
-                    settled_contract = notice_result.find(
-                        f".//efac:SettledContract/efac:LotTender[cbc:ID='{tender_id}']/..",
-                        namespaces=self.parser.nsmap,
-                    )
-                    if settled_contract is not None:
-                        contract_id = self.parser.find_text(
-                            settled_contract, "./cbc:ID", namespaces=self.parser.nsmap
-                        )
-                        self.add_or_update_contract(
-                            contract_id,
-                            {
-                                "publicPassengerTransportServicesKilometers": int(
-                                    distance
-                                )
-                            },
+                self.add_or_update_contract(
+                    contract_id,
+                    {
+                        "publicPassengerTransportServicesKilometers": int(
+                            distance
                         )
+                    },
+                )
 
-    def fetch_bt60_lot_funding(self, root_element):
-        logger.info("Fetching BT-60 Lot EU Funds")
-        lots = root_element.findall(
-            ".//cac:ProcurementProjectLot", namespaces=self.parser.nsmap
+    @handles("lot", reads=("parties", "awards"))
+    def fetch_bt60_lot_funding(self, lot):
+        funding_program_code = self.parser.find_text(
+            lot,
+            ".//cbc:FundingProgramCode[@listName='eu-funded']",
+            namespaces=self.parser.nsmap,
         )
-        for lot in lots:
-            funding_program_code = self.parser.find_text(
-                lot,
-                ".//cbc:FundingProgramCode[@listName='eu-funded']",
-                namespaces=self.parser.nsmap,
-            )
-            if funding_program_code:
-                self.update_eu_funder("EU-funds")
+        if funding_program_code:
+            self.update_eu_funder("EU-funds")
 
-    def fetch_opt_301_lotresult_financing(self, root_element):
-        logger.info(
-            "Fetching OPT-301 LotResult Financing Party (ID reference)"
-        )
-        lot_results = root_element.findall(
-            ".//efac:LotResult", namespaces=self.parser.nsmap
+    @handles("lot_result", writes=("parties",))
+    def fetch_opt_301_lotresult_financing(self, lot_result):
+        financing_party_id = self.parser.find_text(
+            lot_result,
+            ".//cac:FinancingParty/cac:PartyIdentification/cbc:ID",
+            namespaces=self.parser.nsmap,
         )
-        for lot_result in lot_results:
-            financing_party_id = self.parser.find_text(
-                lot_result,
-                ".//cac:FinancingParty/cac:PartyIdentification/cbc:ID",
-                namespaces=self.parser.nsmap,
-            )
-            if financing_party_id:
-                self.update_funder_role(financing_party_id)
+        if financing_party_id:
+            self.update_funder_role(financing_party_id)
 
     def update_eu_funder(self, financing_id=None, related_id=None, level="lot"):
         eu_funder = next(
@@ -449,20 +1253,19 @@ class TEDtoOCDSConverter:
                 }
             )
         elif level == "contract" and related_id:
-            for award in self.awards:
-                if award["id"] == related_id:
-                    if "finance" not in award:
-                        award["finance"] = []
-                    award["finance"].append(
-                        {
-                            "id": financing_id or "EU-funded",
-                            "financingParty": {
-                                "id": eu_funder["id"],
-                                "name": eu_funder["name"],
-                            },
-                        }
-                    )
-                    break
+            award = self.release.award(related_id)
+            if award is not None:
+                if "finance" not in award:
+                    award["finance"] = []
+                award["finance"].append(
+                    {
+                        "id": financing_id or "EU-funded",
+                        "financingParty": {
+                            "id": eu_funder["id"],
+                            "name": eu_funder["name"],
+                        },
+                    }
+                )
         else:
             for award in self.awards:
                 if related_id in award.get("relatedLots", []):
@@ -487,157 +1290,27 @@ class TEDtoOCDSConverter:
         if "funder" not in funder["roles"]:
             funder["roles"].append("funder")
 
-    def fetch_bt3202_to_ocds(self, root_element):
-        # Ensure the 'bids' dictionary and 'details' list are initialized
-        if "bids" not in self.tender:
-            self.tender["bids"] = {}
-        if "details" not in self.tender["bids"]:
-            self.tender["bids"]["details"] = []
+    def fetch_bt500_organization_names(self, root_element):
+        """
+        Fetch names of organizations (BT-500) and update the organization part names (BT-16).
+        """
 
-        notice_results = root_element.xpath(
-            ".//efac:NoticeResult", namespaces=self.parser.nsmap
+        # BT-500-Organization-Company
+        companies = root_element.findall(
+            ".//efac:Organization/efac:Company", namespaces=self.parser.nsmap
         )
-
-        for notice_result in notice_results:
-            lot_tenders = self.parser.find_nodes(notice_result, ".//efac:LotTender")
-            for lot_tender in lot_tenders:
-                tender_id = self.parser.find_text(lot_tender, "cbc:ID")
-                lot_id = self.parser.find_text(lot_tender, "efac:TenderLot/cbc:ID")
-
-                bid = next(
-                    (
-                        bid
-                        for bid in self.tender["bids"]["details"]
-                        if bid["id"] == tender_id
-                    ),
-                    None,
+        for company in companies:
+            org_id = self.parser.find_text(
+                company, "./cac:PartyIdentification/cbc:ID[@schemeName='organization']"
+            )
+            if org_id:
+                organization = self.get_or_create_organization(self.parties, org_id)
+                org_name = self.parser.find_text(company, "./cac:PartyName/cbc:Name")
+                department = self.parser.find_text(
+                    company, "./cac:PostalAddress/cbc:Department"
                 )
-                if not bid:
-                    bid = {"id": tender_id, "relatedLots": [lot_id]}
-                    self.tender["bids"]["details"].append(bid)
-                else:
-                    if "relatedLots" not in bid:
-                        bid["relatedLots"] = []
-                    if lot_id not in bid["relatedLots"]:
-                        bid["relatedLots"].append(lot_id)
-
-                rank_code = self.parser.find_text(lot_tender, "cbc:RankCode")
-                if rank_code:
-                    bid["rank"] = int(rank_code)
-
-                tender_ranked_indicator = self.parser.find_text(
-                    lot_tender, "efbc:TenderRankedIndicator"
-                )
-                if tender_ranked_indicator:
-                    bid["hasRank"] = tender_ranked_indicator.lower() == "true"
-
-                origins = self.parser.find_nodes(
-                    lot_tender, "efac:Origin/efbc:AreaCode"
-                )
-                if origins:
-                    bid["countriesOfOrigin"] = []
-                    for origin in origins:
-                        country_code = origin.text
-                        iso_country_code = self.convert_language_code(
-                            country_code, code_type="country"
-                        )
-                        if (
-                            iso_country_code
-                            and iso_country_code not in bid["countriesOfOrigin"]
-                        ):
-                            bid["countriesOfOrigin"].append(iso_country_code)
-
-                tender_variant_indicator = self.parser.find_text(
-                    lot_tender, "efbc:TenderVariantIndicator"
-                )
-                if tender_variant_indicator:
-                    bid["variant"] = tender_variant_indicator.lower() == "true"
-
-                tender_reference = self.parser.find_text(
-                    lot_tender, "efac:TenderReference/cbc:ID"
-                )
-                if tender_reference:
-                    bid.setdefault("identifiers", []).append(
-                        {
-                            "id": tender_reference,
-                            "scheme": "{}-TENDERNL".format(
-                                tender_reference.split("/")[0][:2]
-                            ),
-                        }
-                    )
-
-                sub_contracting_amount = self.parser.find_text(
-                    lot_tender, "efac:SubcontractingTerm/efbc:TermAmount"
-                )
-                currency_id = self.parser.find_attribute(
-                    lot_tender, "efac:SubcontractingTerm/efbc:TermAmount", "currencyID"
-                )
-                if sub_contracting_amount and currency_id:
-                    bid.setdefault("subcontracting", {})["value"] = {
-                        "amount": float(sub_contracting_amount),
-                        "currency": currency_id,
-                    }
-
-                sub_contracting_desc = self.parser.find_text(
-                    lot_tender, "efac:SubcontractingTerm/efbc:TermDescription"
-                )
-                if sub_contracting_desc:
-                    bid.setdefault("subcontracting", {})[
-                        "description"
-                    ] = sub_contracting_desc
-
-                sub_contracting_percent = self.parser.find_text(
-                    lot_tender, "efac:SubcontractingTerm/efbc:TermPercent"
-                )
-                if sub_contracting_percent:
-                    percentage = float(sub_contracting_percent) / 100
-                    bid.setdefault("subcontracting", {})[
-                        "minimumPercentage"
-                    ] = percentage
-                    bid.setdefault("subcontracting", {})[
-                        "maximumPercentage"
-                    ] = percentage
-
-                sub_contracting_code = self.parser.find_text(
-                    lot_tender, "efac:SubcontractingTerm/efbc:TermCode"
-                )
-                if sub_contracting_code:
-                    bid["hasSubcontracting"] = sub_contracting_code.lower() == "yes"
-
-                legal_monetary_total = self.parser.find_text(
-                    lot_tender, "cac:LegalMonetaryTotal/cbc:PayableAmount"
-                )
-                currency_id = self.parser.find_attribute(
-                    lot_tender, "cac:LegalMonetaryTotal/cbc:PayableAmount", "currencyID"
-                )
-                if legal_monetary_total and currency_id:
-                    tender_value = {
-                        "amount": float(legal_monetary_total),
-                        "currency": currency_id,
-                    }
-                    bid["value"] = tender_value
-
-    def fetch_bt500_organization_names(self, root_element):
-        """
-        Fetch names of organizations (BT-500) and update the organization part names (BT-16).
-        """
-
-        # BT-500-Organization-Company
-        companies = root_element.findall(
-            ".//efac:Organization/efac:Company", namespaces=self.parser.nsmap
-        )
-        for company in companies:
-            org_id = self.parser.find_text(
-                company, "./cac:PartyIdentification/cbc:ID[@schemeName='organization']"
-            )
-            if org_id:
-                organization = self.get_or_create_organization(self.parties, org_id)
-                org_name = self.parser.find_text(company, "./cac:PartyName/cbc:Name")
-                department = self.parser.find_text(
-                    company, "./cac:PostalAddress/cbc:Department"
-                )
-                organization["name"] = (
-                    f"{org_name} - {department}" if department else org_name
+                organization["name"] = (
+                    f"{org_name} - {department}" if department else org_name
                 )
 
         # BT-500-Organization-TouchPoint
@@ -658,34 +1331,30 @@ class TEDtoOCDSConverter:
                     f"{org_name} - {department}" if department else org_name
                 )
 
-    def fetch_bt47_participants(self, root_element):
-        logger.info("Fetching BT-47 Participant Name")
-        lots = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
+    @handles("lot", scheme="Lot", reads=("lots",), writes=("parties",))
+    def fetch_bt47_participants(self, lot):
+        lot_id = self.parser.find_text(lot, "./cbc:ID")
+        participants = lot.xpath(
+            ".//cac:EconomicOperatorShortList/cac:PreSelectedParty/cac:PartyName/cbc:Name",
             namespaces=self.parser.nsmap,
         )
-        for lot in lots:
-            lot_id = self.parser.find_text(lot, "./cbc:ID")
-            participants = lot.xpath(
-                ".//cac:EconomicOperatorShortList/cac:PreSelectedParty/cac:PartyName/cbc:Name",
-                namespaces=self.parser.nsmap,
-            )
-            for participant in participants:
-                party_name = participant.text
-                party_id = str(uuid.uuid4())
-                self.parties.append(
-                    {
-                        "id": party_id,
-                        "name": party_name,
-                        "roles": ["selectedParticipant"],
-                    }
+        for participant in participants:
+            party_name = participant.text
+            party_id = self.release.ids.new_id("selected-participant", participant)
+            self.parties.append(
+                Party(
+                    id=party_id,
+                    name=party_name,
+                    roles=["selectedParticipant"],
                 )
-                logger.debug(f"Added selectedParticipant role to organization {party_id}")
-                for tender_lot in self.tender["lots"]:
-                    if tender_lot["id"] == lot_id:
-                        tender_lot.setdefault("designContest", {}).setdefault(
-                            "selectedParticipants", []
-                        ).append({"id": party_id, "name": party_name})
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Added selectedParticipant role to organization %s", party_id)
+            for tender_lot in self.tender["lots"]:
+                if tender_lot["id"] == lot_id:
+                    tender_lot.setdefault("designContest", {}).setdefault(
+                        "selectedParticipants", []
+                    ).append({"id": party_id, "name": party_name})
 
     def fetch_opt_300_procedure_service_provider(self, root_element):
         service_providers = root_element.findall(
@@ -703,14 +1372,11 @@ class TEDtoOCDSConverter:
                 if "procurementServiceProvider" not in org.get("roles", []):
                     org.setdefault("roles", []).append("procurementServiceProvider")
 
-                org_name = self.parser.find_text(
-                    root_element,
-                    f".//efac:Organization[efac:Company/cac:PartyIdentification/cbc:ID='{svc_provider_id}']/efac:Company/cac:PartyName/cbc:Name",
-                    namespaces=self.parser.nsmap,
-                )
+                org_name = self.parser.index.organization_name(svc_provider_id)
                 if org_name:
                     org["name"] = org_name
 
+    @handles(writes=("parties",))
     def fetch_bt508_buyer_profile(self, root_element):
         buyers = []
         profiles = root_element.findall(
@@ -727,20 +1393,21 @@ class TEDtoOCDSConverter:
                 "./cac:Party/cac:PartyIdentification/cbc:ID",
                 namespaces=self.parser.nsmap,
             )
-            organization = next((o for o in self.parties if o["id"] == org_id), None)
+            organization = self.release.parties.get(org_id)
             if organization:
                 organization.setdefault("details", {}).update({"buyerProfile": buyer_uri})
             else:
-                organization = {
-                    "id": org_id,
-                    "roles": ["buyer"],
-                    "details": {
+                organization = Party(
+                    id=org_id,
+                    roles=["buyer"],
+                    details={
                         "buyerProfile": buyer_uri,
                     },
-                }
+                )
                 self.parties.append(organization)
         return {}
 
+    @handles(writes=("parties",))
     def fetch_bt610_activity_entity(self, root_element):
         activities = []
         contracting_parties = root_element.findall(
@@ -767,25 +1434,26 @@ class TEDtoOCDSConverter:
             scheme, code, description = self.map_activity_code(
                 activity["activityTypeCode"], "Activity"
             )
-            organization = next((o for o in self.parties if o["id"] == org_id), None)
+            organization = self.release.parties.get(org_id)
 
             if organization:
                 organization.setdefault("details", {}).setdefault(
                     "classifications", []
                 ).append({"scheme": scheme, "id": code, "description": description})
             else:
-                organization = {
-                    "id": org_id,
-                    "roles": ["buyer"],
-                    "details": {
+                organization = Party(
+                    id=org_id,
+                    roles=["buyer"],
+                    details={
                         "classifications": [
                             {"scheme": scheme, "id": code, "description": description}
                         ]
                     },
-                }
+                )
                 self.parties.append(organization)
         return {}
 
+    @handles(writes=("parties",))
     def fetch_bt740_contracting_entity(self, element):
         contracting_parties = element.findall(
             ".//cac:ContractingPartyType", namespaces=self.parser.nsmap
@@ -803,7 +1471,7 @@ class TEDtoOCDSConverter:
                     namespaces=self.parser.nsmap,
                 )
                 description = self.get_contracting_entity_description(party_type_code)
-                org = next((o for o in self.parties if o["id"] == org_id), None)
+                org = self.release.parties.get(org_id)
 
                 if org:
                     org.setdefault("details", {}).setdefault(
@@ -817,10 +1485,10 @@ class TEDtoOCDSConverter:
                     )
                 else:
                     self.parties.append(
-                        {
-                            "id": org_id,
-                            "roles": ["buyer"],
-                            "details": {
+                        Party(
+                            id=org_id,
+                            roles=["buyer"],
+                            details={
                                 "classifications": [
                                     {
                                         "scheme": "eu-buyer-contracting-type",
@@ -831,75 +1499,65 @@ class TEDtoOCDSConverter:
                                     }
                                 ]
                             },
-                        }
+                        )
                     )
         return {}
 
     def get_contracting_entity_description(self, code):
-        # Define a mapping of contracting entity codes to descriptions
-        contracting_entity_descriptions = {
-            "cont-ent": "Contracting Entity",
-            # Add other codes and descriptions as needed
-        }
-        return contracting_entity_descriptions.get(
+        return CONTRACTING_ENTITY_DESCRIPTIONS.get(
             code, "Unknown contracting entity type"
         )
 
-    def fetch_opp_050_buyers_group_lead(self, root_element):
-        logger.info("Fetching OPP-050 Organization Buyers Group Lead Indicator")
-        groups = root_element.xpath(
-            ".//efac:Organization[efbc:GroupLeadIndicator='true']",
+    @handles("organization", writes=("parties",))
+    def fetch_opp_050_buyers_group_lead(self, organization_element):
+        group_lead_indicator = self.parser.find_text(
+            organization_element,
+            "./efbc:GroupLeadIndicator",
             namespaces=self.parser.nsmap,
         )
-        for group in groups:
+        if group_lead_indicator == "true":
             org_id = self.parser.find_text(
-                group,
+                organization_element,
                 "./efac:Company/cac:PartyIdentification/cbc:ID",
                 namespaces=self.parser.nsmap,
             )
             organization = self.get_or_create_organization(self.parties, org_id)
             if "leadBuyer" not in organization["roles"]:
                 organization["roles"].append("leadBuyer")
-                logger.debug(f"Added leadBuyer role to organization {org_id}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Added leadBuyer role to organization %s", org_id)
 
-    def fetch_opp_051_awarding_cpb_buyer(self, root_element):
-        logger.info("Fetching OPP-051 Organization Awarding CPB Buyer Indicator")
-        parties = root_element.findall(
-            ".//efac:Organization", namespaces=self.parser.nsmap
+    @handles("organization", writes=("parties",))
+    def fetch_opp_051_awarding_cpb_buyer(self, party):
+        awarding_cpb_indicator = self.parser.find_text(
+            party, "./efbc:AwardingCPBIndicator", namespaces=self.parser.nsmap
         )
-        for party in parties:
-            awarding_cpb_indicator = self.parser.find_text(
-                party, "./efbc:AwardingCPBIndicator", namespaces=self.parser.nsmap
+        if awarding_cpb_indicator == "true":
+            org_id = self.parser.find_text(
+                party,
+                "./efac:Company/cac:PartyIdentification/cbc:ID",
+                namespaces=self.parser.nsmap,
             )
-            if awarding_cpb_indicator == "true":
-                org_id = self.parser.find_text(
-                    party,
-                    "./efac:Company/cac:PartyIdentification/cbc:ID",
-                    namespaces=self.parser.nsmap,
-                )
-                org = self.get_or_create_organization(self.parties, org_id)
-                if "procuringEntity" not in org["roles"]:
-                    org["roles"].append("procuringEntity")
+            org = self.get_or_create_organization(self.parties, org_id)
+            if "procuringEntity" not in org["roles"]:
+                org["roles"].append("procuringEntity")
 
-    def fetch_opp_052_acquiring_cpb_buyer(self, root_element):
-        logger.info("Fetching OPP-052 Organization Acquiring CPB Buyer Indicator")
-        parties = root_element.findall(
-            ".//efac:Organization", namespaces=self.parser.nsmap
+    @handles("organization", writes=("parties",))
+    def fetch_opp_052_acquiring_cpb_buyer(self, party):
+        acquiring_cpb_indicator = self.parser.find_text(
+            party, "./efbc:AcquiringCPBIndicator", namespaces=self.parser.nsmap
         )
-        for party in parties:
-            acquiring_cpb_indicator = self.parser.find_text(
-                party, "./efbc:AcquiringCPBIndicator", namespaces=self.parser.nsmap
+        if acquiring_cpb_indicator == "true":
+            org_id = self.parser.find_text(
+                party,
+                "./efac:Company/cac:PartyIdentification/cbc:ID",
+                namespaces=self.parser.nsmap,
             )
-            if acquiring_cpb_indicator == "true":
-                org_id = self.parser.find_text(
-                    party,
-                    "./efac:Company/cac:PartyIdentification/cbc:ID",
-                    namespaces=self.parser.nsmap,
-                )
-                org = self.get_or_create_organization(self.parties, org_id)
-                if "wholesaleBuyer" not in org["roles"]:
-                    org["roles"].append("wholesaleBuyer")
+            org = self.get_or_create_organization(self.parties, org_id)
+            if "wholesaleBuyer" not in org["roles"]:
+                org["roles"].append("wholesaleBuyer")
 
+    @handles(writes=("parties",))
     def fetch_opt_030_service_type(self, root_element):
         logger.info("Fetching OPT-030 Procedure SProvider Provided Service Type")
         contracting_parties = root_element.findall(
@@ -929,6 +1587,7 @@ class TEDtoOCDSConverter:
         elif service_type_code == "ted-esen" and "eSender" not in org["roles"]:
             org["roles"].append("eSender")
 
+    @handles(writes=("parties",))
     def fetch_opt_170_tender_leader(self, root):
         tenderers = root.findall(
             ".//efac:NoticeResult/efac:TenderingParty/efac:Tenderer",
@@ -942,9 +1601,9 @@ class TEDtoOCDSConverter:
                 org_id = self.parser.find_text(
                     tenderer, "./cbc:ID", namespaces=self.parser.nsmap
                 )
-                org = next((o for o in self.parties if o["id"] == org_id), None)
+                org = self.release.parties.get(org_id)
                 if not org:
-                    org = {"id": org_id, "roles": ["leadTenderer", "tenderer"]}
+                    org = Party(id=org_id, roles=["leadTenderer", "tenderer"])
                     self.parties.append(org)
                 else:
                     if "leadTenderer" not in org["roles"]:
@@ -952,93 +1611,36 @@ class TEDtoOCDSConverter:
                     if "tenderer" not in org["roles"]:
                         org["roles"].append("tenderer")
 
-    def fetch_opt_300_signatory_reference(self, root_element):
-        signatory_parties = root_element.findall(
-            ".//efac:NoticeResult/efac:SettledContract/cac:SignatoryParty",
-            namespaces=self.parser.nsmap,
-        )
-        for signatory_party in signatory_parties:
-            signatory_id = self.parser.find_text(
-                signatory_party,
-                "./cac:PartyIdentification/cbc:ID",
-                namespaces=self.parser.nsmap,
-            )
-            if signatory_id:
-                org = next((o for o in self.parties if o["id"] == signatory_id), None)
-                if not org:
-                    # Get organization's name
-                    name = self.parser.find_text(
-                        root_element,
-                        f"//efac:Organizations/efac:Organization[efac:Company/cac:PartyIdentification/cbc:ID[text()='{signatory_id}']]/efac:Company/cac:PartyName/cbc:Name",
-                        namespaces=self.parser.nsmap,
-                    )
-                    org = {"id": signatory_id, "name": name, "roles": ["buyer"]}
-                    self.parties.append(org)
-
-                contract_id = self.parser.find_text(
-                    signatory_party, "./../../cbc:ID", namespaces=self.parser.nsmap
-                )  # Current contract ID
-                for award in self.awards:
-                    if contract_id in award.get("relatedContracts", []):
-                        if "buyers" not in award:
-                            award["buyers"] = []
-                        award["buyers"].append({"id": signatory_id})
-
-    def fetch_opt_300_buyer_technical_reference(self, root_element):
-        buyer_parties = root_element.findall(
-            ".//cac:ContractingParty", namespaces=self.parser.nsmap
+    @handles("lot_tender", writes=("parties", "bids"))
+    def fetch_opt_301_tenderer_maincont(self, lot_tender):
+        tender_id = self.parser.find_text(
+            lot_tender, "./cbc:ID", namespaces=self.parser.nsmap
         )
-        for buyer_party in buyer_parties:
-            buyer_id = self.parser.find_text(
-                buyer_party, "./cac:Party/cac:PartyIdentification/cbc:ID",
-                namespaces=self.parser.nsmap)
-            if buyer_id:
-                self.fetch_organisations_roles(buyer_id, ["buyer"])
-
-    def fetch_opt_301_tenderer_maincont(self, root_element):
-        notice_results = root_element.findall(
-            ".//efac:NoticeResult", namespaces=self.parser.nsmap
+        subcontractors = lot_tender.findall(
+            ".//efac:SubContractor", namespaces=self.parser.nsmap
         )
-        for notice_result in notice_results:
-            lot_tenders = notice_result.findall(
-                ".//efac:LotTender", namespaces=self.parser.nsmap
+        for subcontractor in subcontractors:
+            subcontractor_id = self.parser.find_text(
+                subcontractor, "./cbc:ID", namespaces=self.parser.nsmap
             )
-            for lot_tender in lot_tenders:
-                tender_id = self.parser.find_text(
-                    lot_tender, "./cbc:ID", namespaces=self.parser.nsmap
-                )
-                subcontractors = lot_tender.findall(
-                    ".//efac:SubContractor", namespaces=self.parser.nsmap
+            main_contractors = subcontractor.findall(
+                ".//efac:MainContractor", namespaces=self.parser.nsmap
+            )
+            for main_contractor in main_contractors:
+                main_contractor_id = self.parser.find_text(
+                    main_contractor, "./cbc:ID", namespaces=self.parser.nsmap
                 )
-                for subcontractor in subcontractors:
-                    subcontractor_id = self.parser.find_text(
-                        subcontractor, "./cbc:ID", namespaces=self.parser.nsmap
-                    )
-                    main_contractors = subcontractor.findall(
-                        ".//efac:MainContractor", namespaces=self.parser.nsmap
-                    )
-                    for main_contractor in main_contractors:
-                        main_contractor_id = self.parser.find_text(
-                            main_contractor, "./cbc:ID", namespaces=self.parser.nsmap
-                        )
 
-                        if main_contractor_id:
-                            fetch_organisations_roles(main_contractor_id, ["tenderer"])
+                if main_contractor_id:
+                    fetch_organisations_roles(main_contractor_id, ["tenderer"])
 
     def add_or_update_bid_with_subcontractor(self, tender_id, subcontractor_id, main_contractor_id):
-        bid = next(
-            (
-                b
-                for b in self.tender["bids"]["details"]
-                if b["id"] == tender_id
-            ),
-            None,
-        )
+        bid = self.release.bids.get(tender_id)
         if not bid:
-            bid = {
-                "id": tender_id,
-                "subcontracting": {"subcontracts": []},
-            }
+            bid = Bid(
+                id=tender_id,
+                subcontracting={"subcontracts": []},
+            )
             self.tender["bids"]["details"].append(bid)
 
         subcontract = next(
@@ -1063,127 +1665,6 @@ class TEDtoOCDSConverter:
         subcontract["mainContractors"].append(main_contractor_references)
         return bid
 
-    def fetch_opt_301_contract_signatory(self, root_element):
-        logger.info("Fetching OPT-301 Contract Signatory Identifier Reference")
-        signatory_parties = root_element.findall(
-            ".//efac:NoticeResult/efac:SettledContract/cac:SignatoryParty",
-            namespaces=self.parser.nsmap,
-        )
-        for signatory_party in signatory_parties:
-            signatory_id = self.parser.find_text(
-                signatory_party,
-                "./cac:PartyIdentification/cbc:ID",
-                namespaces=self.parser.nsmap,
-            )
-            if signatory_id:
-                org = self.get_or_create_organization(self.parties, signatory_id)
-                if "buyer" not in org["roles"]:
-                    org["roles"].append("buyer")
-                    logger.debug(f"Added buyer role to organization {signatory_id}")
-                org_name = self.parser.find_text(
-                    root_element,
-                    f".//efac:Organization[efac:Company/cac:PartyIdentification/cbc:ID='{signatory_id}']/efac:Company/cac:PartyName/cbc:Name",
-                    namespaces=self.parser.nsmap,
-                )
-                if org_name:
-                    org["name"] = org_name
-                contract_id = self.parser.find_text(
-                    signatory_party, "./../../cbc:ID", namespaces=self.parser.nsmap
-                )
-                for award in self.awards:
-                    if contract_id in [c["id"] for c in award.get("contracts", [])]:
-                        award.setdefault("buyers", []).append({"id": signatory_id})
-                        logger.debug(f"Added buyer reference {signatory_id} to award.")
-
-    def fetch_opt_310_tender(self, root_element):
-        if "bids" not in self.tender:
-            self.tender["bids"] = {"details": []}
-
-        notice_results = root_element.findall(
-            ".//efac:NoticeResult", namespaces=self.parser.nsmap
-        )
-        for notice_result in notice_results:
-            lot_tenders = notice_result.findall(
-                ".//efac:LotTender", namespaces=self.parser.nsmap
-            )
-            for lot_tender in lot_tenders:
-                tender_id = self.parser.find_text(
-                    lot_tender, "./cbc:ID", namespaces=self.parser.nsmap
-                )
-                tender_party_id = self.parser.find_text(
-                    lot_tender,
-                    "./efac:TenderingParty/cbc:ID",
-                    namespaces=self.parser.nsmap,
-                )
-
-                bidder_details = {"id": tender_id, "tenderers": []}
-
-                tendering_parties = notice_result.findall(
-                    f".//efac:TenderingParty[cbc:ID='{tender_party_id}']",
-                    namespaces=self.parser.nsmap,
-                )
-                for tendering_party in tendering_parties:
-                    tenderers = tendering_party.findall(
-                        ".//efac:Tenderer", namespaces=self.parser.nsmap
-                    )
-                    for tenderer in tenderers:
-                        org_id = self.parser.find_text(
-                            tenderer, "./cbc:ID", namespaces=self.parser.nsmap
-                        )
-                        if org_id:
-                            org = next(
-                                (o for o in self.parties if o["id"] == org_id), None
-                            )
-                            if org:
-                                if "tenderer" not in org.get("roles", []):
-                                    org["roles"].append("tenderer")
-                            else:
-                                self.parties.append(
-                                    {"id": org_id, "roles": ["tenderer"]}
-                                )
-
-                            bidder_details["tenderers"].append({"id": org_id})
-
-                self.tender["bids"]["details"].append(bidder_details)
-
-    def fetch_opt_301_add_info_provider(self, root_element):
-        logger.info(
-            "Fetching OPT-301 Lot AddInfo Additional Info Provider Technical Identifier Reference"
-        )
-        lots = root_element.findall(
-            ".//cac:ProcurementProjectLot", namespaces=self.parser.nsmap
-        )
-        for lot in lots:
-            additional_info_party_id = self.parser.find_text(
-                lot,
-                "./cac:TenderingTerms/cac:AdditionalInformationParty/cac:PartyIdentification/cbc:ID",
-                namespaces=self.parser.nsmap,
-            )
-            if additional_info_party_id:
-                org = self.get_or_create_organization(
-                    self.parties, additional_info_party_id
-                )
-                if "processContactPoint" not in org["roles"]:
-                    org["roles"].append("processContactPoint")
-
-    def fetch_opt_301_doc_provider(self, root_element):
-        logger.info(
-            "Fetching OPT-301 Lot DocProvider Document Provider Technical Identifier Reference"
-        )
-        lots = root_element.findall(
-            ".//cac:ProcurementProjectLot", namespaces=self.parser.nsmap
-        )
-        for lot in lots:
-            doc_provider_id = self.parser.find_text(
-                lot,
-                "./cac:TenderingTerms/cac:DocumentProviderParty/cac:PartyIdentification/cbc:ID",
-                namespaces=self.parser.nsmap,
-            )
-            if doc_provider_id:
-                org = self.get_or_create_organization(self.parties, doc_provider_id)
-                if "processContactPoint" not in org["roles"]:
-                    org["roles"].append("processContactPoint")
-
     def fetch_opt_301_employ_legis(self, root_element):
         logger.info(
             "Fetching OPT-301 Lot EmployLegis Employment Legislation Organization Technical Identifier Reference"
@@ -1217,247 +1698,172 @@ class TEDtoOCDSConverter:
                     if "informationService" not in organization["roles"]:
                         organization["roles"].append("informationService")
 
-    def fetch_opt_301_lot_employ_legis(self, root_element):
-        lot_elements = root_element.findall(
-            ".//cac:ProcurementProjectLot", namespaces=self.parser.nsmap
+    @handles("lot", writes=("documents",))
+    def fetch_opt_301_lot_employ_legis(self, lot):
+        lot_id = self.parser.find_text(
+            lot, "./cbc:ID", namespaces=self.parser.nsmap
         )
-        for lot in lot_elements:
-            lot_id = self.parser.find_text(
-                lot, "./cbc:ID", namespaces=self.parser.nsmap
+        legis_doc_elements = lot.findall(
+            ".//cac:EmploymentLegislationDocumentReference",
+            namespaces=self.parser.nsmap,
+        )
+        for legis_doc in legis_doc_elements:
+            doc_id = self.parser.find_text(
+                legis_doc, "./cbc:ID", namespaces=self.parser.nsmap
             )
-            legis_doc_elements = lot.findall(
-                ".//cac:EmploymentLegislationDocumentReference",
+            issuer_party_id = self.parser.find_text(
+                legis_doc,
+                "./cac:IssuerParty/cac:PartyIdentification/cbc:ID",
                 namespaces=self.parser.nsmap,
             )
-            for legis_doc in legis_doc_elements:
-                doc_id = self.parser.find_text(
-                    legis_doc, "./cbc:ID", namespaces=self.parser.nsmap
-                )
-                issuer_party_id = self.parser.find_text(
-                    legis_doc,
-                    "./cac:IssuerParty/cac:PartyIdentification/cbc:ID",
-                    namespaces=self.parser.nsmap,
-                )
-                if doc_id and issuer_party_id:
-                    document = {
-                        "id": doc_id,
-                        "relatedLots": [lot_id],
-                        "publisher": {"id": issuer_party_id},
-                    }
-                    self.add_update_document(document)
-                    organization = self.get_or_create_organization(
-                        self.parties, issuer_party_id
-                    )
-                    if "informationService" not in organization["roles"]:
-                        organization["roles"].append("informationService")
+            if doc_id and issuer_party_id:
+                document = {
+                    "id": doc_id,
+                    "relatedLots": [lot_id],
+                    "publisher": {"id": issuer_party_id},
+                }
+                self.add_update_document(document)
 
-    def fetch_opt_301_lot_environ_legis(self, root_element):
-        lot_elements = root_element.findall(
-            ".//cac:ProcurementProjectLot", namespaces=self.parser.nsmap
+    @handles("lot", writes=("documents",))
+    def fetch_opt_301_lot_environ_legis(self, lot):
+        lot_id = self.parser.find_text(
+            lot, "./cbc:ID", namespaces=self.parser.nsmap
         )
-        for lot in lot_elements:
-            lot_id = self.parser.find_text(
-                lot, "./cbc:ID", namespaces=self.parser.nsmap
+        legis_doc_elements = lot.findall(
+            ".//cac:EnvironmentalLegislationDocumentReference",
+            namespaces=self.parser.nsmap,
+        )
+        for legis_doc in legis_doc_elements:
+            doc_id = self.parser.find_text(
+                legis_doc, "./cbc:ID", namespaces=self.parser.nsmap
             )
-            legis_doc_elements = lot.findall(
-                ".//cac:EnvironmentalLegislationDocumentReference",
+            issuer_party_id = self.parser.find_text(
+                legis_doc,
+                "./cac:IssuerParty/cac:PartyIdentification/cbc:ID",
                 namespaces=self.parser.nsmap,
             )
-            for legis_doc in legis_doc_elements:
-                doc_id = self.parser.find_text(
-                    legis_doc, "./cbc:ID", namespaces=self.parser.nsmap
-                )
-                issuer_party_id = self.parser.find_text(
-                    legis_doc,
-                    "./cac:IssuerParty/cac:PartyIdentification/cbc:ID",
-                    namespaces=self.parser.nsmap,
-                )
-                if doc_id and issuer_party_id:
-                    document = {
-                        "id": doc_id,
-                        "relatedLots": [lot_id],
-                        "publisher": {"id": issuer_party_id},
-                    }
-                    self.add_update_document(document)
-                    organization = self.get_or_create_organization(
-                        self.parties, issuer_party_id
-                    )
-                    if "informationService" not in organization["roles"]:
-                        organization["roles"].append("informationService")
+            if doc_id and issuer_party_id:
+                document = {
+                    "id": doc_id,
+                    "relatedLots": [lot_id],
+                    "publisher": {"id": issuer_party_id},
+                }
+                self.add_update_document(document)
 
-    def fetch_listed_on_regulated_market(self, org_element):
-        indicator = self.parser.find_text(
-            org_element,
-            "./efbc:ListedOnRegulatedMarketIndicator",
-            namespaces=self.parser.nsmap,
-        )
-        if indicator is not None:
-            return indicator.lower() == "true"
-        return None
+    @handles("organization", writes=("parties",))
+    def fetch_organization(self, org_element):
+        """
+        Maps an efac:Organization to complete parties, reading its subtree
+        once: the company (BT-500 to BT-506, BT-165, BT-633, BT-746) with its
+        beneficial owners, and its touch point, which is a party of its own.
+        """
+        nsmap = self.parser.nsmap
+        company = org_element.find("efac:Company", nsmap)
+        organization = self.fetch_company_party(company) if company is not None else None
+        if organization is None:
+            return
 
-    def fetch_company_size(self, org_element):
-        size = self.parser.find_text(
-            org_element,
-            "./efac:Company/efbc:CompanySizeCode",
-            namespaces=self.parser.nsmap,
-        )
-        return size.lower() if size else None
+        details = {}
+        listed_indicator = org_element.findtext(
+            "efbc:ListedOnRegulatedMarketIndicator", namespaces=nsmap
+        )
+        if listed_indicator:
+            details["listedOnRegulatedMarket"] = listed_indicator.lower() == "true"
+        company_size = company.findtext("efbc:CompanySizeCode", namespaces=nsmap)
+        if company_size:
+            details["scale"] = company_size.lower()
+        elif org_element.findtext("efbc:NaturalPersonIndicator", "", nsmap).lower() == "true":
+            details["scale"] = "selfEmployed"
+        if details:
+            organization.setdefault("details", {}).update(details)
+
+        for reference in org_element.iterfind("efac:UltimateBeneficialOwner", nsmap):
+            owner = self.parse_beneficial_owner(self.find_beneficial_owner(reference))
+            if owner:
+                organization.setdefault("beneficialOwners", []).append(owner)
+
+        touch_point = org_element.find("efac:TouchPoint", nsmap)
+        if touch_point is not None:
+            self.fetch_company_party(touch_point)
+
+    def fetch_company_party(self, company):
+        """
+        Fills the party of an efac:Company or efac:TouchPoint with its name,
+        address, contact point and web site. Returns the party, or None when
+        the element has no identifier.
+        """
+        nsmap = self.parser.nsmap
+        party_id = company.findtext("cac:PartyIdentification/cbc:ID", namespaces=nsmap)
+        if not party_id:
+            return None
+        party = self.get_or_create_organization(self.parties, party_id)
+
+        address_element = company.find("cac:PostalAddress", nsmap)
+        name = company.findtext("cac:PartyName/cbc:Name", namespaces=nsmap)
+        if name:
+            department = (
+                address_element.findtext("cbc:Department", namespaces=nsmap)
+                if address_element is not None
+                else None
+            )
+            party["name"] = f"{name} - {department}" if department else name
+
+        if address_element is not None:
+            party["address"] = {
+                "locality": address_element.findtext("cbc:CityName", namespaces=nsmap),
+                "postalCode": address_element.findtext("cbc:PostalZone", namespaces=nsmap),
+                "region": address_element.findtext("cbc:CountrySubentity", namespaces=nsmap),
+                "country": self.convert_language_code(
+                    address_element.findtext(
+                        "cac:Country/cbc:IdentificationCode", namespaces=nsmap
+                    ),
+                    code_type="country",
+                ),
+            }
 
-    def fetch_is_natural_person(self, org_element):
-        indicator = self.parser.find_text(
-            org_element, "./efbc:NaturalPersonIndicator", namespaces=self.parser.nsmap
-        )
-        if indicator is not None:
-            return indicator.lower() == "true"
-        return None
+        contact_point = self.fetch_bt502_contact_point(company)
+        if contact_point:
+            party["contactPoint"] = contact_point
 
-    def fetch_bid_variant(self, root_element):
-        for bid_element in root_element.findall(
-            ".//efac:LotTender", namespaces=self.parser.nsmap
-        ):
-            bid_id = self.parser.find_text(
-                bid_element, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            variant_indicator = self.parser.find_text(
-                bid_element,
-                "./efbc:TenderVariantIndicator",
-                namespaces=self.parser.nsmap,
-            )
-            if variant_indicator:
-                variant_value = variant_indicator.lower() == "true"
-                bid_details = next(
-                    (b for b in self.bids.get("details", []) if b["id"] == bid_id), None
-                )
-                if bid_details:
-                    bid_details["variant"] = variant_value
-                else:
-                    self.bids.setdefault("details", []).append(
-                        {"id": bid_id, "variant": variant_value}
-                    )
+        website = company.findtext("cbc:WebsiteURI", namespaces=nsmap)
+        if website:
+            party.setdefault("details", {})["url"] = website
+        return party
 
-    def fetch_bt500_company_organization(self, root_element):
-        organizations = []
-        organization_elements = root_element.findall(
-            ".//efac:Organization", namespaces=self.parser.nsmap
-        )
+    def find_beneficial_owner(self, reference):
+        """
+        Returns the efac:UltimateBeneficialOwner an organization refers to.
+        eForms keeps the owners next to the organizations, so the reference
+        inside the organization only has the ID; it is returned itself when
+        no owner with that ID is found.
+        """
+        owner_id = reference.findtext("cbc:ID", namespaces=self.parser.nsmap)
+        return self.parser.index.beneficial_owners.get(owner_id, reference)
 
-        for org_element in organization_elements:
-            org_id = self.parser.find_text(
-                    org_element,
-                    "./efac:Company/cac:PartyIdentification/cbc:ID",
-                    namespaces=self.parser.nsmap,
-            )
-            if org_id:
-                organization = self.get_or_create_organization(self.parties, org_id)
-                org_name = self.parser.find_text(
-                    org_element,
-                    "./efac:Company/cac:PartyName/cbc:Name",
-                    namespaces=self.parser.nsmap,
-                )
-                if org_name:
-                    department = self.parser.find_text(
-                        org_element,
-                        "./efac:Company/cac:PostalAddress/cbc:Department",
-                        namespaces=self.parser.nsmap,
-                    )
-                    organization["name"] = (
-                        f"{org_name} - {department}" if department else org_name
-                    )
-
-                address_element = org_element.find(
-                    "./efac:Company/cac:PostalAddress", namespaces=self.parser.nsmap
-                )
-                if address_element is not None:
-                    organization["address"] = {
-                        "locality": self.parser.find_text(
-                            address_element,
-                            "./cbc:CityName",
-                            namespaces=self.parser.nsmap,
-                        ),
-                        "postalCode": self.parser.find_text(
-                            address_element,
-                            "./cbc:PostalZone",
-                            namespaces=self.parser.nsmap,
-                        ),
-                        "region": self.parser.find_text(
-                            address_element,
-                            "./cbc:CountrySubentity",
-                            namespaces=self.parser.nsmap,
-                        ),
-                        "country": self.convert_language_code(
-                            self.parser.find_text(
-                                address_element,
-                                "./cac:Country/cbc:IdentificationCode",
-                                namespaces=self.parser.nsmap,
-                            ),
-                            code_type="country",
-                        ),
-                    }
-
-                contact_point = self.fetch_bt502_contact_point(org_element)
-                if contact_point:
-                    organization["contactPoint"] = contact_point
-
-                listed_on_market = self.fetch_listed_on_regulated_market(org_element)
-                if listed_on_market is not None:
-                    organization.setdefault("details", {})[
-                        "listedOnRegulatedMarket"
-                    ] = listed_on_market
-
-                company_size = self.fetch_company_size(org_element)
-                if company_size:
-                    organization.setdefault("details", {})["scale"] = company_size
-
-                self.add_or_update_party(organizations, organization)
-
-                # Beneficial Owners
-                ubo_elements = org_element.findall(
-                    ".//efac:UltimateBeneficialOwner", namespaces=self.parser.nsmap
-                )
-                for ubo_element in ubo_elements:
-                    ubo_id = self.parser.find_text(
-                        ubo_element, "./cbc:ID", namespaces=self.parser.nsmap
-                    )
-                    if ubo_id:
-                        family_name = (
-                            self.parser.find_text(
-                                ubo_element,
-                                "./cbc:FamilyName",
-                                namespaces=self.parser.nsmap,
-                            )
-                            or ""
-                        )
-                        first_name = (
-                            self.parser.find_text(
-                                ubo_element, "./cbc:FirstName", namespaces=self.parser.nsmap
-                            )
-                            or ""
-                        )
-                        full_name = f"{first_name} {family_name}".strip()
-
-                        raw_nationality_code = self.parser.find_text(
-                            ubo_element,
-                            "./efac:Nationality/cbc:NationalityID",
-                            namespaces=self.parser.nsmap,
-                        )
-                        processed_nationality_code = (
-                            self.convert_language_code(raw_nationality_code, "country")
-                            if raw_nationality_code
-                            else None
-                        )
-
-                        ubo_info = {
-                            "id": ubo_id,
-                            "name": full_name,
-                            "nationality": processed_nationality_code,
-                        }
-                        phone_info = self.fetch_bt503_ubo_contact(ubo_element)
-                        if phone_info:
-                            ubo_info.update(phone_info)
-
-                        organization.setdefault("beneficialOwners", []).append(ubo_info)
-
-        return organizations
+    def parse_beneficial_owner(self, owner_element):
+        nsmap = self.parser.nsmap
+        owner_id = owner_element.findtext("cbc:ID", namespaces=nsmap)
+        if not owner_id:
+            return None
+        first_name = owner_element.findtext("cbc:FirstName", "", nsmap)
+        family_name = owner_element.findtext("cbc:FamilyName", "", nsmap)
+        nationality = owner_element.findtext(
+            "efac:Nationality/cbc:NationalityID", namespaces=nsmap
+        )
+        owner = {
+            "id": owner_id,
+            "name": f"{first_name} {family_name}".strip(),
+            "nationality": (
+                self.convert_language_code(nationality, "country") if nationality else None
+            ),
+        }
+        telephone = owner_element.findtext("cac:Contact/cbc:Telephone", namespaces=nsmap)
+        if telephone:
+            owner["telephone"] = telephone
+        email = owner_element.findtext("cac:Contact/cbc:ElectronicMail", namespaces=nsmap)
+        if email:
+            owner["email"] = email
+        return owner
 
     def process_street_address(self, address_element, nsmap):
         street_name = address_element.find("./cbc:StreetName", namespaces=nsmap)
@@ -1475,72 +1881,15 @@ class TEDtoOCDSConverter:
         ]
         return ", ".join(parts)
 
-    def fetch_bt500_touchpoint_organization(self, element):
-        xpath = ".//efac:Organizations/efac:Organization/efac:TouchPoint/cac:PartyName/cbc:Name"
-        name = self.parser.find_text(element, xpath, namespaces=self.parser.nsmap)
-        ident_xpath = ".//efac:Organizations/efac:Organization/efac:TouchPoint/cac:PartyIdentification/cbc:ID"
-        identifier = self.parser.find_text(
-            element, ident_xpath, namespaces=self.parser.nsmap
-        )
-        company_id_xpath = ".//efac:Organizations/efac:Organization/efac:Company/cac:PartyLegalEntity/cbc:CompanyID"
-        company_id = self.parser.find_text(
-            element, company_id_xpath, namespaces=self.parser.nsmap
-        )
-        touchpoint_country_xpath = ".//efac:Organizations/efac:Organization/efac:TouchPoint/cac:PostalAddress/cac:Country/cbc:IdentificationCode"
-        touchpoint_country = self.parser.find_text(
-            element, touchpoint_country_xpath, namespaces=self.parser.nsmap
-        )
-        touchpoint_country_code = (
-            self.convert_language_code(touchpoint_country, code_type="country")
-            if touchpoint_country
-            else None
-        )
-        touchpoint_department = self.parser.find_text(
-            element,
-            ".//efac:Organizations/efac:Organization/efac:TouchPoint/cac:PostalAddress/cbc:Department",
-            namespaces=self.parser.nsmap,
-        )
-
-        if identifier:
-            organization = self.get_or_create_organization(self.parties, identifier)
-
-            if name:
-                org_name = (
-                    f"{name} - {touchpoint_department}"
-                    if touchpoint_department
-                    else name
-                )
-                organization["name"] = org_name
-
-            if company_id:
-                organization.setdefault("identifier", {})
-                organization["identifier"]["id"] = company_id
-                organization["identifier"]["scheme"] = "internal"
-
-            if touchpoint_country_code:
-                organization["address"] = {"country": touchpoint_country_code}
-
-            self.add_or_update_party(self.parties, organization)
-
-        return organization if identifier else {}
-
-    def fetch_bt502_contact_point(self, org_element):
+    def fetch_bt502_contact_point(self, company):
+        nsmap = self.parser.nsmap
+        contact = company.find("cac:Contact", nsmap)
+        if contact is None:
+            return {}
         contact_point = {}
-        contact_name = self.parser.find_text(
-            org_element,
-            "./efac:Company/cac:Contact/cbc:Name",
-            namespaces=self.parser.nsmap,
-        )
-        telephone = self.parser.find_text(
-            org_element,
-            "./efac:Company/cac:Contact/cbc:Telephone",
-            namespaces=self.parser.nsmap,
-        )
-        email = self.parser.find_text(
-            org_element,
-            "./efac:Company/cac:Contact/cbc:ElectronicMail",
-            namespaces=self.parser.nsmap,
-        )
+        contact_name = contact.findtext("cbc:Name", namespaces=nsmap)
+        telephone = contact.findtext("cbc:Telephone", namespaces=nsmap)
+        email = contact.findtext("cbc:ElectronicMail", namespaces=nsmap)
 
         if contact_name:
             contact_point["name"] = contact_name
@@ -1549,161 +1898,9 @@ class TEDtoOCDSConverter:
         if email:
             contact_point["email"] = email
 
-        logger.debug(f"Extracted contact point: {contact_point}")
-        return contact_point if contact_point else {}
-
-    def fetch_bt503_ubo_contact(self, ubo_element):
-        telephone = self.parser.find_text(
-            ubo_element, "./cac:Contact/cbc:Telephone", namespaces=self.parser.nsmap
-        )
-        return {"telephone": telephone} if telephone else {}
-
-    def parse_organizations(self, element):
-        organizations = []
-        org_elements = element.findall(
-            ".//efac:Organization", namespaces=self.parser.nsmap
-        )
-
-        for org_element in org_elements:
-            org_id = self.parser.find_text(
-                org_element,
-                "./efac:Company/cac:PartyIdentification/cbc:ID",
-                namespaces=self.parser.nsmap,
-            )
-            if org_id:
-                logging.debug(f"Processing organization with ID: {org_id}")
-
-                organization = self.get_or_create_organization(organizations, org_id)
-                logging.debug(f"Retrieved organization: {organization}")
-
-                org_name = self.parser.find_text(
-                    org_element,
-                    "./efac:Company/cac:PartyName/cbc:Name",
-                    namespaces=self.parser.nsmap,
-                )
-                department = self.parser.find_text(
-                    org_element,
-                    "./efac:Company/cac:PostalAddress/cbc:Department",
-                    namespaces=self.parser.nsmap,
-                )
-                org_name_full = f"{org_name} - {department}" if department else org_name
-
-                contact_point = self.fetch_bt502_contact_point(org_element)
-                logging.debug(f"Extracted contact point: {contact_point}")
-
-                address = {
-                    "locality": self.parser.find_text(
-                        org_element,
-                        "./efac:Company/cac:PostalAddress/cbc:CityName",
-                        namespaces=self.parser.nsmap,
-                    ),
-                    "postalCode": self.parser.find_text(
-                        org_element,
-                        "./efac:Company/cac:PostalAddress/cbc:PostalZone",
-                        namespaces=self.parser.nsmap,
-                    ),
-                    "country": self.convert_language_code(
-                        self.parser.find_text(
-                            org_element,
-                            "./efac:Company/cac:PostalAddress/cac:Country/cbc:IdentificationCode",
-                            namespaces=self.parser.nsmap,
-                        ),
-                        "country",
-                    ),
-                    "region": self.parser.find_text(
-                        org_element,
-                        "./efac:Company/cac:PostalAddress/cbc:CountrySubentityCode",
-                        namespaces=self.parser.nsmap,
-                    ),
-                }
-
-                identifier = {
-                    "id": self.parser.find_text(
-                        org_element,
-                        "./efac:Company/cac:PartyLegalEntity/cbc:CompanyID",
-                        namespaces=self.parser.nsmap,
-                    ),
-                    "scheme": "GB-COH",
-                }
-
-                updated_info = {
-                    "roles": [],
-                    "name": org_name_full,
-                    "address": address,
-                    "identifier": identifier,
-                    "contactPoint": contact_point,
-                }
-
-                self.update_organization(organization, updated_info)
-                logging.debug(f"Updated organization info: {organization}")
-
-                # Beneficial Owners
-                ubo_elements = org_element.findall(
-                    ".//efac:UltimateBeneficialOwner", namespaces=self.parser.nsmap
-                )
-                for ubo_element in ubo_elements:
-                    ubo_id = self.parser.find_text(
-                        ubo_element, "./cbc:ID", namespaces=self.parser.nsmap
-                    )
-                    if ubo_id:
-                        logging.debug(f"Processing UBO with ID: {ubo_id}")
-                        first_name = (
-                            self.parser.find_text(
-                                ubo_element,
-                                "./cbc:FirstName",
-                                namespaces=self.parser.nsmap,
-                            )
-                            or ""
-                        )
-                        family_name = (
-                            self.parser.find_text(
-                                ubo_element,
-                                "./cbc:FamilyName",
-                                namespaces=self.parser.nsmap,
-                            )
-                            or ""
-                        )
-                        full_name = f"{first_name} {family_name}".strip()
-
-                        raw_nationality_code = self.parser.find_text(
-                            ubo_element,
-                            "./efac:Nationality/cbc:NationalityID",
-                            namespaces=self.parser.nsmap,
-                        )
-                        processed_nationality_code = (
-                            self.convert_language_code(raw_nationality_code, "country")
-                            if raw_nationality_code
-                            else None
-                        )
-
-                        ubo_info = {
-                            "id": ubo_id,
-                            "name": full_name,
-                            "nationality": processed_nationality_code,
-                        }
-                        phone_info = self.fetch_bt503_ubo_contact(ubo_element)
-                        if phone_info:
-                            ubo_info.update(phone_info)
-
-                        organization.setdefault("beneficialOwners", []).append(ubo_info)
-                        logging.debug(f"Updated organization with UBO: {organization}")
-
-                # Address, Listed on Market, and Company Size
-                organization["address"] = self.process_ubo_address(org_element)
-                organization["listedOnRegulatedMarket"] = (
-                    self.fetch_listed_on_regulated_market(org_element)
-                )
-                organization["scale"] = self.fetch_company_size(org_element)
-
-            return organizations
-
-    def fetch_bt503_touchpoint_contact(self, org_element):
-        telephone = self.parser.find_text(
-            org_element,
-            "./efac:TouchPoint/cac:Contact/cbc:Telephone",
-            namespaces=self.parser.nsmap,
-        )
-        return {"telephone": telephone} if telephone else {}
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Extracted contact point: %s", contact_point)
+        return contact_point
 
     def get_dispatch_date_time(self):
         root = self.parser.root
@@ -1721,11 +1918,11 @@ class TEDtoOCDSConverter:
                 parsed_datetime = datetime.fromisoformat(combined_datetime)
                 return parsed_datetime.isoformat()
             except ValueError as e:
-                logging.error(
-                    f"Error parsing dispatch date/time: {combined_datetime} - {e}"
+                logger.error(
+                    "Error parsing dispatch date/time: %s - %s", combined_datetime, e
                 )
         else:
-            logging.warning("Missing issue date or issue time in the XML.")
+            logger.warning("Missing issue date or issue time in the XML.")
 
         return None
 
@@ -1739,7 +1936,7 @@ class TEDtoOCDSConverter:
                 parsed_date = datetime.fromisoformat(issue_date)
                 return parsed_date.isoformat()
             except ValueError as e:
-                logging.error(f"Error parsing contract signed date: {issue_date} - {e}")
+                logger.error("Error parsing contract signed date: %s - %s", issue_date, e)
         return None
 
     def get_legal_basis(self, element):
@@ -1773,99 +1970,6 @@ class TEDtoOCDSConverter:
 
         return legal_basis
 
-    def fetch_bt506_emails(self, root_element):
-        for org_element in root_element.findall(
-            ".//efac:Organization", namespaces=self.parser.nsmap
-        ):
-            org_id = self.parser.find_text(
-                org_element,
-                "./efac:Company/cac:PartyIdentification/cbc:ID",
-                namespaces=self.parser.nsmap,
-            )
-            if org_id:
-                company_email = self.parser.find_text(
-                    org_element,
-                    "./efac:Company/cac:Contact/cbc:ElectronicMail",
-                    namespaces=self.parser.nsmap,
-                )
-                touchpoint_email = self.parser.find_text(
-                    org_element,
-                    "./efac:TouchPoint/cac:Contact/cbc:ElectronicMail",
-                    namespaces=self.parser.nsmap,
-                )
-
-                if company_email:
-                    self.add_or_update_party(
-                        self.parties,
-                        {"id": org_id, "contactPoint": {"email": company_email}},
-                    )
-
-                if touchpoint_email:
-                    self.add_or_update_party(
-                        self.parties,
-                        {"id": org_id, "contactPoint": {"email": touchpoint_email}},
-                    )
-
-        for ubo_element in root_element.findall(
-            ".//efac:UltimateBeneficialOwner", namespaces=self.parser.nsmap
-        ):
-            ubo_id = self.parser.find_text(
-                ubo_element, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            email = self.parser.find_text(
-                ubo_element,
-                "./cac:Contact/cbc:ElectronicMail",
-                namespaces=self.parser.nsmap,
-            )
-            org_id = self.parser.find_text(
-                ubo_element.getparent(),
-                "./efac:Company/cac:PartyIdentification/cbc:ID",
-                namespaces=self.parser.nsmap,
-            )
-
-            if ubo_id and email:
-                ubo_info = {"id": ubo_id, "email": email}
-
-                organization = next(
-                    (o for o in self.parties if o["id"] == org_id), None
-                )
-                if not organization:
-                    organization = {"id": org_id, "beneficialOwners": [ubo_info]}
-                    self.parties.append(organization)
-                else:
-                    organization.setdefault("beneficialOwners", []).append(ubo_info)
-
-    def fetch_bt505_urls(self, root_element):
-        for org_element in root_element.findall(
-            ".//efac:Organization", namespaces=self.parser.nsmap
-        ):
-            org_id = self.parser.find_text(
-                org_element,
-                "./efac:Company/cac:PartyIdentification/cbc:ID",
-                namespaces=self.parser.nsmap,
-            )
-            if org_id:
-                company_url = self.parser.find_text(
-                    org_element,
-                    "./efac:Company/cbc:WebsiteURI",
-                    namespaces=self.parser.nsmap,
-                )
-                touchpoint_url = self.parser.find_text(
-                    org_element,
-                    "./efac:TouchPoint/cbc:WebsiteURI",
-                    namespaces=self.parser.nsmap,
-                )
-
-                if company_url:
-                    self.add_or_update_party(
-                        self.parties, {"id": org_id, "details": {"url": company_url}}
-                    )
-
-                if touchpoint_url:
-                    self.add_or_update_party(
-                        self.parties, {"id": org_id, "details": {"url": touchpoint_url}}
-                    )
-
     def fetch_urls_for_lot(self, lot_element, scheme_name):
         lot_id = self.parser.find_attribute(lot_element, "./cbc:ID", "schemeName")
         if lot_id == scheme_name:
@@ -1928,20 +2032,17 @@ class TEDtoOCDSConverter:
 
     def add_update_document(self, new_document):
         """Adds or updates the document object in tender.documents list."""
-        found = False
-        for doc in self.tender.get("documents", []):
-            if doc["id"] == new_document["id"]:
-                doc.update(new_document)
-                found = True
-                break
-        if not found:
-            self.tender.setdefault("documents", []).append(new_document)
+        self.release.upsert(
+            self.tender["documents"], new_document, lambda doc, new: doc.update(new)
+        )
 
     def get_or_create_organization(self, parties, org_id, roles=None):
+        if parties is self.parties:
+            return self.release.party(org_id, roles)
         for org in parties:
             if org["id"] == org_id:
                 if roles:
-                    org["roles"] = list(set(org.get("roles", []) + roles))
+                    org["roles"] = merge_roles(org.get("roles", []), roles)
                 return org
         new_org = {"id": org_id, "roles": roles if roles else []}
         parties.append(new_org)
@@ -1950,7 +2051,7 @@ class TEDtoOCDSConverter:
     @staticmethod
     def update_organization(organization, new_info):
         if "roles" in new_info and new_info["roles"]:
-            organization["roles"] = list(set(organization["roles"] + new_info["roles"]))
+            organization["roles"] = merge_roles(organization["roles"], new_info["roles"])
 
         if "address" in new_info and new_info["address"]:
             organization["address"] = new_info["address"]
@@ -1964,50 +2065,8 @@ class TEDtoOCDSConverter:
         if "details" in new_info and new_info["details"]:
             organization["details"] = new_info["details"]
 
-    def process_ubo_address(self, address_element):
-        country_element = self.parser.find_text(
-            address_element,
-            "./cac:Country/cbc:IdentificationCode",
-            namespaces=self.parser.nsmap,
-        )
-        region_element = self.parser.find_text(
-            address_element, "./cbc:CountrySubentityCode", namespaces=self.parser.nsmap
-        )
-        return (
-            {
-                "country": self.convert_language_code(
-                    country_element, code_type="country"
-                ),
-                "region": region_element,
-            }
-            if country_element or region_element
-            else {}
-        )
-
     def get_activity_description(self, activity_code):
-        activity_descriptions = {
-            "airport": "Airport-related activities",
-            "defence": "Defence",
-            "econ-aff": "Economic affairs",
-            "education": "Education",
-            "electricity": "Electricity-related activities",
-            "env-pro": "Environmental protection",
-            "gas-heat": "Production, transport or distribution of gas or heat",
-            "gas-oil": "Extraction of gas or oil",
-            "gen-pub": "General public services",
-            "hc-am": "Housing and community amenities",
-            "health": "Health",
-            "port": "Port-related activities",
-            "post": "Postal services",
-            "pub-os": "Public order and safety",
-            "rail": "Railway services",
-            "rcr": "Recreation, culture and religion",
-            "soc-pro": "Social protection",
-            "solid-fuel": "Exploration or extraction of coal or other solid fuels",
-            "urttb": "Urban railway, tramway, trolleybus or bus services",
-            "water": "Water-related activities",
-        }
-        return activity_descriptions.get(activity_code, "")
+        return ACTIVITY_DESCRIPTIONS.get(activity_code, "")
 
     def parse_activity_authority(self, element):
         activities = []
@@ -2047,78 +2106,13 @@ class TEDtoOCDSConverter:
         return legal_types
 
     def get_buyer_legal_type_description(self, code):
-        # Define a mapping of buyer legal type codes to short descriptions
-        legal_type_mapping = {
-            "body-pl": "Body governed by public law",
-            "body-pl-cga": "Body governed by public law, controlled by a central government authority",
-            "body-pl-la": "Body governed by public law, controlled by a local authority",
-            "body-pl-ra": "Body governed by public law, controlled by a regional authority",
-            "cga": "Central government authority",
-            "def-cont": "Defence contractor",
-            "eu-ins-bod-ag": "EU institution, body or agency",
-            "eu-int-org": "European Institution/Agency or International Organisation",
-            "grp-p-aut": "Group of public authorities",
-            "int-org": "International organisation",
-            "la": "Local authority",
-            "org-sub": "Organisation awarding a contract subsidised by a contracting authority",
-            "org-sub-cga": "Organisation awarding a contract subsidised by a central government authority",
-            "org-sub-la": "Organisation awarding a contract subsidised by a local authority",
-            "org-sub-ra": "Organisation awarding a contract subsidised by a regional authority",
-            "pub-undert": "Public undertaking",
-            "pub-undert-cga": "Public undertaking, controlled by a central government authority",
-            "pub-undert-la": "Public undertaking, controlled by a local authority",
-            "pub-undert-ra": "Public undertaking, controlled by a regional authority",
-            "ra": "Regional authority",
-            "rl-aut": "Regional or local authority",
-            "spec-rights-entity": "Entity with special or exclusive rights",
-        }
-
-        return legal_type_mapping.get(code, "Unknown legal type")
+        return BUYER_LEGAL_TYPE_DESCRIPTIONS.get(code, "Unknown legal type")
 
     def map_activity_code(self, activity_code, activity_description):
         if "COFOG" in activity_description:
             scheme = "COFOG"
-            cofog_mapping = {
-                "gas-oil": "04.2.2",  # Fuel and energy
-                "coal": "04.2.1",  # Mining, manufacturing and construction
-                "electricity": "04.2.2",  # Fuel and energy
-                "gas-heat": "04.2.2",  # Fuel and energy
-                "port": "04.5.2",  # Transport
-                "railway": "04.5.2",  # Transport
-                "urban-transport": "04.5.2",  # Transport
-                "airport": "04.5.2",  # Transport
-                "water": "06.3.0",  # Water supply
-                "environment": "05.0.0",  # Environmental protection
-                "housing": "06.1.0",  # Housing development
-                "health": "07.0.0",  # Health
-                "recreation": "08.0.0",  # Recreation, culture and religion
-                "education": "09.0.0",  # Education
-                "social": "10.0.0",  # Social protection
-                "public-services": "01.0.0",  # General public services
-                "public-order": "03.0.0",  # Public order and safety
-                "defence": "02.0.0",  # Defence
-                "economic": "04.0.0",  # Economic affairs
-                "postal": "04.7.0",  # Other industries
-            }
-            cofog_code = cofog_mapping.get(activity_code, "")
-            un_mapping = {
-                "04.2.2": "12",  # Crude petroleum and natural gas
-                "04.2.1": "11",  # Coal and peat
-                "04.5.2": "64",  # Passenger transport services
-                "06.3.0": "18",  # Natural water
-                "05.0.0": "94",  # Sewage and waste collection, treatment and disposal and other environmental protection services
-                "06.1.0": "72",  # Real estate services
-                "07.0.0": "93",  # Human health and social care services
-                "08.0.0": "96",  # Recreational, cultural and sporting services
-                "09.0.0": "92",  # Education services
-                "10.0.0": "93",  # Human health and social care services
-                "01.0.0": "91",  # Public administration and other services provided to the community as a whole; compulsory social security services
-                "03.0.0": "91",  # Public administration and other services provided to the community as a whole; compulsory social security services
-                "02.0.0": "91",  # Public administration and other services provided to the community as a whole; compulsory social security services
-                "04.0.0": "83",  # Professional, technical and business services (except research, development, legal and accounting services)
-                "04.7.0": "68",  # Postal and courier services
-            }
-            code = un_mapping.get(cofog_code, "")
+            cofog_code = ACTIVITY_COFOG_CODES.get(activity_code, "")
+            code = COFOG_UN_CODES.get(cofog_code, "")
             description = activity_description
         else:
             scheme = "eu-main-activity"
@@ -2129,13 +2123,13 @@ class TEDtoOCDSConverter:
                 code = activity_code
         return scheme, code, description
 
-    def get_form_type(self, element):
-        form_type_code = self.parser.find_attribute(
-            element, ".//cbc:NoticeTypeCode", "listName"
-        )
-        return self.form_type_mapping.get(
-            form_type_code, {"tag": [], "tender_status": "planned"}
-        )
+    def get_form_type_code(self, element):
+        return self.parser.find_attribute(element, ".//cbc:NoticeTypeCode", "listName")
+
+    def get_form_type(self, element, form_type_code=None):
+        if form_type_code is None:
+            form_type_code = self.get_form_type_code(element)
+        return self.form_type_mapping.get(form_type_code, UNKNOWN_FORM_TYPE)
 
     def parse_lots(self, element):
         lots = []
@@ -2166,7 +2160,7 @@ class TEDtoOCDSConverter:
                 "description": self.parser.find_text(
                     lot_element, ".//cac:ProcurementProject/cbc:Description"
                 ),
-                "awardCriteria": self.parse_award_criteria(lot_element),
+                "awardCriteria": self.lot_award_criteria(lot_id, lot_element),
                 "mainProcurementCategory": self.parser.find_text(
                     lot_element,
                     ".//cac:ProcurementProject/cbc:ProcurementTypeCode[@listName='contract-nature']",
@@ -2378,94 +2372,97 @@ class TEDtoOCDSConverter:
             categories.append(category.text)
         return categories
 
-    def parse_award_criteria(self, lot_element):
-        award_criteria = {
-            "weightingDescription": self.parser.find_text(
-                lot_element,
-                ".//cac:TenderingTerms/cac:AwardingTerms/cac:AwardingCriterion/cbc:CalculationExpression",
-            ),
-            "criteria": [],
-        }
-
-        criteria_elements = lot_element.findall(
-            ".//cac:TenderingTerms/cac:AwardingTerms/cac:AwardingCriterion/cac:SubordinateAwardingCriterion",
-            namespaces=self.parser.nsmap,
-        )
-
-        for criterion in criteria_elements:
-            criterion_details = {}
-
-            criterion_type = self.parser.find_text(
-                criterion,
-                "./cbc:AwardingCriterionTypeCode[@listName='award-criterion-type']",
-            )
-            if criterion_type:
-                criterion_details["type"] = criterion_type
+    def lot_award_criteria(self, lot_id, lot_element):
+        """The award criteria fetch_award_criteria mapped for the lot, or extracted now."""
+        lot = self.release.lots.get(lot_id)
+        if lot is not None and "awardCriteria" in lot:
+            return lot["awardCriteria"]
+        return self.extract_award_criteria(lot_element)
 
-            criterion_description = self.parser.find_text(
-                criterion, "./cbc:Description"
-            )
-            if criterion_description:
-                criterion_details["description"] = criterion_description
+    def extract_award_criteria(self, lot_element):
+        """
+        Maps the awarding terms of a lot in one pass: BT-543 to
+        weightingDescription, BT-733 to orderRationale and, for every
+        subordinate criterion, BT-539 type, BT-540 description, BT-734 name
+        and the BT-541 numbers with their BT-5421 weight, BT-5422 fixed or
+        BT-5423 threshold. Returns None when the lot has no award criteria.
+        """
+        nsmap = self.parser.nsmap
+        award_criteria = {"criteria": []}
+        for awarding_criterion in self.parser.find_nodes(
+            lot_element, ".//cac:TenderingTerms/cac:AwardingTerms/cac:AwardingCriterion"
+        ):
+            calculation_expression = awarding_criterion.findtext("cbc:CalculationExpression", namespaces=nsmap)
+            if calculation_expression:
+                award_criteria.setdefault("weightingDescription", calculation_expression)
+            order_rationale = awarding_criterion.findtext("cbc:Description", namespaces=nsmap)
+            if order_rationale:
+                award_criteria.setdefault("orderRationale", order_rationale)
 
-            award_criterion_parameters = criterion.findall(
-                ".//ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:AwardCriterionParameter",
-                namespaces=self.parser.nsmap,
-            )
-            for param in award_criterion_parameters:
-                param_list_name = self.parser.find_attribute(
-                    param, ".//efbc:ParameterCode", "listName"
+            for criterion in awarding_criterion.iterfind("cac:SubordinateAwardingCriterion", nsmap):
+                criterion_details = {}
+                criterion_type = criterion.findtext(
+                    "cbc:AwardingCriterionTypeCode[@listName='award-criterion-type']", namespaces=nsmap
                 )
-                param_value = self.parser.find_text(
-                    param, ".//efbc:ParameterNumeric"
-                ) or self.parser.find_text(param, ".//efbc:ParameterCode")
-
-                if param_list_name and param_value:
-                    number_details = {"number": float(param_value)}
-
-                    if param_list_name == "number-weight":
-                        number_details["weight"] = (
-                            self.map_award_criterion_number_weight(param_value)
-                        )
-                    elif param_list_name == "number-fixed":
-                        number_details["fixed"] = self.map_award_criterion_number_fixed(
-                            param_value
-                        )
-                    elif param_list_name == "number-threshold":
-                        number_details["threshold"] = (
-                            self.map_award_criterion_number_threshold(param_value)
-                        )
-
-                    criterion_details.setdefault("numbers", []).append(number_details)
+                if criterion_type:
+                    criterion_details["type"] = criterion_type
+                description = criterion.findtext("cbc:Description", namespaces=nsmap)
+                if description:
+                    criterion_details["description"] = description
 
-            criterion_name = self.parser.find_text(criterion, "./cbc:Name")
-            if criterion_name:
-                criterion_details["name"] = criterion_name
+                for parameter in criterion.iterfind(
+                    "ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent"
+                    "/efext:EformsExtension/efac:AwardCriterionParameter",
+                    nsmap,
+                ):
+                    number_details = self.parse_award_criterion_parameter(parameter)
+                    if number_details:
+                        criterion_details.setdefault("numbers", []).append(number_details)
 
-            award_criteria["criteria"].append(criterion_details)
+                name = criterion.findtext("cbc:Name", namespaces=nsmap)
+                if name:
+                    criterion_details["name"] = name
+                award_criteria["criteria"].append(criterion_details)
 
-        return award_criteria if award_criteria["criteria"] else None
+        if len(award_criteria) == 1 and not award_criteria["criteria"]:
+            return None
+        # weightingDescription and orderRationale come before the criteria
+        award_criteria["criteria"] = award_criteria.pop("criteria")
+        return award_criteria
+
+    def parse_award_criterion_parameter(self, parameter):
+        nsmap = self.parser.nsmap
+        code = parameter.find("efbc:ParameterCode", nsmap)
+        numeric = parameter.findtext("efbc:ParameterNumeric", namespaces=nsmap)
+        number_details = {}
+        if numeric:
+            number_details["number"] = float(numeric)
+        if code is not None and code.text:
+            list_name = code.get("listName")
+            if list_name == "number-weight":
+                number_details["weight"] = self.map_award_criterion_number_weight(code.text)
+            elif list_name == "number-fixed":
+                number_details["fixed"] = self.map_award_criterion_number_fixed(code.text)
+            elif list_name == "number-threshold":
+                number_details["threshold"] = self.map_award_criterion_number_threshold(code.text)
+        return number_details
+
+    @handles("lot", writes=("lots",))
+    def fetch_award_criteria(self, lot):
+        """Maps BT-539, BT-540, BT-541, BT-5421/5422/5423, BT-543, BT-733 and BT-734."""
+        award_criteria = self.extract_award_criteria(lot)
+        if award_criteria:
+            lot_id = self.parser.find_text(lot, "./cbc:ID", namespaces=self.parser.nsmap)
+            self.add_or_update_lot(self.tender["lots"], {"id": lot_id, "awardCriteria": award_criteria})
 
     def map_award_criterion_number_weight(self, param_value):
-        mapping = {
-            "percentageExact": "percentageExact",
-            # Add more mappings if needed
-        }
-        return mapping.get(param_value, param_value)
+        return AWARD_CRITERION_NUMBER_WEIGHTS.get(param_value, param_value)
 
     def map_award_criterion_number_fixed(self, param_value):
-        mapping = {
-            "total": "total",
-            # Add more mappings if needed
-        }
-        return mapping.get(param_value, param_value)
+        return AWARD_CRITERION_NUMBER_FIXED.get(param_value, param_value)
 
     def map_award_criterion_number_threshold(self, param_value):
-        mapping = {
-            "maximumBids": "maximumBids",
-            # Add more mappings if needed
-        }
-        return mapping.get(param_value, param_value)
+        return AWARD_CRITERION_NUMBER_THRESHOLDS.get(param_value, param_value)
 
     def parse_bt06_lot_strategic_procurement(self, lot_element):
         strategic_procurement_elements = lot_element.findall(
@@ -2495,11 +2492,7 @@ class TEDtoOCDSConverter:
         return sustainability if sustainability else None
 
     def map_strategic_procurement_code(self, code):
-        mapping = {
-            "inn-pur": "economic.innovativePurchase",
-            # Add more mappings if required
-        }
-        return mapping.get(code, code)
+        return STRATEGIC_PROCUREMENT_GOALS.get(code, code)
 
     def fetch_notice_language(self, root_element):
         notice_language_code = self.parser.find_text(
@@ -2511,36 +2504,8 @@ class TEDtoOCDSConverter:
         return None
 
     def convert_language_code(self, code, code_type="language"):
-        language_mapping = {
-            "ENG": "en",
-            "FRA": "fr",
-            "DEU": "de",
-            "ITA": "it",
-            "ESP": "es",
-            "NLD": "nl",
-            "BGR": "bg",
-            "CES": "cs",
-            "DAN": "da",
-            "ELL": "el",
-            "EST": "et",
-            "FIN": "fi",
-            "HUN": "hu",
-            "HRV": "hr",
-            "LAT": "lv",
-            "LIT": "lt",
-            "MLT": "mt",
-            "POL": "pl",
-            "POR": "pt",
-            "RON": "ro",
-            "SLK": "sk",
-            "SLV": "sl",
-            "SWE": "sv",
-            "NOR": "no",
-            "ISL": "is",
-        }
-
         if code_type == "language":
-            return language_mapping.get(code.upper(), code.lower())
+            return LANGUAGE_CODES.get(code.upper(), code.lower())
         return None
 
     def parse_tender_values(self, root):
@@ -2577,53 +2542,41 @@ class TEDtoOCDSConverter:
 
         return tender_values
 
-    def handle_bt14_and_bt707(self, root_element):
-        lots = self.parser.find_nodes(root_element, ".//cac:ProcurementProjectLot")
-        for lot in lots:
-            lot_id = self.parser.find_text(lot, "./cbc:ID")
-            document_elements = self.parser.find_nodes(
-                lot, "./cac:TenderingTerms/cac:CallForTendersDocumentReference"
+    @handles("lot", writes=("documents",))
+    def handle_bt14_and_bt707(self, lot):
+        lot_id = self.parser.find_text(lot, "./cbc:ID")
+        document_elements = self.parser.find_nodes(
+            lot, "./cac:TenderingTerms/cac:CallForTendersDocumentReference"
+        )
+        for document in document_elements:
+            document_id = self.parser.find_text(document, "./cbc:ID")
+            document_type = self.parser.find_text(document, "./cbc:DocumentType")
+            document_type_code = self.parser.find_text(
+                document, "./cbc:DocumentTypeCode"
             )
-            for document in document_elements:
-                document_id = self.parser.find_text(document, "./cbc:ID")
-                document_type = self.parser.find_text(document, "./cbc:DocumentType")
-                document_type_code = self.parser.find_text(
-                    document, "./cbc:DocumentTypeCode"
+            if document_type == "restricted-document":
+                self.tender.setdefault("documents", []).append(
+                    {
+                        "id": document_id,
+                        "documentType": "biddingDocuments",
+                        "accessDetails": "Restricted.",
+                        "relatedLots": [lot_id],
+                    }
                 )
-                if document_type == "restricted-document":
-                    self.tender.setdefault("documents", []).append(
-                        {
-                            "id": document_id,
-                            "documentType": "biddingDocuments",
-                            "accessDetails": "Restricted.",
-                            "relatedLots": [lot_id],
-                        }
+                if document_type_code:
+                    self.tender["documents"][-1]["accessDetails"] = (
+                        self.get_access_details_from_code(document_type_code)
                     )
-                    if document_type_code:
-                        self.tender["documents"][-1]["accessDetails"] = (
-                            self.get_access_details_from_code(document_type_code)
-                        )
 
     def get_access_details_from_code(self, code):
-        access_details_mapping = {
-            "ipr-iss": "Restricted. Intellectual property rights issues",
-            # Add more mappings as needed
-        }
-        return access_details_mapping.get(code, "")
+        return ACCESS_DETAILS.get(code, "")
 
     def add_update_award(self, new_award):
         """
         Updates the internal awards data structure.
         If an award with the given ID exists, it updates it; otherwise, it adds a new entry.
         """
-        found = False
-        for idx, award in enumerate(self.awards):
-            if award["id"] == new_award["id"]:
-                self.awards[idx] = new_award
-                found = True
-                break
-        if not found:
-            self.awards.append(new_award)
+        self.release.replace_award(new_award)
 
     def parse_items(self, lot_element):
         items = []
@@ -2660,17 +2613,7 @@ class TEDtoOCDSConverter:
             namespaces=self.parser.nsmap,
         )
         if procedure_type_code:
-            # Assuming a mapping dictionary or method that maps procedure type code to procurement method
-            procurement_method_mapping = {
-                "open": {"method": "open", "details": "Open procedure"},
-                "restricted": {
-                    "method": "selective",
-                    "details": "Restricted procedure",
-                },
-                "negotiated": {"method": "limited", "details": "Negotiated procedure"},
-                # Add more mappings as needed
-            }
-            return procurement_method_mapping.get(procedure_type_code)
+            return PROCUREMENT_METHODS.get(procedure_type_code)
         return None
 
     def parse_direct_award_justification(self, root_element):
@@ -2784,7 +2727,7 @@ class TEDtoOCDSConverter:
             )
             if uri:
                 document = {
-                    "id": str(len(self.get_contracts()) + 1),
+                    "id": str(len(self.release.contracts) + 1),
                     "documentType": "contractSigned",
                     "url": uri,
                 }
@@ -2915,27 +2858,17 @@ class TEDtoOCDSConverter:
             self.add_update_document(document)
 
     def add_update_contract_document(self, contract_id, document):
-        contract = next(
-            (c for c in self.get_contracts() if c["id"] == contract_id), None
-        )
+        contract = self.release.contract(contract_id)
         if contract:
             contract.setdefault("documents", []).append(document)
         else:
-            self.awards.append({"id": contract_id, "documents": [document]})
+            self.awards.append(Award(id=contract_id, documents=[document]))
 
     def get_contracts(self):
-        return [
-            contract for award in self.awards for contract in award.get("contracts", [])
-        ]
+        return self.release.all_contracts()
 
     def get_direct_award_justification_description(self, code):
-        # Assuming a mapping dictionary or method that maps justification codes to their descriptions
-        justification_mapping = {
-            "ecom-excl": "Specific exclusion in the field of electronic communications",
-            "urgent": "Urgent needs due to unforeseen circumstances",
-            # Add more mappings as needed
-        }
-        return justification_mapping.get(code, "")
+        return DIRECT_AWARD_JUSTIFICATIONS.get(code, "")
 
     def parse_procedure_features(self, root_element):
         return self.parser.find_text(
@@ -3048,262 +2981,53 @@ class TEDtoOCDSConverter:
 
         return items
 
-    def fetch_opt_301_lot_mediator(self, root_element):
-        logger.info(
-            "Fetching OPT-301 Lot Mediator Mediator Technical Identifier Reference"
-        )
-        lots = root_element.findall(
-            ".//cac:ProcurementProjectLot", namespaces=self.parser.nsmap
+    def fetch_opt_301_lot_doc_provider(self, root_element):
+        lots = root_element.xpath(
+            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
+            namespaces=self.parser.nsmap,
         )
         for lot in lots:
-            mediator_id = self.parser.find_text(
+            doc_provider_id = self.parser.find_text(
                 lot,
-                "./cac:TenderingTerms/cac:AppealTerms/cac:MediationParty/cac:PartyIdentification/cbc:ID",
+                ".//cac:TenderingTerms/cac:DocumentProviderParty/cac:PartyIdentification/cbc:ID",
                 namespaces=self.parser.nsmap,
             )
-            if mediator_id:
-                org = self.get_or_create_organization(self.parties, mediator_id)
-                if "mediationBody" not in org["roles"]:
-                    org["roles"].append("mediationBody")
+            if doc_provider_id:
+                existing_org = self.release.parties.get(doc_provider_id)
+                if existing_org:
+                    if "processContactPoint" not in existing_org["roles"]:
+                        existing_org["roles"].append("processContactPoint")
+                else:
+                    self.parties.append(
+                        Party(id=doc_provider_id, roles=["processContactPoint"])
+                    )
 
-    def fetch_opt_301_lot_review_org(self, root_element):
-        logger.info(
-            "Fetching OPT-301 Lot ReviewOrg Review Organization Technical Identifier Reference"
-        )
-        lots = root_element.findall(
-            ".//cac:ProcurementProjectLot", namespaces=self.parser.nsmap
+    @handles("lot", scheme="Part", writes=("documents",))
+    def fetch_opt_301_part_employ_legis(self, part):
+        employ_legis_docs = part.xpath(
+            ".//cac:TenderingTerms/cac:EmploymentLegislationDocumentReference",
+            namespaces=self.parser.nsmap,
         )
-        for lot in lots:
-            review_org_id = self.parser.find_text(
-                lot,
-                "./cac:TenderingTerms/cac:AppealTerms/cac:AppealReceiverParty/cac:PartyIdentification/cbc:ID",
-                namespaces=self.parser.nsmap,
+        for doc in employ_legis_docs:
+            doc_id = self.parser.find_text(
+                doc, "./cbc:ID", namespaces=self.parser.nsmap
             )
-            if review_org_id:
-                org = self.get_or_create_organization(self.parties, review_org_id)
-                if "reviewBody" not in org["roles"]:
-                    org["roles"].append("reviewBody")
-
-    def fetch_opt_301_part_review_org(self, root_element):
-        logger.info(
-            "Fetching OPT-301 Part ReviewOrg Review Organization Technical Identifier Reference"
-        )
-        parts = root_element.findall(
-            ".//cac:ProcurementProjectLot", namespaces=self.parser.nsmap
-        )
-        for part in parts:
-            review_org_id = self.parser.find_text(
-                part,
-                "./cac:TenderingTerms/cac:AppealTerms/cac:AppealReceiverParty/cac:PartyIdentification/cbc:ID",
+            issuer_party_id = self.parser.find_text(
+                doc,
+                "./cac:IssuerParty/cac:PartyIdentification/cbc:ID",
                 namespaces=self.parser.nsmap,
             )
-            if review_org_id:
-                org = self.get_or_create_organization(self.parties, review_org_id)
-                if "reviewBody" not in org["roles"]:
-                    org["roles"].append("reviewBody")
-
-    def fetch_opt_301_part_mediator(self, root_element):
-        logger.info(
-            "Fetching OPT-301 Part Mediator Mediator Technical Identifier Reference"
-        )
-        parts = root_element.findall(
-            ".//cac:ProcurementProjectLot", namespaces=self.parser.nsmap
-        )
-        for part in parts:
-            mediator_id = self.parser.find_text(
-                part,
-                "./cac:TenderingTerms/cac:AppealTerms/cac:MediationParty/cac:PartyIdentification/cbc:ID",
-                namespaces=self.parser.nsmap,
-            )
-            if mediator_id:
-                org = self.get_or_create_organization(self.parties, mediator_id)
-                if "mediationBody" not in org["roles"]:
-                    org["roles"].append("mediationBody")
-
-    def fetch_opt_301_part_review_info(self, root_element):
-        logger.info(
-            "Fetching OPT-301 Part ReviewInfo Review Info Provider Technical Identifier Reference"
-        )
-        parts = root_element.findall(
-            ".//cac:ProcurementProjectLot", namespaces=self.parser.nsmap
-        )
-        for part in parts:
-            review_info_id = self.parser.find_text(
-                part,
-                "./cac:TenderingTerms/cac:AppealTerms/cac:AppealInformationParty/cac:PartyIdentification/cbc:ID",
-                namespaces=self.parser.nsmap,
-            )
-            if review_info_id:
-                org = self.get_or_create_organization(self.parties, review_info_id)
-                if "reviewContactPoint" not in org["roles"]:
-                    org["roles"].append("reviewContactPoint")
-
-    def fetch_opt_301_part_tender_eval(self, root_element):
-        logger.info(
-            "Fetching OPT-301 Part TenderEval Tender Evaluator Technical Identifier Reference"
-        )
-        parts = root_element.findall(
-            ".//cac:ProcurementProjectLot", namespaces=self.parser.nsmap
-        )
-        for part in parts:
-            tender_eval_id = self.parser.find_text(
-                part,
-                "./cac:TenderingTerms/cac:TenderEvaluationParty/cac:PartyIdentification/cbc:ID",
-                namespaces=self.parser.nsmap,
-            )
-            if tender_eval_id:
-                org = self.get_or_create_organization(self.parties, tender_eval_id)
-                if "evaluationBody" not in org["roles"]:
-                    org["roles"].append("evaluationBody")
-
-    def fetch_opt_301_lot_tender_eval(self, root_element):
-        logger.info(
-            "Fetching OPT-301 Lot TenderEval Tender Evaluator Technical Identifier Reference"
-        )
-        lots = root_element.findall(
-            ".//cac:ProcurementProjectLot", namespaces=self.parser.nsmap
-        )
-        for lot in lots:
-            tender_eval_id = self.parser.find_text(
-                lot,
-                "./cac:TenderingTerms/cac:TenderRecipientParty/cac:PartyIdentification/cbc:ID",
-                namespaces=self.parser.nsmap,
-            )
-            if tender_eval_id:
-                org = self.get_or_create_organization(self.parties, tender_eval_id)
-                if "submissionReceiptBody" not in org["roles"]:
-                    org["roles"].append("submissionReceiptBody")
-
-    def fetch_opt_301_lot_review_info(self, root_element):
-        logger.info(
-            "Fetching OPT-301 Lot ReviewInfo Review Info Provider Technical Identifier Reference"
-        )
-        lots = root_element.findall(
-            ".//cac:ProcurementProjectLot", namespaces=self.parser.nsmap
-        )
-        for lot in lots:
-            review_info_id = self.parser.find_text(
-                lot,
-                "./cac:TenderingTerms/cac:AppealTerms/cac:AppealInformationParty/cac:PartyIdentification/cbc:ID",
-                namespaces=self.parser.nsmap,
-            )
-            if review_info_id:
-                org = self.get_or_create_organization(self.parties, review_info_id)
-                if "reviewContactPoint" not in org["roles"]:
-                    org["roles"].append("reviewContactPoint")
-
-    def fetch_opt_301_lot_doc_provider(self, root_element):
-        lots = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=self.parser.nsmap,
-        )
-        for lot in lots:
-            doc_provider_id = self.parser.find_text(
-                lot,
-                ".//cac:TenderingTerms/cac:DocumentProviderParty/cac:PartyIdentification/cbc:ID",
-                namespaces=self.parser.nsmap,
-            )
-            if doc_provider_id:
-                existing_org = next(
-                    (org for org in self.parties if org["id"] == doc_provider_id), None
-                )
-                if existing_org:
-                    if "processContactPoint" not in existing_org["roles"]:
-                        existing_org["roles"].append("processContactPoint")
-                else:
-                    self.parties.append(
-                        {"id": doc_provider_id, "roles": ["processContactPoint"]}
-                    )
-
-    def fetch_opt_301_part_doc_provider(self, root_element):
-        parts = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']",
-            namespaces=self.parser.nsmap,
-        )
-        for part in parts:
-            doc_provider_id = self.parser.find_text(
-                part,
-                ".//cac:TenderingTerms/cac:DocumentProviderParty/cac:PartyIdentification/cbc:ID",
-                namespaces=self.parser.nsmap,
-            )
-            if doc_provider_id:
-                existing_org = next(
-                    (org for org in self.parties if org["id"] == doc_provider_id), None
-                )
-                if existing_org:
-                    if "processContactPoint" not in existing_org["roles"]:
-                        existing_org["roles"].append("processContactPoint")
-                else:
-                    self.parties.append(
-                        {"id": doc_provider_id, "roles": ["processContactPoint"]}
-                    )
-
-    def fetch_opt_301_part_add_info_provider(self, root_element):
-        parts = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']",
-            namespaces=self.parser.nsmap,
-        )
-        for part in parts:
-            additional_info_party_id = self.parser.find_text(
-                part,
-                ".//cac:TenderingTerms/cac:AdditionalInformationParty/cac:PartyIdentification/cbc:ID",
-                namespaces=self.parser.nsmap,
-            )
-            if additional_info_party_id:
-                existing_org = next(
-                    (
-                        org
-                        for org in self.parties
-                        if org["id"] == additional_info_party_id
-                    ),
-                    None,
-                )
-                if existing_org:
-                    if "processContactPoint" not in existing_org["roles"]:
-                        existing_org["roles"].append("processContactPoint")
-                else:
-                    self.parties.append(
-                        {
-                            "id": additional_info_party_id,
-                            "roles": ["processContactPoint"],
-                        }
-                    )
-
-    def fetch_opt_301_part_employ_legis(self, root_element):
-        parts = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']",
-            namespaces=self.parser.nsmap,
-        )
-        for part in parts:
-            employ_legis_docs = part.xpath(
-                ".//cac:TenderingTerms/cac:EmploymentLegislationDocumentReference",
-                namespaces=self.parser.nsmap,
-            )
-            for doc in employ_legis_docs:
-                doc_id = self.parser.find_text(
-                    doc, "./cbc:ID", namespaces=self.parser.nsmap
-                )
-                issuer_party_id = self.parser.find_text(
-                    doc,
-                    "./cac:IssuerParty/cac:PartyIdentification/cbc:ID",
-                    namespaces=self.parser.nsmap,
-                )
-                if doc_id and issuer_party_id:
-                    document = {
-                        "id": doc_id,
-                        "relatedLots": [
-                            self.parser.find_text(
-                                part, "./cbc:ID", namespaces=self.parser.nsmap
-                            )
-                        ],
-                        "publisher": {"id": issuer_party_id},
-                    }
-                    self.add_update_document(document)
-                    organization = self.get_or_create_organization(
-                        self.parties, issuer_party_id
-                    )
-                    if "informationService" not in organization["roles"]:
-                        organization["roles"].append("informationService")
+            if doc_id and issuer_party_id:
+                document = {
+                    "id": doc_id,
+                    "relatedLots": [
+                        self.parser.find_text(
+                            part, "./cbc:ID", namespaces=self.parser.nsmap
+                        )
+                    ],
+                    "publisher": {"id": issuer_party_id},
+                }
+                self.add_update_document(document)
 
     def add_or_update_lot(self, lots, lot_info):
         """
@@ -3311,30 +3035,46 @@ class TEDtoOCDSConverter:
         If a lot with the same ID exists, it updates the existing lot.
         Otherwise, it adds a new lot to the list.
         """
-        for lot in lots:
-            if lot["id"] == lot_info["id"]:
-                for key, value in lot_info.items():
-                    if key in lot and isinstance(value, dict):
-                        lot[key].update(value)
-                    else:
-                        lot[key] = value
-                return
-        lots.append(lot_info)
+
+        def merge(lot, lot_info):
+            for key, value in lot_info.items():
+                if key in lot and isinstance(value, dict):
+                    lot[key].update(value)
+                else:
+                    lot[key] = value
+
+        if lots is self.release.lots:
+            lot_info = Lot.of(lot_info)
+        self.release.upsert(lots, lot_info, merge)
 
     def clean_release_structure(self, data):
-        if isinstance(data, dict):
-            cleaned = {
-                k: self.clean_release_structure(v)
-                for k, v in data.items()
-                if v is not None and v != {} and v != []
-            }
-            return {k: v for k, v in cleaned.items() if v}
-        elif isinstance(data, list):
-            return [
-                self.clean_release_structure(v)
-                for v in data
-                if v is not None and v != {} and v != []
-            ]
+        """
+        Prunes the release in place, in one pass with an explicit stack:
+        objects lose members that are None, empty or otherwise falsy once
+        cleaned, and arrays lose None, {} and [] items. Returns data.
+        """
+        if not isinstance(data, (dict, list)):
+            return data
+        stack = [(data, False)]
+        while stack:
+            node, children_cleaned = stack.pop()
+            if children_cleaned:
+                # Only objects drop members that became empty while cleaning.
+                empty_keys = [key for key, value in node.items() if not value]
+                for key in empty_keys:
+                    del node[key]
+                continue
+
+            if isinstance(node, dict):
+                stack.append((node, True))
+                children = node.values()
+            else:
+                if any(is_empty(item) for item in node):
+                    node[:] = [item for item in node if not is_empty(item)]
+                children = node
+            for child in children:
+                if isinstance(child, (dict, list)) and child:
+                    stack.append((child, False))
         return data
 
     def parse_related_processes(self, root):
@@ -3367,600 +3107,324 @@ class TEDtoOCDSConverter:
             return {"amount": amount, "currency": currency}
         return None
 
-    def fetch_bt88_procurement_method_details(self, root_element):
-        """
-        Fetches BT-88: The main features of the procedure and maps to tender.procurementMethodDetails.
-        """
-        method_details = self.parser.find_text(
-            root_element, ".//cac:TenderingProcess/cbc:Description", namespaces=self.parser.nsmap
+    @handles("lot_result", writes=("awards",))
+    def fetch_bt13713_lotresult(self, lot_result):
+        result_id = self.parser.find_text(
+            lot_result, "./cbc:ID", namespaces=self.parser.nsmap
         )
-        if method_details:
-            self.tender["procurementMethodDetails"] = method_details
-            logging.info(f"Extracted Procurement Method Details: {method_details}")
-
-    def fetch_bt13713_lotresult(self, root_element):
-        lot_results = root_element.findall(
-            ".//efac:NoticeResult/efac:LotResult", namespaces=self.parser.nsmap
-        )
-        for lot_result in lot_results:
-            result_id = self.parser.find_text(
-                lot_result, "./cbc:ID", namespaces=self.parser.nsmap
+        if result_id:
+            lot_id = self.parser.find_text(
+                lot_result, "./efac:TenderLot/cbc:ID", namespaces=self.parser.nsmap
             )
-            if result_id:
-                lot_id = self.parser.find_text(
-                    lot_result, "./efac:TenderLot/cbc:ID", namespaces=self.parser.nsmap
-                )
-                self.add_or_update_award(result_id)
-                self.add_or_update_award_related_lots(result_id, [lot_id])
+            self.add_or_update_award(result_id)
+            self.add_or_update_award_related_lots(result_id, [lot_id])
 
     def add_or_update_award_related_lots(self, award_id, related_lots):
-        award = next((a for a in self.awards if a["id"] == award_id), None)
+        award = self.release.award(award_id)
         if award:
             if "relatedLots" not in award:
                 award["relatedLots"] = []
             award["relatedLots"].extend(related_lots)
 
-    def fetch_bt13714_tender_lot_identifier(self, root_element):
-        lot_tenders = root_element.findall(
-            ".//efac:NoticeResult/efac:LotTender", namespaces=self.parser.nsmap
+    @handles("lot_result", reads=("awards", "lots"))
+    def fetch_bt142_winner_chosen(self, lot_result):
+        result_id = self.parser.find_text(
+            lot_result, "./cbc:ID", namespaces=self.parser.nsmap
         )
-        for lot_tender in lot_tenders:
-            tender_id = self.parser.find_text(
-                lot_tender, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            lot_id = self.parser.find_text(
-                lot_tender, "./efac:TenderLot/cbc:ID", namespaces=self.parser.nsmap
+        if result_id:
+            tender_result_code = self.parser.find_text(
+                lot_result, "./cbc:TenderResultCode", namespaces=self.parser.nsmap
             )
-
-            if tender_id and lot_id:
-                bid = next(
-                    (
-                        bid
-                        for bid in self.tender["bids"]["details"]
-                        if bid["id"] == tender_id
-                    ),
-                    None,
+            if tender_result_code == "selec-w":
+                self.update_award_status(
+                    result_id, "active", "At least one winner was chosen."
                 )
-                if not bid:
-                    bid = {"id": tender_id, "relatedLots": [lot_id]}
-                    self.tender["bids"]["details"].append(bid)
-                else:
-                    if "relatedLots" not in bid:
-                        bid["relatedLots"] = []
-                    if lot_id not in bid["relatedLots"]:
-                        bid["relatedLots"].append(lot_id)
-
-    def fetch_bt171_tender_rank(self, root_element):
-        lot_tenders = root_element.findall(
-            ".//efac:NoticeResult/efac:LotTender", namespaces=self.parser.nsmap
-        )
-        for lot_tender in lot_tenders:
-            tender_id = self.parser.find_text(
-                lot_tender, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            rank_code = self.parser.find_text(
-                lot_tender, "./cbc:RankCode", namespaces=self.parser.nsmap
-            )
-            if tender_id and rank_code:
-                bid = next(
-                    (
-                        bid
-                        for bid in self.tender["bids"]["details"]
-                        if bid["id"] == tender_id
-                    ),
-                    None,
+            elif tender_result_code == "open-nw":
+                self.update_lot_status(result_id, "active")
+            elif tender_result_code == "clos-nw":
+                self.update_award_status(
+                    result_id, "unsuccessful", "No winner chosen."
                 )
-                if bid:
-                    bid["rank"] = int(rank_code)
-                else:
-                    self.tender["bids"]["details"].append(
-                        {"id": tender_id, "rank": int(rank_code)}
-                    )
-
-    def fetch_bt191_country_origin(self, root_element):
-        lot_tenders = root_element.findall(
-            ".//efac:NoticeResult/efac:LotTender", namespaces=self.parser.nsmap
-        )
-        for lot_tender in lot_tenders:
-            tender_id = self.parser.find_text(
-                lot_tender, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            origins = self.parser.find_nodes(
-                lot_tender, "./efac:Origin/efbc:AreaCode", namespaces=self.parser.nsmap
-            )
-            if tender_id and origins:
-                countries_of_origin = [
-                    self.convert_language_code(origin.text, code_type="country")
-                    for origin in origins
-                ]
-                bid = next(
-                    (
-                        bid
-                        for bid in self.tender["bids"]["details"]
-                        if bid["id"] == tender_id
-                    ),
-                    None,
-                )
-                if bid:
-                    bid["countriesOfOrigin"] = countries_of_origin
-                else:
-                    self.tender["bids"]["details"].append(
-                        {"id": tender_id, "countriesOfOrigin": countries_of_origin}
-                    )
-
-    def fetch_bt193_tender_variant(self, root_element):
-        lot_tenders = root_element.findall(
-            ".//efac:NoticeResult/efac:LotTender", namespaces=self.parser.nsmap
-        )
-        for lot_tender in lot_tenders:
-            tender_id = self.parser.find_text(
-                lot_tender, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            tender_variant_indicator = self.parser.find_text(
-                lot_tender,
-                "./efbc:TenderVariantIndicator",
-                namespaces=self.parser.nsmap,
-            )
-            if tender_id and tender_variant_indicator:
-                bid = next(
-                    (
-                        bid
-                        for bid in self.tender["bids"]["details"]
-                        if bid["id"] == tender_id
-                    ),
-                    None,
-                )
-                if bid:
-                    bid["variant"] = tender_variant_indicator.lower() == "true"
-                else:
-                    self.tender["bids"]["details"].append(
-                        {
-                            "id": tender_id,
-                            "variant": tender_variant_indicator.lower() == "true",
-                        }
-                    )
-
-    def fetch_bt3201_tender_identifier(self, root_element):
-        lot_tenders = root_element.findall(
-            ".//efac:NoticeResult/efac:LotTender", namespaces=self.parser.nsmap
-        )
-        for lot_tender in lot_tenders:
-            tender_id = self.parser.find_text(
-                lot_tender, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            tender_reference = self.parser.find_text(
-                lot_tender,
-                "./efac:TenderReference/cbc:ID",
-                namespaces=self.parser.nsmap,
-            )
-            if tender_id and tender_reference:
-                bid = next(
-                    (
-                        bid
-                        for bid in self.tender["bids"]["details"]
-                        if bid["id"] == tender_id
-                    ),
-                    None,
-                )
-                if bid:
-                    bid.setdefault("identifiers", []).append(
-                        {
-                            "id": tender_reference,
-                            "scheme": "{}-TENDERNL".format(
-                                tender_reference.split("/")[0][:2]
-                            ),
-                        }
-                    )
-                else:
-                    self.tender["bids"]["details"].append(
-                        {
-                            "id": tender_id,
-                            "identifiers": [
-                                {
-                                    "id": tender_reference,
-                                    "scheme": "{}-TENDERNL".format(
-                                        tender_reference.split("/")[0][:2]
-                                    ),
-                                }
-                            ],
-                        }
-                    )
-
-    def fetch_bt553_subcontracting_value(self, root_element):
-        lot_tenders = root_element.xpath(
-            ".//efac:NoticeResult/efac:LotTender", namespaces=self.parser.nsmap
-        )
-        for lot_tender in lot_tenders:
-            tender_id = self.parser.find_text(
-                lot_tender, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            subcontracting_term = self.parser.find_text(
-                lot_tender,
-                "./efac:SubcontractingTerm[efbc:TermCode/@listName='applicability']/efbc:TermAmount",
-                namespaces=self.parser.nsmap,
-            )
-            currency_id = self.parser.find_attribute(
-                lot_tender, "./efac:SubcontractingTerm/efbc:TermAmount", "currencyID"
-            )
-            if tender_id and subcontracting_term and currency_id:
-                bid = next(
-                    (b for b in self.tender["bids"]["details"] if b["id"] == tender_id),
-                    None,
-                )
-                if bid:
-                    bid.setdefault("subcontracting", {})["value"] = {
-                        "amount": float(subcontracting_term),
-                        "currency": currency_id,
-                    }
-                else:
-                    self.tender["bids"]["details"].append(
-                        {
-                            "id": tender_id,
-                            "subcontracting": {
-                                "value": {
-                                    "amount": float(subcontracting_term),
-                                    "currency": currency_id,
-                                }
-                            },
-                        }
-                    )
-
-    def fetch_bt554_subcontracting_description(self, root_element):
-        lot_tenders = root_element.xpath(
-            ".//efac:NoticeResult/efac:LotTender", namespaces=self.parser.nsmap
-        )
-        for lot_tender in lot_tenders:
-            tender_id = self.parser.find_text(
-                lot_tender, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            subcontracting_desc = self.parser.find_text(
-                lot_tender,
-                "./efac:SubcontractingTerm/efbc:TermDescription",
-                namespaces=self.parser.nsmap,
-            )
-            if tender_id and subcontracting_desc:
-                bid = next(
-                    (b for b in self.tender["bids"]["details"] if b["id"] == tender_id),
-                    None,
-                )
-                if bid:
-                    bid.setdefault("subcontracting", {})[
-                        "description"
-                    ] = subcontracting_desc
-                else:
-                    self.tender["bids"]["details"].append(
-                        {
-                            "id": tender_id,
-                            "subcontracting": {"description": subcontracting_desc},
-                        }
-                    )
-
-    def fetch_bt142_winner_chosen(self, root_element):
-        lot_results = root_element.findall(
-            ".//efac:NoticeResult/efac:LotResult", namespaces=self.parser.nsmap
-        )
-        for lot_result in lot_results:
-            result_id = self.parser.find_text(
-                lot_result, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            if result_id:
-                tender_result_code = self.parser.find_text(
-                    lot_result, "./cbc:TenderResultCode", namespaces=self.parser.nsmap
-                )
-                if tender_result_code == "selec-w":
-                    self.update_award_status(
-                        result_id, "active", "At least one winner was chosen."
-                    )
-                elif tender_result_code == "open-nw":
-                    self.update_lot_status(result_id, "active")
-                elif tender_result_code == "clos-nw":
-                    self.update_award_status(
-                        result_id, "unsuccessful", "No winner chosen."
-                    )
 
     def update_award_status(self, award_id, status, status_details=None):
-        award = next((a for a in self.awards if a["id"] == award_id), None)
+        award = self.release.award(award_id)
         if award:
             award["status"] = status
             if status_details:
                 award["statusDetails"] = status_details
 
     def update_lot(self, lots, lot_info):
-        found_lot = False
-        for lot in lots:
-            if lot["id"] == lot_info["id"]:
-                for key, value in lot_info.items():
-                    if isinstance(lot.get(key), dict) and isinstance(value, dict):
-                        lot[key].update(value)
-                    else:
-                        lot[key] = value
-                found_lot = True
-                break
-        if not found_lot:
-            lots.append(lot_info)
+        def merge(lot, lot_info):
+            for key, value in lot_info.items():
+                if isinstance(lot.get(key), dict) and isinstance(value, dict):
+                    lot[key].update(value)
+                else:
+                    lot[key] = value
 
-    def fetch_bt144_not_awarded_reason(self, root_element):
-        lot_results = root_element.findall(
-            ".//efac:NoticeResult/efac:LotResult", namespaces=self.parser.nsmap
+        self.release.upsert(lots, lot_info, merge)
+
+    @handles("lot_result", reads=("awards",))
+    def fetch_bt144_not_awarded_reason(self, lot_result):
+        result_id = self.parser.find_text(
+            lot_result, "./cbc:ID", namespaces=self.parser.nsmap
         )
-        for lot_result in lot_results:
-            result_id = self.parser.find_text(
-                lot_result, "./cbc:ID", namespaces=self.parser.nsmap
+        if result_id:
+            decision_reason_code = self.parser.find_text(
+                lot_result,
+                "./efac:DecisionReason/efbc:DecisionReasonCode",
+                namespaces=self.parser.nsmap,
             )
-            if result_id:
-                decision_reason_code = self.parser.find_text(
-                    lot_result,
-                    "./efac:DecisionReason/efbc:DecisionReasonCode",
-                    namespaces=self.parser.nsmap,
+            if decision_reason_code:
+                self.update_award_status(
+                    result_id,
+                    "unsuccessful",
+                    self.get_non_award_reason(decision_reason_code),
                 )
-                if decision_reason_code:
-                    self.update_award_status(
-                        result_id,
-                        "unsuccessful",
-                        self.get_non_award_reason(decision_reason_code),
-                    )
 
     def get_non_award_reason(self, code):
-        reasons = {
-            "no-rece": "No tenders, requests to participate or projects were received",
-            # Add other mappings as needed
-        }
-        return reasons.get(code, "Unknown reason")
+        return NON_AWARD_REASONS.get(code, "Unknown reason")
 
-    def fetch_bt1451_winner_decision_date(self, root_element):
-        settled_contracts = root_element.findall(
-            ".//efac:NoticeResult/efac:SettledContract", namespaces=self.parser.nsmap
+    @handles("settled_contract", reads=("awards",))
+    def fetch_bt1451_winner_decision_date(self, contract):
+        contract_id = self.parser.find_text(
+            contract, "./cbc:ID", namespaces=self.parser.nsmap
         )
-        for contract in settled_contracts:
-            contract_id = self.parser.find_text(
-                contract, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            award_date = self.parser.find_text(
-                contract, "./cbc:AwardDate", namespaces=self.parser.nsmap
-            )
-            if contract_id and award_date:
-                lot_results = contract.xpath(
-                    "ancestor::efac:NoticeResult/efac:LotResult[efac:SettledContract/cbc:ID='"
-                    + contract_id
-                    + "']",
-                    namespaces=self.parser.nsmap,
+        award_date = self.parser.find_text(
+            contract, "./cbc:AwardDate", namespaces=self.parser.nsmap
+        )
+        if contract_id and award_date:
+            lot_results = self.parser.index.lot_results_by_contract.get(contract_id, [])
+            for lot_result in lot_results:
+                result_id = self.parser.find_text(
+                    lot_result, "./cbc:ID", namespaces=self.parser.nsmap
                 )
-                for lot_result in lot_results:
-                    result_id = self.parser.find_text(
-                        lot_result, "./cbc:ID", namespaces=self.parser.nsmap
-                    )
-                    if result_id:
-                        self.update_award_date(result_id, award_date)
+                if result_id:
+                    self.update_award_date(result_id, award_date)
 
     def update_award_date(self, award_id, date):
-        award = next((a for a in self.awards if a["id"] == award_id), None)
+        award = self.release.award(award_id)
         if award:
             existing_date = award.get("date")
             new_date = parse_iso_date(date).isoformat() if date else None
             if not existing_date or (new_date and new_date < existing_date):
                 award["date"] = new_date
 
-    def fetch_bt163_concession_value_description(self, root_element):
-        lot_tenders = root_element.findall(
-            ".//efac:NoticeResult/efac:LotTender", namespaces=self.parser.nsmap
+    @handles("lot_tender", reads=("awards",))
+    def fetch_bt163_concession_value_description(self, lot_tender):
+        tender_id = self.parser.find_text(
+            lot_tender, "./cbc:ID", namespaces=self.parser.nsmap
         )
-        for lot_tender in lot_tenders:
-            tender_id = self.parser.find_text(
-                lot_tender, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            value_description = self.parser.find_text(
-                lot_tender,
-                "./efac:ConcessionRevenue/efbc:ValueDescription",
-                namespaces=self.parser.nsmap,
-            )
-            if tender_id and value_description:
-                lot_result_id = self.parser.find_text(
-                    lot_tender.getparent(),
-                    "./efac:LotResult/cbc:ID",
-                    namespaces=self.parser.nsmap,
+        value_description = self.parser.find_text(
+            lot_tender,
+            "./efac:ConcessionRevenue/efbc:ValueDescription",
+            namespaces=self.parser.nsmap,
+        )
+        if tender_id and value_description:
+            for lot_result_id in self.tender_result_ids(tender_id):
+                self.add_or_update_concession_value_description(
+                    lot_result_id, value_description
                 )
-                if lot_result_id:
-                    self.add_or_update_concession_value_description(
-                        lot_result_id, value_description
-                    )
+
+    def tender_result_ids(self, tender_id):
+        """
+        Returns the ids of the lot results whose settled contracts include
+        the given tender, through the element index, so that each tender's
+        figures reach its own award rather than the notice's first one.
+        """
+        index = self.parser.index
+        result_ids = []
+        for settled_contract in index.settled_contracts_by_tender.get(tender_id, ()):
+            contract_id = settled_contract.findtext("cbc:ID", namespaces=self.parser.nsmap)
+            for lot_result in index.lot_results_by_contract.get(contract_id, ()):
+                result_id = lot_result.findtext("cbc:ID", namespaces=self.parser.nsmap)
+                if result_id and result_id not in result_ids:
+                    result_ids.append(result_id)
+        return result_ids
 
     def add_or_update_concession_value_description(self, award_id, description):
-        award = next((a for a in self.awards if a["id"] == award_id), None)
+        award = self.release.award(award_id)
         if award:
             award["valueCalculationMethod"] = description
 
-    def fetch_bt3202_contract_tender_reference(self, root_element):
-        logger.info("Fetching BT-3202 Contract Tender ID (Reference)")
-        settled_contracts = root_element.findall(
-            ".//efac:NoticeResult/efac:SettledContract", namespaces=self.parser.nsmap
+    @handles("settled_contract", reads=("contracts",))
+    def fetch_bt3202_contract_tender_reference(self, contract):
+        contract_id = self.parser.find_text(
+            contract, "./cbc:ID", namespaces=self.parser.nsmap
         )
-        for contract in settled_contracts:
-            tender_id = self.parser.find_text(
-                contract, "./efac:LotTender/cbc:ID", namespaces=self.parser.nsmap
-            )
-            contract_id = self.parser.find_text(
-                contract, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            if tender_id and contract_id:
-                self.add_or_update_contract_related_bids(contract_id, tender_id)
-                self.handle_tendering_party(contract_id, tender_id)
-                logger.debug(f"Processed contract {contract_id} with tender ID {tender_id}")
+        if not contract_id:
+            return
+        for tender_id in contract.iterfind("efac:LotTender/cbc:ID", self.parser.nsmap):
+            if tender_id.text:
+                self.add_or_update_contract_related_bids(contract_id, tender_id.text)
 
     def fetch_organisations_roles(self, org_id, roles):
         org = self.get_or_create_organization(self.parties, org_id, roles)
         return org
 
     def add_or_update_contract_related_bids(self, contract_id, tender_id):
-        contract = next(
-            (c for c in self.get_contracts() if c["id"] == contract_id), None
-        )
-        if not contract:
-            contract = {"id": contract_id, "relatedBids": []}
-            self.get_contracts().append(contract)
-        if tender_id not in contract["relatedBids"]:
-            contract["relatedBids"].append(tender_id)
-        logger.debug(f"Added contract {contract_id} with related tender ID {tender_id}")
-
-    def add_or_update_contract(self, contract_id, contract_info):
-        found = False
-        if not self.awards:
-            self.awards.append({"id": str(uuid.uuid4()), "contracts": []})
-
-        for award in self.awards:
-            if "contracts" not in award:
-                award["contracts"] = []
-
-            for contract in award["contracts"]:
-                if contract["id"] == contract_id:
-                    contract.update(contract_info)
-                    found = True
-                    break
-
-            if not found:
-                award["contracts"].append({"id": contract_id, **contract_info})
+        contract = self.release.contract(contract_id)
+        if contract is None:
             return
+        related_bids = contract.setdefault("relatedBids", [])
+        if tender_id not in related_bids:
+            related_bids.append(tender_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Added contract %s with related tender ID %s", contract_id, tender_id)
 
-        new_award = {
-            "id": str(uuid.uuid4()),
-            "contracts": [{"id": contract_id, **contract_info}],
-        }
-        self.awards.append(new_award)
-
-    def assign_supplier_to_contract(self, contract_id, supplier_id):
-        for award in self.awards:
-            for contract in award.get("contracts", []):
-                if contract["id"] == contract_id:
-                    self.add_supplier_to_award(award["id"], supplier_id)
+    def join_results(self):
+        """
+        Links the contracts to their awards once every handler has run. The
+        element index already maps LotResult to SettledContract, LotTender
+        and TenderingParty ids to elements, so each contract gets its awardID
+        from the lot result that settles it, and that award gets the
+        contract's signatories as buyers and the tenderers of its bids as
+        suppliers, in one pass over the contracts.
+        """
+        index = self.parser.index
+        nsmap = self.parser.nsmap
+        linked = {}
+        for contract_id, contract in self.release.contracts.items():
+            award = None
+            for lot_result in index.lot_results_by_contract.get(contract_id, ()):
+                award = self.release.award(lot_result.findtext("cbc:ID", namespaces=nsmap))
+                if award is not None:
+                    break
+            if award is not None:
+                contract["awardID"] = award["id"]
+                buyers, suppliers = linked.setdefault(award["id"], (set(), set()))
+
+            settled_contract = index.settled_contracts.get(contract_id)
+            if award is not None and settled_contract is not None:
+                for signatory_id in settled_contract.iterfind(
+                    "cac:SignatoryParty/cac:PartyIdentification/cbc:ID", nsmap
+                ):
+                    if signatory_id.text and signatory_id.text not in buyers:
+                        buyers.add(signatory_id.text)
+                        award.setdefault("buyers", []).append({"id": signatory_id.text})
+
+            for tender_id in contract.get("relatedBids", ()):
+                lot_tender = index.lot_tenders.get(tender_id)
+                if lot_tender is None:
+                    continue
+                tendering_party = index.tendering_parties.get(
+                    lot_tender.findtext("efac:TenderingParty/cbc:ID", namespaces=nsmap)
+                )
+                if tendering_party is None:
+                    continue
+                for tenderer_id in tendering_party.iterfind("efac:Tenderer/cbc:ID", nsmap):
+                    supplier_id = tenderer_id.text
+                    if not supplier_id:
+                        continue
+                    self.get_or_create_organization(
+                        self.parties, supplier_id, roles=["supplier", "tenderer"]
+                    )
+                    if award is not None and supplier_id not in suppliers:
+                        suppliers.add(supplier_id)
+                        award.setdefault("suppliers", []).append({"id": supplier_id})
 
-    def add_supplier_to_award(self, award_id, supplier_id):
-        award = next((a for a in self.awards if a["id"] == award_id), None)
-        if award:
-            if "suppliers" not in award:
-                award["suppliers"] = []
-            if not any(s["id"] == supplier_id for s in award["suppliers"]):
-                award["suppliers"].append({"id": supplier_id})
+    def add_or_update_contract(self, contract_id, contract_info):
+        contract = self.release.contract(contract_id)
+        if contract is not None:
+            contract.update(contract_info)
+        else:
+            self.release.add_contract({"id": contract_id, **contract_info})
 
-    def fetch_bt660_framework_re_estimated_value(self, root_element):
-        lot_results = root_element.findall(
-            ".//efac:NoticeResult/efac:LotResult", namespaces=self.parser.nsmap
+    @handles("lot_result", reads=("awards",))
+    def fetch_bt660_framework_re_estimated_value(self, lot_result):
+        result_id = self.parser.find_text(
+            lot_result, "./cbc:ID", namespaces=self.parser.nsmap
         )
-        for lot_result in lot_results:
-            result_id = self.parser.find_text(
-                lot_result, "./cbc:ID", namespaces=self.parser.nsmap
+        if result_id:
+            reestimated_value_element = lot_result.find(
+                "./efac:FrameworkAgreementValues/efbc:ReestimatedValueAmount",
+                namespaces=self.parser.nsmap,
             )
-            if result_id:
-                reestimated_value_element = lot_result.find(
-                    "./efac:FrameworkAgreementValues/efbc:ReestimatedValueAmount",
-                    namespaces=self.parser.nsmap,
+            if reestimated_value_element is not None:
+                reestimated_value = (
+                    float(reestimated_value_element.text)
+                    if reestimated_value_element.text
+                    else None
                 )
-                if reestimated_value_element is not None:
-                    reestimated_value = (
-                        float(reestimated_value_element.text)
-                        if reestimated_value_element.text
-                        else None
+                currency_id = reestimated_value_element.get("currencyID")
+                if reestimated_value and currency_id:
+                    self.update_award_estimated_value(
+                        result_id, reestimated_value, currency_id
                     )
-                    currency_id = reestimated_value_element.get("currencyID")
-                    if reestimated_value and currency_id:
-                        self.update_award_estimated_value(
-                            result_id, reestimated_value, currency_id
-                        )
 
     def update_award_estimated_value(self, award_id, amount, currency):
-        award = next((a for a in self.awards if a["id"] == award_id), None)
+        award = self.release.award(award_id)
         if award:
             award["estimatedValue"] = {"amount": amount, "currency": currency}
 
-    def fetch_bt709_framework_maximum_value(self, root_element):
-        lot_results = root_element.findall(
-            ".//efac:NoticeResult/efac:LotResult", namespaces=self.parser.nsmap
+    @handles("lot_result", reads=("awards",))
+    def fetch_bt709_framework_maximum_value(self, lot_result):
+        result_id = self.parser.find_text(
+            lot_result, "./cbc:ID", namespaces=self.parser.nsmap
         )
-        for lot_result in lot_results:
-            result_id = self.parser.find_text(
-                lot_result, "./cbc:ID", namespaces=self.parser.nsmap
+        if result_id:
+            maximum_value_element = lot_result.find(
+                "./efac:FrameworkAgreementValues/cbc:MaximumValueAmount",
+                namespaces=self.parser.nsmap,
             )
-            if result_id:
-                maximum_value_element = lot_result.find(
-                    "./efac:FrameworkAgreementValues/cbc:MaximumValueAmount",
-                    namespaces=self.parser.nsmap,
+            if maximum_value_element is not None:
+                maximum_value = (
+                    float(maximum_value_element.text)
+                    if maximum_value_element.text
+                    else None
                 )
-                if maximum_value_element is not None:
-                    maximum_value = (
-                        float(maximum_value_element.text)
-                        if maximum_value_element.text
-                        else None
+                currency_id = maximum_value_element.get("currencyID")
+                if maximum_value and currency_id:
+                    self.update_award_maximum_value(
+                        result_id, maximum_value, currency_id
                     )
-                    currency_id = maximum_value_element.get("currencyID")
-                    if maximum_value and currency_id:
-                        self.update_award_maximum_value(
-                            result_id, maximum_value, currency_id
-                        )
 
     def update_award_maximum_value(self, award_id, amount, currency):
-        award = next((a for a in self.awards if a["id"] == award_id), None)
+        award = self.release.award(award_id)
         if award:
             award["maximumValue"] = {"amount": amount, "currency": currency}
 
-    def fetch_bt720_tender_value(self, root_element):
-        lot_tenders = root_element.findall(
-            ".//efac:NoticeResult/efac:LotTender", namespaces=self.parser.nsmap
+    @handles("lot_tender", reads=("awards",))
+    def fetch_bt720_tender_value(self, lot_tender):
+        tender_id = self.parser.find_text(
+            lot_tender, "./cbc:ID", namespaces=self.parser.nsmap
         )
-        for lot_tender in lot_tenders:
-            tender_id = self.parser.find_text(
-                lot_tender, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            payable_amount_element = lot_tender.find(
-                "./cac:LegalMonetaryTotal/cbc:PayableAmount",
-                namespaces=self.parser.nsmap,
-            )
-            if tender_id and payable_amount_element is not None:
-                payable_amount = (
-                    float(payable_amount_element.text)
-                    if payable_amount_element.text
-                    else None
-                )
-                currency_id = payable_amount_element.get("currencyID")
-                if payable_amount and currency_id:
-                    result_id = self.parser.find_text(
-                        lot_tender.getparent(),
-                        "./efac:LotResult/cbc:ID",
-                        namespaces=self.parser.nsmap,
-                    )
-                    if result_id:
-                        self.update_bid_value(tender_id, payable_amount, currency_id)
-                        self.update_award_value(result_id, payable_amount, currency_id)
-
-    def update_bid_value(self, bid_id, amount, currency):
-        bid = next(
-            (b for b in self.tender["bids"]["details"] if b["id"] == bid_id), None
+        payable_amount_element = lot_tender.find(
+            "./cac:LegalMonetaryTotal/cbc:PayableAmount",
+            namespaces=self.parser.nsmap,
         )
-        if bid:
-            bid["value"] = {"amount": amount, "currency": currency}
+        if tender_id and payable_amount_element is not None:
+            payable_amount = (
+                float(payable_amount_element.text)
+                if payable_amount_element.text
+                else None
+            )
+            currency_id = payable_amount_element.get("currencyID")
+            if payable_amount and currency_id:
+                for result_id in self.tender_result_ids(tender_id):
+                    self.update_award_value(result_id, payable_amount, currency_id)
 
     def update_award_value(self, award_id, amount, currency):
-        award = next((a for a in self.awards if a["id"] == award_id), None)
+        award = self.release.award(award_id)
         if award:
             award["value"] = {"amount": amount, "currency": currency}
 
-    def fetch_bt735_cvd_contract_type(self, root_element):
-        lot_results = root_element.findall(
-            ".//efac:NoticeResult/efac:LotResult", namespaces=self.parser.nsmap
+    @handles("lot_result", reads=("awards",))
+    def fetch_bt735_cvd_contract_type(self, lot_result):
+        result_id = self.parser.find_text(
+            lot_result, "./cbc:ID", namespaces=self.parser.nsmap
         )
-        for lot_result in lot_results:
-            result_id = self.parser.find_text(
-                lot_result, "./cbc:ID", namespaces=self.parser.nsmap
+        if result_id:
+            cvd_contract_type = self.parser.find_text(
+                lot_result,
+                "./efac:StrategicProcurement/efac:StrategicProcurementInformation/efbc:ProcurementCategoryCode",
+                namespaces=self.parser.nsmap,
             )
-            if result_id:
-                cvd_contract_type = self.parser.find_text(
-                    lot_result,
-                    "./efac:StrategicProcurement/efac:StrategicProcurementInformation/efbc:ProcurementCategoryCode",
-                    namespaces=self.parser.nsmap,
-                )
-                if cvd_contract_type:
-                    self.add_cv_contract_type(result_id, cvd_contract_type)
+            if cvd_contract_type:
+                self.add_cv_contract_type(result_id, cvd_contract_type)
 
     def add_cv_contract_type(self, award_id, cvd_contract_type):
         item_id = 1
-        award = next((a for a in self.awards if a["id"] == award_id), None)
+        award = self.release.award(award_id)
         if award:
             classification = {
                 "scheme": "eu-cvd-contract-type",
@@ -3972,11 +3436,7 @@ class TEDtoOCDSConverter:
             item_id += 1
 
     def get_contract_type_description(self, code):
-        descriptions = {
-            "oth-serv-contr": "other service contract",
-            # Add other mappings as required
-        }
-        return descriptions.get(code, "Unknown contract type")
+        return CVD_CONTRACT_TYPES.get(code, "Unknown contract type")
 
     def update_party_roles(self, org_id, roles):
         organization = self.get_or_create_organization(self.parties, org_id)
@@ -3984,59 +3444,43 @@ class TEDtoOCDSConverter:
             if role not in organization["roles"]:
                 organization["roles"].append(role)
 
-    def fetch_opt_320_lotresult_tender_reference(self, root_element):
-        lot_results = root_element.findall(
-            ".//efac:NoticeResult/efac:LotResult", namespaces=self.parser.nsmap
+    @handles("lot_result", reads=("awards",))
+    def fetch_opt_320_lotresult_tender_reference(self, lot_result):
+        lot_tender_ids = lot_result.findall(
+            "./efac:LotTender/cbc:ID", namespaces=self.parser.nsmap
         )
-        for lot_result in lot_results:
-            lot_tender_ids = lot_result.findall(
-                "./efac:LotTender/cbc:ID", namespaces=self.parser.nsmap
+        if lot_tender_ids:
+            result_id = self.parser.find_text(
+                lot_result, "./cbc:ID", namespaces=self.parser.nsmap
             )
-            if lot_tender_ids:
-                result_id = self.parser.find_text(
-                    lot_result, "./cbc:ID", namespaces=self.parser.nsmap
-                )
-                for tender_id in lot_tender_ids:
-                    if result_id and tender_id:
-                        self.add_tender_id_to_award(result_id, tender_id.text)
+            for tender_id in lot_tender_ids:
+                if result_id and tender_id:
+                    self.add_tender_id_to_award(result_id, tender_id.text)
 
     def add_tender_id_to_award(self, award_id, tender_id):
-        award = next((a for a in self.awards if a["id"] == award_id), None)
+        award = self.release.award(award_id)
         if award:
             if "relatedBids" not in award:
                 award["relatedBids"] = []
             if tender_id not in award["relatedBids"]:
                 award["relatedBids"].append(tender_id)
 
-    def fetch_opt_322_lotresult_technical_identifier(self, root_element):
-        lot_results = root_element.findall(
-            ".//efac:NoticeResult/efac:LotResult", namespaces=self.parser.nsmap
+    @handles("lot_result", writes=("awards",))
+    def fetch_opt_322_lotresult_technical_identifier(self, lot_result):
+        result_id = self.parser.find_text(
+            lot_result, "./cbc:ID", namespaces=self.parser.nsmap
         )
-        for lot_result in lot_results:
-            result_id = self.parser.find_text(
-                lot_result, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            if result_id:
-                self.add_or_update_award(result_id)
+        if result_id:
+            self.add_or_update_award(result_id)
 
     def add_or_update_award(self, award_id):
-        award = next((a for a in self.awards if a["id"] == award_id), None)
+        award = self.release.award(award_id)
         if not award:
-            self.awards.append({"id": award_id, "relatedLots": []})
+            self.awards.append(Award(id=award_id, relatedLots=[]))
 
     def fetch_opt_315_contract_identifier(self, root_element):
-        settled_contracts = root_element.findall(
-            ".//efac:SettledContract", namespaces=self.parser.nsmap
-        )
-        for contract in settled_contracts:
-            contract_id = self.parser.find_text(
-                contract, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-
-            if not contract_id:
-                logging.warning("Contract ID not found, skipping this contract.")
-                continue
-
+        index = self.parser.index
+        for contract_id, contract in index.settled_contracts.items():
             # Default variables for potential missing fields
             issue_date = contract_signed_date = contract_reference = contract_url = (
                 revenue_buyer_amount
@@ -4116,7 +3560,7 @@ class TEDtoOCDSConverter:
                 "documents": (
                     [
                         {
-                            "id": str(uuid.uuid4()),
+                            "id": self.release.ids.new_id("contract-document", contract),
                             "url": contract_url,
                             "documentType": "contractSigned",
                         }
@@ -4139,728 +3583,301 @@ class TEDtoOCDSConverter:
                     if public_transport_distance
                     else None
                 ),
-                "relatedBids": ["TEN-0001"],  # Example, adjust as needed
-            }
-
-            if framework_notice_id:
-                contract_info.setdefault("relatedProcesses", []).append(
-                    {
-                        "id": str(uuid.uuid4()),
-                        "relationship": ["framework"],
-                        "identifier": framework_notice_id,
-                        "scheme": "internal",
-                    }
-                )
-
-            lot_results = contract.xpath(
-                "ancestor::efac:NoticeResult/efac:LotResult[efac:SettledContract/cbc:ID='"
-                + contract_id
-                + "']",
-                namespaces=self.parser.nsmap,
-            )
-            for lot_result in lot_results:
-                result_id = self.parser.find_text(
-                    lot_result, "./cbc:ID", namespaces=self.parser.nsmap
-                )
-                if result_id:
-                    self.add_or_update_contract(result_id, contract_info)
-
-    def fetch_bt200_contract_modification(self, root_element):
-        contract_mods = root_element.findall(
-            ".//efac:ContractModification", namespaces=self.parser.nsmap
-        )
-        for mod in contract_mods:
-            contract_id = self.parser.find_text(
-                mod,
-                ".//efac:Change/efac:ChangedSection/efbc:ChangeSectionIdentifier",
-                namespaces=self.parser.nsmap,
-            )
-            reason_codes = mod.findall(
-                ".//efac:ChangeReason/cbc:ReasonCode", namespaces=self.parser.nsmap
-            )
-            reason_descriptions = mod.findall(
-                ".//efac:ChangeReason/efbc:ReasonDescription",
-                namespaces=self.parser.nsmap,
-            )
-            change_descriptions = mod.findall(
-                ".//efac:Change/efbc:ChangeDescription", namespaces=self.parser.nsmap
-            )
-
-            if contract_id:
-                contract = self.get_or_create_contract(contract_id)
-                for idx, reason_code in enumerate(reason_codes):
-                    amendment_id = str(uuid.uuid4())
-                    amendment = {
-                        "id": amendment_id,
-                        "rationaleClassifications": [
-                            {
-                                "id": reason_code.text,
-                                "description": self.get_modification_reason_description(
-                                    reason_code.text
-                                ),
-                                "scheme": "modification justification",
-                            }
-                        ],
-                        "rationale": (
-                            reason_descriptions[idx].text
-                            if idx < len(reason_descriptions)
-                            else None
-                        ),
-                        "description": (
-                            change_descriptions[idx].text
-                            if idx < len(change_descriptions)
-                            else None
-                        ),
-                    }
-                    contract.setdefault("amendments", []).append(amendment)
-
-    def get_modification_reason_description(self, code):
-        reason_descriptions = {
-            "add-wss": "Need for additional works, services or supplies by the original contractor.",
-            # More values as needed
-        }
-        return reason_descriptions.get(code, "Unknown modification reason")
-
-    def get_or_create_contract(self, contract_id):
-        for award in self.awards:
-            for contract in award.get("contracts", []):
-                if contract["id"] == contract_id:
-                    return contract
-        new_contract = {
-            "id": contract_id,
-            "awardID": None,  # This will be set later during lot result processing
-        }
-        if not self.awards:
-            self.awards.append({"id": str(uuid.uuid4()), "contracts": [new_contract]})
-        else:
-            self.awards[0]["contracts"].append(new_contract)
-        return new_contract
-
-    def fetch_bt775_social_procurement(self, root_element):
-        lots = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=self.parser.nsmap,
-        )
-        for lot in lots:
-            codes = lot.xpath(
-                ".//cac:ProcurementProject/cac:ProcurementAdditionalType[cbc:ProcurementTypeCode/@listName='social-objective']/cbc:ProcurementTypeCode",
-                namespaces=self.parser.nsmap,
-            )
-            lot_id = self.parser.find_text(
-                lot, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            sustainability = []
-            strategies = [
-                "awardCriteria",
-                "contractPerformanceConditions",
-                "selectionCriteria",
-                "technicalSpecifications",
-            ]
-            for code in codes:
-                code = code.text
-                if code and code != "none":
-                    sustainability.append(
-                        {
-                            "goal": self.map_social_procurement_code(code),
-                            "strategies": strategies,
-                        }
-                    )
-            if sustainability:
-                lot_info = {
-                    "id": lot_id,
-                    "hasSustainability": True,
-                    "sustainability": sustainability,
-                }
-                self.add_or_update_lot(self.tender["lots"], lot_info)
-
-    def map_social_procurement_code(self, code):
-        mapping = {
-            "et-eq": "social.ethnicEquality",
-            # Add more mappings as required
-        }
-        return mapping.get(code, code)
-
-    def fetch_bt06_lot_strategic_procurement(self, root_element):
-        lots = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=self.parser.nsmap,
-        )
-        for lot in lots:
-            codes = lot.xpath(
-                ".//cac:ProcurementProject/cac:ProcurementAdditionalType[cbc:ProcurementTypeCode/@listName='strategic-procurement']/cbc:ProcurementTypeCode",
-                namespaces=self.parser.nsmap,
-            )
-            lot_id = self.parser.find_text(
-                lot, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            sustainability = []
-            strategies = [
-                "awardCriteria",
-                "contractPerformanceConditions",
-                "selectionCriteria",
-                "technicalSpecifications",
-            ]
-            for code in codes:
-                code = code.text
-                if code and code != "none":
-                    sustainability.append(
-                        {
-                            "goal": self.map_strategic_procurement_code(code),
-                            "strategies": strategies,
-                        }
-                    )
-            if sustainability:
-                lot_info = {
-                    "id": lot_id,
-                    "hasSustainability": True,
-                    "sustainability": sustainability,
-                }
-                self.add_or_update_lot(self.tender["lots"], lot_info)
-
-    def map_strategic_procurement_code(self, code):
-        mapping = {
-            "inn-pur": "economic.innovativePurchase",
-            # Add more mappings as required
-        }
-        return mapping.get(code, code)
-
-    def fetch_bt539_award_criterion_type(self, root_element):
-        lots = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=self.parser.nsmap,
-        )
-        for lot in lots:
-            criteria_elements = lot.xpath(
-                ".//cac:TenderingTerms/cac:AwardingTerms/cac:AwardingCriterion/cac:SubordinateAwardingCriterion",
-                namespaces=self.parser.nsmap,
-            )
-            lot_id = self.parser.find_text(
-                lot, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            for criterion in criteria_elements:
-                criterion_type = self.parser.find_text(
-                    criterion,
-                    "./cbc:AwardingCriterionTypeCode[@listName='award-criterion-type']",
-                )
-                if criterion_type:
-                    lot_info = {
-                        "id": lot_id,
-                        "awardCriteria": {"criteria": [{"type": criterion_type}]},
-                    }
-                    self.add_or_update_lot(self.tender["lots"], lot_info)
-
-    def fetch_bt540_award_criterion_description(self, root_element):
-        lots = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=self.parser.nsmap,
-        )
-        for lot in lots:
-            criteria_elements = lot.xpath(
-                ".//cac:TenderingTerms/cac:AwardingTerms/cac:AwardingCriterion/cac:SubordinateAwardingCriterion",
-                namespaces=self.parser.nsmap,
-            )
-            lot_id = self.parser.find_text(
-                lot, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            for criterion in criteria_elements:
-                description = self.parser.find_text(criterion, "./cbc:Description")
-                if description:
-                    lot_info = {
-                        "id": lot_id,
-                        "awardCriteria": {"criteria": [{"description": description}]},
-                    }
-                    self.add_or_update_lot(self.tender["lots"], lot_info)
-
-    def fetch_bt541_award_criterion_fixed_number(self, root_element):
-        lots = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=self.parser.nsmap,
-        )
-        for lot in lots:
-            criteria_elements = lot.xpath(
-                ".//cac:TenderingTerms/cac:AwardingTerms/cac:AwardingCriterion/cac:SubordinateAwardingCriterion/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:AwardCriterionParameter[efbc:ParameterCode/@listName='number-fixed']/efbc:ParameterNumeric",
-                namespaces=self.parser.nsmap,
-            )
-            lot_id = self.parser.find_text(
-                lot, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            for criterion in criteria_elements:
-                number = self.parser.find_text(criterion, "./efbc:ParameterNumeric")
-                if number:
-                    lot_info = {
-                        "id": lot_id,
-                        "awardCriteria": {
-                            "criteria": [{"numbers": [{"number": float(number)}]}]
-                        },
-                    }
-                    self.add_or_update_lot(self.tender["lots"], lot_info)
-
-    def fetch_bt5421_award_criterion_number_weight(self, root_element):
-        lots = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=self.parser.nsmap,
-        )
-        for lot in lots:
-            criteria_elements = lot.xpath(
-                ".//cac:TenderingTerms/cac:AwardingTerms/cac:AwardingCriterion/cac:SubordinateAwardingCriterion/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:AwardCriterionParameter[efbc:ParameterCode/@listName='number-weight']/efbc:ParameterCode",
-                namespaces=self.parser.nsmap,
-            )
-            lot_id = self.parser.find_text(
-                lot, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            for criterion in criteria_elements:
-                weight = self.parser.find_text(criterion, "./efbc:ParameterCode")
-                if weight:
-                    lot_info = {
-                        "id": lot_id,
-                        "awardCriteria": {
-                            "criteria": [
-                                {
-                                    "numbers": [
-                                        {
-                                            "weight": self.map_award_criterion_number_weight(
-                                                weight
-                                            )
-                                        }
-                                    ]
-                                }
-                            ]
-                        },
-                    }
-                    self.add_or_update_lot(self.tender["lots"], lot_info)
-
-    def fetch_bt5422_award_criterion_number_fixed(self, root_element):
-        lots = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=self.parser.nsmap,
-        )
-        for lot in lots:
-            criteria_elements = lot.xpath(
-                ".//cac:TenderingTerms/cac:AwardingTerms/cac:AwardingCriterion"
-                "/cac:SubordinateAwardingCriterion"
-                "/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension"
-                "/efac:AwardCriterionParameter[efbc:ParameterCode/@listName='number-fixed']/efbc:ParameterNumeric",
-                namespaces=self.parser.nsmap,
-            )
-            lot_id = self.parser.find_text(lot, "./cbc:ID", namespaces=self.parser.nsmap)
-            for criterion in criteria_elements:
-                number = self.parser.find_text(criterion, "./efbc:ParameterNumeric")
-                if number:
-                    lot_info = {
-                        "id": lot_id,
-                        "awardCriteria": {
-                            "criteria": [{"numbers": [{"number": float(number)}]}]
-                        },
-                    }
-                    self.add_or_update_lot(self.tender["lots"], lot_info)
-
-    def fetch_bt5423_award_criterion_number_threshold(self, root_element):
-        lots = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=self.parser.nsmap,
-        )
-        for lot in lots:
-            criteria_elements = lot.xpath(
-                ".//cac:TenderingTerms/cac:AwardingTerms/cac:AwardingCriterion/cac:SubordinateAwardingCriterion/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:AwardCriterionParameter[efbc:ParameterCode/@listName='number-threshold']/efbc:ParameterCode",
-                namespaces=self.parser.nsmap,
-            )
-            lot_id = self.parser.find_text(
-                lot, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            for criterion in criteria_elements:
-                threshold = self.parser.find_text(criterion, "./efbc:ParameterCode")
-                if threshold:
-                    lot_info = {
-                        "id": lot_id,
-                        "awardCriteria": {
-                            "criteria": [
-                                {
-                                    "numbers": [
-                                        {
-                                            "threshold": self.map_award_criterion_number_threshold(
-                                                threshold
-                                            )
-                                        }
-                                    ]
-                                }
-                            ]
-                        },
-                    }
-                    self.add_or_update_lot(self.tender["lots"], lot_info)
-
-    def fetch_bt543_award_criteria_complicated(self, root_element):
-        lots = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=self.parser.nsmap,
-        )
-        for lot in lots:
-            calculation_expression = self.parser.find_text(
-                lot,
-                ".//cac:TenderingTerms/cac:AwardingTerms/cac:AwardingCriterion/cbc:CalculationExpression",
-            )
-            lot_id = self.parser.find_text(
-                lot, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            if calculation_expression:
-                lot_info = {
-                    "id": lot_id,
-                    "awardCriteria": {"weightingDescription": calculation_expression},
-                }
-                self.add_or_update_lot(self.tender["lots"], lot_info)
-
-    def fetch_bt733_award_criteria_order_rationale(self, root_element):
-        lots = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=self.parser.nsmap,
-        )
-        for lot in lots:
-            order_rationale = self.parser.find_text(
-                lot,
-                ".//cac:TenderingTerms/cac:AwardingTerms/cac:AwardingCriterion/cbc:Description",
-            )
-            lot_id = self.parser.find_text(
-                lot, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            if order_rationale:
-                lot_info = {
-                    "id": lot_id,
-                    "awardCriteria": {"orderRationale": order_rationale},
-                }
-                self.add_or_update_lot(self.tender["lots"], lot_info)
-
-    def fetch_bt734_award_criterion_name(self, root_element):
-        lots = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=self.parser.nsmap,
-        )
-        for lot in lots:
-            criteria_elements = lot.xpath(
-                ".//cac:TenderingTerms/cac:AwardingTerms/cac:AwardingCriterion/cac:SubordinateAwardingCriterion",
-                namespaces=self.parser.nsmap,
-            )
-            lot_id = self.parser.find_text(
-                lot, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            for criterion in criteria_elements:
-                name = self.parser.find_text(criterion, "./cbc:Name")
-                if name:
-                    lot_info = {
-                        "id": lot_id,
-                        "awardCriteria": {"criteria": [{"name": name}]},
-                    }
-                    self.add_or_update_lot(self.tender["lots"], lot_info)
-
-    def fetch_bt773_subcontracting(self, root_element):
-        lot_tenders = root_element.xpath(
-            ".//efac:NoticeResult/efac:LotTender", namespaces=self.parser.nsmap
-        )
-        for lot_tender in lot_tenders:
-            tender_id = self.parser.find_text(
-                lot_tender, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-
-            if tender_id:
-                bid = {
-                    "id": tender_id,
-                    "relatedLots": [
-                        self.parser.find_text(lot_tender, "./efac:TenderLot/cbc:ID")
-                    ],
-                }
-
-                subcontracting_term = self.parser.find_text(
-                    lot_tender,
-                    "./efac:SubcontractingTerm[efbc:TermCode/@listName='applicability']/efbc:TermCode",
-                    namespaces=self.parser.nsmap,
-                )
-                if subcontracting_term:
-                    bid["hasSubcontracting"] = subcontracting_term.lower() == "yes"
-
-                rank = self.parser.find_text(
-                    lot_tender, "./cbc:RankCode", namespaces=self.parser.nsmap
-                )
-                if rank:
-                    bid["rank"] = int(rank)
-                    bid["hasRank"] = True
-
-                value = self.parser.find_text(
-                    lot_tender,
-                    "./cac:LegalMonetaryTotal/cbc:PayableAmount",
-                    namespaces=self.parser.nsmap,
-                )
-                currency_id = self.parser.find_attribute(
-                    lot_tender,
-                    "./cac:LegalMonetaryTotal/cbc:PayableAmount",
-                    "currencyID",
-                )
-                if value and currency_id:
-                    bid["value"] = {"amount": float(value), "currency": currency_id}
+                "relatedBids": [
+                    tender_id.text
+                    for tender_id in contract.iterfind(
+                        "efac:LotTender/cbc:ID", self.parser.nsmap
+                    )
+                    if tender_id.text
+                ],
+            }
 
-                tenderers = lot_tender.xpath(
-                    "efac:TenderingParty[efac:Tenderer]", namespaces=self.parser.nsmap
+            if framework_notice_id:
+                contract_info.setdefault("relatedProcesses", []).append(
+                    {
+                        "id": self.release.ids.new_id("framework", contract),
+                        "relationship": ["framework"],
+                        "identifier": framework_notice_id,
+                        "scheme": "internal",
+                    }
                 )
-                for tenderer_entry in tenderers:
-                    tenderer_id = self.parser.find_text(
-                        tenderer_entry,
-                        "efac:Tenderer/efac:PartyIdentification/cbc:ID",
-                        namespaces=self.parser.nsmap,
-                    )
-                    if tenderer_id:
-                        bid.setdefault("tenderers", []).append({"id": tenderer_id})
 
-                self.tender["bids"]["details"].append(bid)
+            # Only contracts settled by a lot result are released
+            if contract_id in index.lot_results_by_contract:
+                self.add_or_update_contract(contract_id, contract_info)
 
-    def fetch_opt_310_tendering_party_id(self, root_element):
-        tender_detail_mapping = {}
-        notice_results = root_element.xpath(
-            ".//efac:NoticeResult", namespaces=self.parser.nsmap
+    def fetch_bt200_contract_modification(self, root_element):
+        contract_mods = root_element.findall(
+            ".//efac:ContractModification", namespaces=self.parser.nsmap
         )
-        for notice_result in notice_results:
-            lot_tenders = notice_result.xpath(
-                ".//efac:LotTender", namespaces=self.parser.nsmap
+        for mod in contract_mods:
+            contract_id = self.parser.find_text(
+                mod,
+                ".//efac:Change/efac:ChangedSection/efbc:ChangeSectionIdentifier",
+                namespaces=self.parser.nsmap,
             )
-            for lot_tender in lot_tenders:
-                tender_id = self.parser.find_text(lot_tender, "cbc:ID")
-                tendering_party_id = self.parser.find_text(
-                    lot_tender, "efac:TenderingParty/cbc:ID"
-                )
-                if tender_id and tendering_party_id:
-                    tender_detail_mapping[tender_id] = tendering_party_id
-
-        for tender_id, tendering_party_id in tender_detail_mapping.items():
-            tendering_party = self.parser.find_node(
-                root_element,
-                f".//efac:TenderingParty[cbc:ID='{tendering_party_id}']",
+            reason_codes = mod.findall(
+                ".//efac:ChangeReason/cbc:ReasonCode", namespaces=self.parser.nsmap
+            )
+            reason_descriptions = mod.findall(
+                ".//efac:ChangeReason/efbc:ReasonDescription",
                 namespaces=self.parser.nsmap,
             )
-            tenderers = tendering_party.findall(
-                ".//efac:Tenderer", namespaces=self.parser.nsmap
+            change_descriptions = mod.findall(
+                ".//efac:Change/efbc:ChangeDescription", namespaces=self.parser.nsmap
             )
 
-            for tenderer in tenderers:
-                tenderer_id = self.parser.find_text(tenderer, "cbc:ID")
-                if tenderer_id:
-                    self.add_or_update_party(
-                        self.parties, {"id": tenderer_id, "roles": ["tenderer"]}
-                    )
-                    self.add_or_update_bid_tenderers(tender_id, tenderer_id)
-
-    def add_or_update_bid_tenderers(self, bid_id, tenderer_id):
-        bid = next(
-            (bid for bid in self.tender["bids"]["details"] if bid["id"] == bid_id), None
-        )
-        if bid:
-            if "tenderers" not in bid:
-                bid["tenderers"] = []
-            if not any(tenderer["id"] == tenderer_id for tenderer in bid["tenderers"]):
-                bid["tenderers"].append({"id": tenderer_id})
-        else:
-            self.tender["bids"]["details"].append(
-                {"id": bid_id, "tenderers": [{"id": tenderer_id}]}
-            )
+            if contract_id:
+                contract = self.get_or_create_contract(contract_id)
+                for idx, reason_code in enumerate(reason_codes):
+                    amendment_id = self.release.ids.new_id("amendment", reason_code)
+                    amendment = {
+                        "id": amendment_id,
+                        "rationaleClassifications": [
+                            {
+                                "id": reason_code.text,
+                                "description": self.get_modification_reason_description(
+                                    reason_code.text
+                                ),
+                                "scheme": "modification justification",
+                            }
+                        ],
+                        "rationale": (
+                            reason_descriptions[idx].text
+                            if idx < len(reason_descriptions)
+                            else None
+                        ),
+                        "description": (
+                            change_descriptions[idx].text
+                            if idx < len(change_descriptions)
+                            else None
+                        ),
+                    }
+                    contract.setdefault("amendments", []).append(amendment)
 
-        logger.debug(f"Updated bid {bid_id} with tenderer {tenderer_id}")
+    def get_modification_reason_description(self, code):
+        return MODIFICATION_REASONS.get(code, "Unknown modification reason")
 
-    def fetch_opt_320_contract_tender_reference(self, root_element):
-        settled_contracts = root_element.findall(
-            ".//efac:NoticeResult/efac:SettledContract", namespaces=self.parser.nsmap
-        )
-        for contract in settled_contracts:
-            tender_id = self.parser.find_text(
-                contract, "./efac:LotTender/cbc:ID", namespaces=self.parser.nsmap
-            )
-            contract_id = self.parser.find_text(
-                contract, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            if tender_id and contract_id:
-                self.add_or_update_contract_related_bids(contract_id, tender_id)
-                self.handle_tendering_party(contract_id, tender_id)
+    def get_or_create_contract(self, contract_id):
+        contract = self.release.contract(contract_id)
+        if contract is not None:
+            return contract
+        new_contract = {
+            "id": contract_id,
+            "awardID": None,  # This will be set later during lot result processing
+        }
+        return self.release.add_contract(new_contract)
 
-    def handle_tendering_party(self, contract_id, tender_id):
-        root = self.parser.root
-        tendering_party_id = self.parser.find_text(
-            root,
-            f".//efac:LotTender[cbc:ID='{tender_id}']/efac:TenderingParty/cbc:ID",
+    @handles("lot", scheme="Lot", writes=("lots",))
+    def fetch_bt775_social_procurement(self, lot):
+        codes = lot.xpath(
+            ".//cac:ProcurementProject/cac:ProcurementAdditionalType[cbc:ProcurementTypeCode/@listName='social-objective']/cbc:ProcurementTypeCode",
             namespaces=self.parser.nsmap,
         )
-        if tendering_party_id:
-            tenderers = root.findall(
-                f".//efac:TenderingParty[cbc:ID='{tendering_party_id}']/efac:Tenderer",
-                namespaces=self.parser.nsmap,
-            )
-            for tenderer in tenderers:
-                tenderer_id = self.parser.find_text(
-                    tenderer, "./cbc:ID", namespaces=self.parser.nsmap
+        lot_id = self.parser.find_text(
+            lot, "./cbc:ID", namespaces=self.parser.nsmap
+        )
+        sustainability = []
+        strategies = [
+            "awardCriteria",
+            "contractPerformanceConditions",
+            "selectionCriteria",
+            "technicalSpecifications",
+        ]
+        for code in codes:
+            code = code.text
+            if code and code != "none":
+                sustainability.append(
+                    {
+                        "goal": self.map_social_procurement_code(code),
+                        "strategies": strategies,
+                    }
                 )
-                if tenderer_id:
-                    org = self.get_or_create_organization(self.parties, tenderer_id)
-                    if "supplier" not in org["roles"]:
-                        org["roles"].append("supplier")
-                        logger.debug(f"Added supplier role to organization {tenderer_id}")
-                    if "tenderer" not in org["roles"]:
-                        org["roles"].append("tenderer")
-                        logger.debug(f"Added tenderer role to organization {tenderer_id}")
-                    self.assign_supplier_to_contract(contract_id, tenderer_id)
+        if sustainability:
+            lot_info = {
+                "id": lot_id,
+                "hasSustainability": True,
+                "sustainability": sustainability,
+            }
+            self.add_or_update_lot(self.tender["lots"], lot_info)
+
+    def map_social_procurement_code(self, code):
+        return SOCIAL_PROCUREMENT_GOALS.get(code, code)
 
-    def fetch_bt746_organization_listed_market(self, root_element):
-        organizations = root_element.findall(
-            ".//efac:Organizations/efac:Organization", namespaces=self.parser.nsmap
+    @handles("lot", scheme="Lot", writes=("lots",))
+    def fetch_bt06_lot_strategic_procurement(self, lot):
+        codes = lot.xpath(
+            ".//cac:ProcurementProject/cac:ProcurementAdditionalType[cbc:ProcurementTypeCode/@listName='strategic-procurement']/cbc:ProcurementTypeCode",
+            namespaces=self.parser.nsmap,
         )
-        for org_element in organizations:
-            org_id = self.parser.find_text(
-                org_element,
-                "./efac:Company/cac:PartyIdentification/cbc:ID[@schemeName='organization']",
-                namespaces=self.parser.nsmap,
-            )
-            if org_id:
-                listed_indicator_text = self.parser.find_text(
-                    org_element,
-                    "./efbc:ListedOnRegulatedMarketIndicator",
-                    namespaces=self.parser.nsmap,
+        lot_id = self.parser.find_text(
+            lot, "./cbc:ID", namespaces=self.parser.nsmap
+        )
+        sustainability = []
+        strategies = [
+            "awardCriteria",
+            "contractPerformanceConditions",
+            "selectionCriteria",
+            "technicalSpecifications",
+        ]
+        for code in codes:
+            code = code.text
+            if code and code != "none":
+                sustainability.append(
+                    {
+                        "goal": self.map_strategic_procurement_code(code),
+                        "strategies": strategies,
+                    }
                 )
-                if listed_indicator_text is not None:
-                    listed_indicator = listed_indicator_text.lower() == "true"
-                    organization = self.get_or_create_organization(self.parties, org_id)
-                    organization.setdefault("details", {})[
-                        "listedOnRegulatedMarket"
-                    ] = listed_indicator
-                    self.add_or_update_party(self.parties, organization)
-
-    def fetch_bt165_company_size(self, root_element):
-        organizations = root_element.findall(
-            ".//efac:Organizations/efac:Organization", namespaces=self.parser.nsmap
-        )
-        for org_element in organizations:
-            org_id = self.parser.find_text(
-                org_element,
-                "./efac:Company/cac:PartyIdentification/cbc:ID[@schemeName='organization']",
-                namespaces=self.parser.nsmap,
+        if sustainability:
+            lot_info = {
+                "id": lot_id,
+                "hasSustainability": True,
+                "sustainability": sustainability,
+            }
+            self.add_or_update_lot(self.tender["lots"], lot_info)
+
+    def map_strategic_procurement_code(self, code):
+        return STRATEGIC_PROCUREMENT_GOALS.get(code, code)
+
+    @handles("lot_tender", writes=("parties", "bids"))
+    def fetch_lot_tender(self, lot_tender):
+        """
+        Builds the bid of an efac:LotTender from the element, in one read of
+        its children: the lot (BT-13714), value (BT-720), rank (BT-171,
+        BT-1711), countries of origin (BT-191), variant (BT-193), tender
+        identifier (BT-3201), subcontracting (BT-553, BT-554, BT-773) and the
+        tenderers of its tendering party (OPT-310), who get the tenderer role.
+        """
+        nsmap = self.parser.nsmap
+        tender_id = lot_tender.findtext("cbc:ID", namespaces=nsmap)
+        if not tender_id:
+            return
+        bid = self.release.bid(tender_id)
+
+        lot_id = lot_tender.findtext("efac:TenderLot/cbc:ID", namespaces=nsmap)
+        if lot_id:
+            related_lots = bid.setdefault("relatedLots", [])
+            if lot_id not in related_lots:
+                related_lots.append(lot_id)
+
+        payable_amount = lot_tender.find("cac:LegalMonetaryTotal/cbc:PayableAmount", nsmap)
+        if payable_amount is not None:
+            currency_id = payable_amount.get("currencyID")
+            if payable_amount.text and currency_id:
+                bid["value"] = {"amount": float(payable_amount.text), "currency": currency_id}
+
+        rank = lot_tender.findtext("cbc:RankCode", namespaces=nsmap)
+        if rank:
+            bid["rank"] = int(rank)
+            bid["hasRank"] = True
+        ranked_indicator = lot_tender.findtext("efbc:TenderRankedIndicator", namespaces=nsmap)
+        if ranked_indicator:
+            bid["hasRank"] = ranked_indicator.lower() == "true"
+
+        origins = [
+            self.convert_language_code(origin.text, code_type="country")
+            for origin in lot_tender.iterfind("efac:Origin/efbc:AreaCode", nsmap)
+        ]
+        if origins:
+            bid["countriesOfOrigin"] = origins
+
+        variant_indicator = lot_tender.findtext("efbc:TenderVariantIndicator", namespaces=nsmap)
+        if variant_indicator:
+            bid["variant"] = variant_indicator.lower() == "true"
+
+        tender_reference = lot_tender.findtext("efac:TenderReference/cbc:ID", namespaces=nsmap)
+        if tender_reference:
+            bid.setdefault("identifiers", []).append(
+                {
+                    "id": tender_reference,
+                    "scheme": "{}-TENDERNL".format(tender_reference.split("/")[0][:2]),
+                }
             )
-            if org_id:
-                size_code = self.parser.find_text(
-                    org_element,
-                    "./efac:Company/efbc:CompanySizeCode",
-                    namespaces=self.parser.nsmap,
-                )
-                if size_code:
-                    organization = self.get_or_create_organization(self.parties, org_id)
-                    organization.setdefault("details", {})["scale"] = size_code.lower()
 
-    def fetch_bt633_natural_person_indicator(self, root_element):
-        organizations = root_element.findall(
-            ".//efac:Organizations/efac:Organization", namespaces=self.parser.nsmap
-        )
-        for org_element in organizations:
-            org_id = self.parser.find_text(
-                org_element,
-                "./efac:Company/cac:PartyIdentification/cbc:ID[@schemeName='organization']",
-                namespaces=self.parser.nsmap,
+        self.parse_bid_subcontracting(bid, lot_tender)
+
+        # Tenderers given inline, and those of the referenced tendering party
+        tenderer_ids = [
+            tenderer_id.text
+            for tenderer_id in lot_tender.iterfind(
+                "efac:TenderingParty/efac:Tenderer/efac:PartyIdentification/cbc:ID", nsmap
             )
-            if org_id:
-                natural_person_indicator = self.parser.find_text(
-                    org_element,
-                    "./efbc:NaturalPersonIndicator",
-                    namespaces=self.parser.nsmap,
-                )
-                if natural_person_indicator is not None:
-                    if natural_person_indicator.lower() == "true":
-                        # Set to selfEmployed if the indicator is true
-                        organization = self.get_or_create_organization(
-                            self.parties, org_id
-                        )
-                        organization.setdefault("details", {})["scale"] = "selfEmployed"
+            if tenderer_id.text
+        ]
+        tendering_party = self.parser.index.tendering_parties.get(
+            lot_tender.findtext("efac:TenderingParty/cbc:ID", namespaces=nsmap)
+        )
+        if tendering_party is not None:
+            for tenderer_id in tendering_party.iterfind(".//efac:Tenderer/cbc:ID", nsmap):
+                if tenderer_id.text:
+                    self.get_or_create_organization(self.parties, tenderer_id.text, ["tenderer"])
+                    tenderer_ids.append(tenderer_id.text)
+        for tenderer_id in tenderer_ids:
+            tenderers = bid.setdefault("tenderers", [])
+            if not any(tenderer["id"] == tenderer_id for tenderer in tenderers):
+                tenderers.append({"id": tenderer_id})
+
+    def parse_bid_subcontracting(self, bid, lot_tender):
+        nsmap = self.parser.nsmap
+        for term in lot_tender.iterfind("efac:SubcontractingTerm", nsmap):
+            term_code = term.find("efbc:TermCode", nsmap)
+            if term_code is not None and term_code.get("listName") == "applicability":
+                if term_code.text:
+                    bid["hasSubcontracting"] = term_code.text.lower() == "yes"
+                amount = term.find("efbc:TermAmount", nsmap)
+                if amount is not None and amount.text and amount.get("currencyID"):
+                    bid.setdefault("subcontracting", {})["value"] = {
+                        "amount": float(amount.text),
+                        "currency": amount.get("currencyID"),
+                    }
+            description = term.findtext("efbc:TermDescription", namespaces=nsmap)
+            if description:
+                bid.setdefault("subcontracting", {})["description"] = description
 
     def gather_party_info(self, root_element):
         logger = logging.getLogger(__name__)
         parties = []
 
     def add_or_update_party(self, parties, new_party):
-        existing = next((p for p in parties if p["id"] == new_party["id"]), None)
-        if existing:
-            self.update_organization(existing, new_party)
-        else:
-            parties.append(new_party)
+        if parties is self.parties:
+            new_party = Party.of(new_party)
+        return self.release.upsert(parties, new_party, self.update_organization)
 
-    def fetch_bt145_contract_conclusion_date(self, root_element):
-        settled_contracts = root_element.findall(
-            ".//efac:NoticeResult/efac:SettledContract", namespaces=self.parser.nsmap
+    @handles("settled_contract", reads=("awards",), writes=("contracts",))
+    def fetch_bt145_contract_conclusion_date(self, contract):
+        contract_id = self.parser.find_text(
+            contract, "./cbc:ID", namespaces=self.parser.nsmap
         )
-        for contract in settled_contracts:
-            contract_id = self.parser.find_text(
-                contract, "./cbc:ID", namespaces=self.parser.nsmap
-            )
-            issue_date = self.parser.find_text(
-                contract, "./cbc:IssueDate", namespaces=self.parser.nsmap
-            )
-            if contract_id and issue_date:
-                self.add_or_update_contract(
-                    contract_id, {"dateSigned": parse_iso_date(issue_date).isoformat()}
-                )
-
-    def fetch_bt150_contract_identifier(self, root_element):
-        settled_contracts = root_element.findall(
-            ".//efac:NoticeResult/efac:SettledContract", namespaces=self.parser.nsmap
+        issue_date = self.parser.find_text(
+            contract, "./cbc:IssueDate", namespaces=self.parser.nsmap
         )
-        for contract in settled_contracts:
-            contract_id = self.parser.find_text(
-                contract, "./cbc:ID", namespaces=self.parser.nsmap
+        if contract_id and issue_date:
+            self.add_or_update_contract(
+                contract_id, {"dateSigned": parse_iso_date(issue_date).isoformat()}
             )
-            contract_reference = self.parser.find_text(
-                contract,
-                "./efac:ContractReference/cbc:ID",
-                namespaces=self.parser.nsmap,
-            )
-            if contract_id and contract_reference:
-                self.add_or_update_contract(
-                    contract_id,
-                    {
-                        "identifiers": [
-                            {"id": contract_reference, "scheme": "NL-TENDERNED"}
-                        ]
-                    },
-                )
 
-    def fetch_bt63_lot_variants(self, root_element):
-        lots = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=self.parser.nsmap,
+    @handles("settled_contract", reads=("awards",), writes=("contracts",))
+    def fetch_bt150_contract_identifier(self, contract):
+        contract_id = self.parser.find_text(
+            contract, "./cbc:ID", namespaces=self.parser.nsmap
         )
-        for lot in lots:
-            lot_id = self.parser.find_text(lot, "./cbc:ID", namespaces=self.parser.nsmap)
-            variant_policy_code = self.parser.find_text(
-                lot,
-                "./cac:TenderingTerms/cbc:VariantConstraintCode[@listName='permission']",
-                namespaces=self.parser.nsmap,
-            )
-            if variant_policy_code:
-                lot_info = {
-                    "id": lot_id,
-                    "submissionTerms": {
-                        "variantPolicy": variant_policy_code
-                    }
-                }
-                self.add_or_update_lot(self.tender["lots"], lot_info)
-
-    def fetch_bt661_maximum_candidates(self, root_element):
-        lots = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
+        contract_reference = self.parser.find_text(
+            contract,
+            "./efac:ContractReference/cbc:ID",
             namespaces=self.parser.nsmap,
         )
-        for lot in lots:
-            lot_id = self.parser.find_text(lot, "./cbc:ID", namespaces=self.parser.nsmap)
-            max_candidates_indicator = self.parser.find_text(
-                lot,
-                "./cac:TenderingProcess/cac:EconomicOperatorShortList/cbc:LimitationDescription",
-                namespaces=self.parser.nsmap,
+        if contract_id and contract_reference:
+            self.add_or_update_contract(
+                contract_id,
+                {
+                    "identifiers": [
+                        {"id": contract_reference, "scheme": "NL-TENDERNED"}
+                    ]
+                },
             )
-            if max_candidates_indicator and max_candidates_indicator.lower() == "true":
-                lot_info = {
-                    "id": lot_id,
-                    "secondStage": {
-                        "maximumCandidates": True
-                    }
-                }
-                self.add_or_update_lot(self.tender["lots"], lot_info)
 
+    @handles(writes=("tender",))
     def fetch_bt67a_exclusion_grounds(self, root_element):
         exclusion_criteria = []
 
@@ -4885,72 +3902,43 @@ class TEDtoOCDSConverter:
                 "criteria": exclusion_criteria
             }
 
-    def fetch_bt76_tenderer_legal_form_description(self, root_element):
-        lots = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=self.parser.nsmap,
+    @handles("lot_result", writes=("bids",))
+    def fetch_bt760_lot_result_received_submissions(self, lot_result):
+        statistics = self.tender["bids"]["statistics"]
+        lot_id = self.parser.find_text(
+            lot_result, "./efac:TenderLot/cbc:ID", namespaces=self.parser.nsmap
         )
-        for lot in lots:
-            lot_id = self.parser.find_text(lot, "./cbc:ID", namespaces=self.parser.nsmap)
-            legal_form_description = self.parser.find_text(
-                lot,
-                "./cac:TenderingTerms/cac:TendererQualificationRequest[not(cac:SpecificTendererRequirement)]/cbc:CompanyLegalForm",
-                namespaces=self.parser.nsmap,
-            )
-            if legal_form_description:
-                lot_info = {
-                    "id": lot_id,
-                    "contractTerms": {
-                        "tendererLegalForm": legal_form_description
-                    }
-                }
-                self.add_or_update_lot(self.tender["lots"], lot_info)
-
-    def fetch_bt760_lot_result_received_submissions(self, root_element):
-        lot_results = root_element.xpath(
-            ".//efac:NoticeResult/efac:LotResult", namespaces=self.parser.nsmap
+        received_submissions = lot_result.xpath(
+            "./efac:ReceivedSubmissionsStatistics/efbc:StatisticsCode[@listName='received-submission-type']",
+            namespaces=self.parser.nsmap,
         )
-        stat_id = len(self.tender["bids"]["statistics"]) + 1  # Continue incrementing statistics ID counter
-
-        for lot_result in lot_results:
-            lot_id = self.parser.find_text(
-                lot_result, "./efac:TenderLot/cbc:ID", namespaces=self.parser.nsmap
-            )
-            received_submissions = lot_result.xpath(
-                "./efac:ReceivedSubmissionsStatistics/efbc:StatisticsCode[@listName='received-submission-type']",
-                namespaces=self.parser.nsmap,
-            )
-            for submission in received_submissions:
-                submission_type = submission.text
-                if submission_type:
-                    self.tender["bids"]["statistics"].append({
-                        "id": str(stat_id),
-                        "measure": self.map_received_submission_type_to_measure(submission_type),
-                        "relatedLot": lot_id
-                    })
-                    stat_id += 1
-
-    def fetch_bt769_multiple_tenders(self, root_element):
-        lots = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
+        for submission in received_submissions:
+            submission_type = submission.text
+            if submission_type:
+                statistics.append({
+                    "id": str(len(statistics) + 1),
+                    "measure": self.map_received_submission_type_to_measure(submission_type),
+                    "relatedLot": lot_id
+                })
+
+    @handles("lot", scheme="Lot", writes=("lots",))
+    def fetch_bt769_multiple_tenders(self, lot):
+        lot_id = self.parser.find_text(lot, "./cbc:ID", namespaces=self.parser.nsmap)
+        multiple_tenders_code = self.parser.find_text(
+            lot,
+            "./cac:TenderingTerms/cbc:MultipleTendersCode[@listName='permission']",
             namespaces=self.parser.nsmap,
         )
-        for lot in lots:
-            lot_id = self.parser.find_text(lot, "./cbc:ID", namespaces=self.parser.nsmap)
-            multiple_tenders_code = self.parser.find_text(
-                lot,
-                "./cac:TenderingTerms/cbc:MultipleTendersCode[@listName='permission']",
-                namespaces=self.parser.nsmap,
-            )
-            if multiple_tenders_code:
-                lot_info = {
-                    "id": lot_id,
-                    "submissionTerms": {
-                        "multipleBidsAllowed": multiple_tenders_code.lower() == "allowed"
-                    }
+        if multiple_tenders_code:
+            lot_info = {
+                "id": lot_id,
+                "submissionTerms": {
+                    "multipleBidsAllowed": multiple_tenders_code.lower() == "allowed"
                 }
-                self.add_or_update_lot(self.tender["lots"], lot_info) 
+            }
+            self.add_or_update_lot(self.tender["lots"], lot_info) 
 
+    @handles(writes=("tender",))
     def fetch_bt762_change_reason_description(self, root_element):
         change_reasons = root_element.xpath(
             ".//efext:EformsExtension/efac:Changes/efac:ChangeReason/efbc:ReasonDescription",
@@ -4964,77 +3952,40 @@ class TEDtoOCDSConverter:
             else:
                 self.tender["amendments"] = [{"rationale": rationale}]    
 
-    def fetch_opt_310_tendering_party_id_reference(self, root_element):
-        notice_results = root_element.xpath(
-            ".//efac:NoticeResult",
-            namespaces=self.parser.nsmap,
-        )
-        for notice_result in notice_results:
-            lot_tender_elements = notice_result.xpath("./efac:LotTender", namespaces=self.parser.nsmap)
-            for lot_tender in lot_tender_elements:
-                tender_id = self.parser.find_text(lot_tender, "./cbc:ID", namespaces=self.parser.nsmap)
-                tendering_party_id = self.parser.find_text(
-                    lot_tender, "./efac:TenderingParty/cbc:ID", namespaces=self.parser.nsmap
-                )
-                if tendering_party_id:
-                    tendering_party = next(
-                        (
-                            tp for tp in notice_result.findall('./efac:TenderingParty', namespaces=self.parser.nsmap)
-                            if self.parser.find_text(tp, './cbc:ID', namespaces=self.parser.nsmap) == tendering_party_id
-                        ), 
-                        None
-                    )
-                    if tendering_party is not None:
-                        tenderers = tendering_party.findall("./efac:Tenderer", namespaces=self.parser.nsmap)
-                        for tenderer in tenderers:
-                            tenderer_id = self.parser.find_text(tenderer, "./cbc:ID", namespaces=self.parser.nsmap)
-                            if tenderer_id:
-                                self.add_or_update_party(self.parties, {"id": tenderer_id, "roles": ["tenderer"]})
-                                self.add_or_update_bid_tenderers(tender_id, tenderer_id)
-
     def map_received_submission_type_to_measure(self, submission_type):
-        mapping = {
-            "t-sme": "smeBids",
-            "t-esea": "eeaBids", 
-            "t-out-eu": "nonEeaBids"  # Example mapping; add more as needed
-        }
-        return mapping.get(submission_type, "totalBids")  # Default to 'totalBids' if not found
+        return RECEIVED_SUBMISSION_MEASURES.get(submission_type, "totalBids")  # Default to 'totalBids' if not found
 
-    def fetch_bt125i_previous_planning_identifier(self, root_element):
+    @handles("lot", scheme="Part", writes=("tender",))
+    def fetch_bt125i_previous_planning_identifier(self, part):
         """
         Fetches BT-125(i): The identifier of a prior information notice or another similar notice related to this notice.
         """
-        logger.info("Fetching BT-125(i) Previous Planning Identifier")
-
         related_processes = self.tender.setdefault("relatedProcesses", [])
-        parts = root_element.xpath(
-            ".//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']",
-            namespaces=self.parser.nsmap,
-        )
-
-        for part in parts:
-            part_id = self.parser.find_text(part, "./cbc:ID", namespaces=self.parser.nsmap)
-            logger.debug(f"Processing part with ID: {part_id}")
-            notice_refs = part.findall(
-                "./cac:TenderingProcess/cac:NoticeDocumentReference", namespaces=self.parser.nsmap
-            )
-            for notice_ref in notice_refs:
-                notice_id = self.parser.find_text(notice_ref, "./cbc:ID", namespaces=self.parser.nsmap)
-                referenced_internal_address = self.parser.find_text(
-                    notice_ref, "./cbc:ReferencedDocumentInternalAddress", namespaces=self.parser.nsmap)
-
-                logger.debug(f"Notice ID: {notice_id}, Referenced Internal Address: {referenced_internal_address}")
-
-                if notice_id and referenced_internal_address:
-                    full_identifier = f"{notice_id}-{referenced_internal_address}"
-                    related_process = {
-                        "id": str(len(related_processes) + 1),
-                        "relationship": ["planning"],
-                        "scheme": "eu-oj",
-                        "identifier": full_identifier
-                    }
-                    related_processes.append(related_process)
-                    logger.debug(f"Added related process: {related_process}")
+        part_id = self.parser.find_text(part, "./cbc:ID", namespaces=self.parser.nsmap)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing part with ID: %s", part_id)
+        notice_refs = part.findall(
+            "./cac:TenderingProcess/cac:NoticeDocumentReference", namespaces=self.parser.nsmap
+        )
+        for notice_ref in notice_refs:
+            notice_id = self.parser.find_text(notice_ref, "./cbc:ID", namespaces=self.parser.nsmap)
+            referenced_internal_address = self.parser.find_text(
+                notice_ref, "./cbc:ReferencedDocumentInternalAddress", namespaces=self.parser.nsmap)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Notice ID: %s, Referenced Internal Address: %s", notice_id, referenced_internal_address)
+
+            if notice_id and referenced_internal_address:
+                full_identifier = f"{notice_id}-{referenced_internal_address}"
+                related_process = {
+                    "id": str(len(related_processes) + 1),
+                    "relationship": ["planning"],
+                    "scheme": "eu-oj",
+                    "identifier": full_identifier
+                }
+                related_processes.append(related_process)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Added related process: %s", related_process)
 
     def convert_tender_to_ocds(self):
         root = self.parser.root
@@ -5043,7 +3994,8 @@ class TEDtoOCDSConverter:
         dispatch_datetime = self.get_dispatch_date_time()
         tender_title = self.parser.find_text(root, ".//cac:ProcurementProject/cbc:Name")
 
-        form_type = self.get_form_type(root)
+        form_type_code = self.get_form_type_code(root)
+        form_type = self.get_form_type(root, form_type_code)
         language = self.fetch_notice_language(root) or "en"  # Default to "en" if None
         self.tender.setdefault("bids", {}).setdefault("details", [])
 
@@ -5060,126 +4012,48 @@ class TEDtoOCDSConverter:
         procedure_features = None
         items = []
 
-        methods_to_call = [
-            self.fetch_bt88_procurement_method_details,
-            self.fetch_bt710_bt711_bid_statistics,
-            self.fetch_bt712_complaints_statistics,
-            self.fetch_bt09_cross_border_law,
-            self.fetch_bt111_lot_buyer_categories,
-            self.fetch_bt766_dynamic_purchasing_system_lot,
-            self.fetch_bt766_dynamic_purchasing_system_part,
-            self.fetch_bt775_social_procurement,
-            self.fetch_bt06_lot_strategic_procurement,
-            self.fetch_bt539_award_criterion_type,
-            self.fetch_bt540_award_criterion_description,
-            self.fetch_bt541_award_criterion_fixed_number,
-            self.fetch_bt5421_award_criterion_number_weight,
-            self.fetch_bt5422_award_criterion_number_fixed,
-            self.fetch_bt5423_award_criterion_number_threshold,
-            self.fetch_bt543_award_criteria_complicated,
-            self.fetch_bt733_award_criteria_order_rationale,
-            self.fetch_bt734_award_criterion_name,
-            self.handle_bt14_and_bt707,
-            self.fetch_opp_050_buyers_group_lead,
-            self.fetch_opt_300_contract_signatory,
-            self.fetch_opt_301_tenderer_maincont,
-            self.fetch_bt773_subcontracting,
-            self.fetch_opt_310_tendering_party_id,
-            self.fetch_bt3202_contract_tender_reference,
-            self.fetch_bt746_organization_listed_market,
-            self.fetch_bt165_company_size,
-            self.fetch_bt633_natural_person_indicator,
-            self.fetch_bt47_participants,
-            self.fetch_bt5010_lot_financing,
-            self.fetch_bt5011_contract_financing,
-            self.fetch_bt508_buyer_profile,
-            self.fetch_bt60_lot_funding,
-            self.fetch_bt610_activity_entity,
-            self.fetch_bt740_contracting_entity,
-            self.fetch_opp_051_awarding_cpb_buyer,
-            self.fetch_opp_052_acquiring_cpb_buyer,
-            self.fetch_opt_030_service_type,
-            self.fetch_opt_170_tender_leader,
-            self.fetch_opt_301_lot_mediator,
-            self.fetch_opt_301_lot_review_org,
-            self.fetch_opt_301_part_review_org,
-            self.fetch_opt_300_buyer_technical_reference,
-            self.fetch_opt_301_add_info_provider,
-            self.fetch_opt_301_lot_employ_legis,
-            self.fetch_opt_301_lot_environ_legis,
-            self.fetch_opt_301_doc_provider,
-            self.fetch_opt_301_lot_review_info,
-            self.fetch_opt_301_lotresult_financing,
-            self.fetch_opt_322_lotresult_technical_identifier,
-            self.fetch_bt144_not_awarded_reason,
-            self.fetch_bt1451_winner_decision_date,
-            self.fetch_bt163_concession_value_description,
-            self.fetch_bt660_framework_re_estimated_value,
-            self.fetch_bt709_framework_maximum_value,
-            self.fetch_bt720_tender_value,
-            self.fetch_bt735_cvd_contract_type,
-            self.fetch_bt145_contract_conclusion_date,
-            self.fetch_bt150_contract_identifier,
-            self.fetch_bt5010_lot_financing,
-            self.fetch_bt5011_contract_financing,
-            self.fetch_opp_080_public_transport_distance,
-            self.fetch_opt_301_lot_tender_eval,
-            self.fetch_opt_301_part_tender_eval,
-            self.fetch_opt_301_part_mediator,
-            self.fetch_opt_301_part_review_info,
-            self.fetch_opt_301_part_review_org,
-            self.fetch_opt_301_part_doc_provider,
-            self.fetch_opt_301_part_add_info_provider,
-            self.fetch_opt_301_part_employ_legis,
-            self.fetch_opt_300_signatory_reference,
-            self.fetch_bt142_winner_chosen,
-            self.fetch_bt13713_lotresult,
-            self.fetch_bt13714_tender_lot_identifier,
-            self.fetch_bt171_tender_rank,
-            self.fetch_bt191_country_origin,
-            self.fetch_bt193_tender_variant,
-            self.fetch_bt3201_tender_identifier,
-            self.fetch_bt553_subcontracting_value,
-            self.fetch_bt554_subcontracting_description,
-            self.fetch_opt_320_lotresult_tender_reference,
-            self.fetch_bt63_lot_variants,
-            self.fetch_bt661_maximum_candidates,
-            self.fetch_bt67a_exclusion_grounds,
-            self.fetch_bt76_tenderer_legal_form_description,
-            self.fetch_bt760_lot_result_received_submissions,
-            self.fetch_bt769_multiple_tenders,
-            self.fetch_bt762_change_reason_description,
-            self.fetch_opt_310_tendering_party_id_reference,
-            self.fetch_bt125i_previous_planning_identifier
-        ]
-
-        for method in methods_to_call:
-            try:
-                method(root)
-            except Exception as e:
-                logging.error(f"Error in {method.__name__}: {e}")
+        if self.profiler is not None:
+            self.profiler.notices += 1
+        with self.phase("fetch_loop"):
+            walker = TreeWalker(root)
+            # Planning and competition notices, and any notice without a
+            # NoticeResult, have nothing for the result handlers to map.
+            with_results = (
+                walker.has_notice_result
+                and form_type_code not in self.RESULT_FREE_FORM_TYPES
+            )
+            methods_to_call = [getattr(self, name) for name in self.handler_plan(with_results)]
+            walker.dispatch(methods_to_call, self.profiler)
 
         try:
             activities = self.parse_activity_authority(root)
             legal_types = self.parse_buyer_legal_type(root)
-            lots = self.parse_lots(root)
+            with self.phase("parse_lots"):
+                lots = self.parse_lots(root)
             legal_basis = self.get_legal_basis(root)
             additional_info = self.fetch_bt300_additional_info(root)
             tender_estimated_value = self.fetch_tender_estimated_value(root)
             procedure_type = self.parse_procedure_type(root)
             procurement_method_rationale, procurement_method_rationale_classifications = self.parse_direct_award_justification(root)
             procedure_features = self.parse_procedure_features(root)
-            items = self.parse_classifications(root)
+            with self.phase("parse_classifications"):
+                items = self.parse_classifications(root)
 
             self.handle_bidding_documents(root)
             self.fetch_opt_315_contract_identifier(root)
             self.fetch_bt200_contract_modification(root)
 
-            company_organizations = self.fetch_bt500_company_organization(root)
-            for company_org in company_organizations:
-                self.add_or_update_party(self.parties, company_org)
+            with self.phase("join_results"):
+                self.join_results()
         except Exception as e:
-            logging.error(f"Error processing data: {e}")
+            logger.error("Error processing data: %s", e)
+
+        tender_id = self.parser.find_text(root, ".//cbc:ContractFolderID")
+        contract_period = self.parse_contract_period(root)
+        if self.lean:
+            # Everything is extracted: free the tree before assembly and cleaning
+            walker = root = None
+            self.parser.close()
 
         eu_org = self.get_or_create_organization(self.parties, self.EU_ORG_ID, roles=["funder"])
         eu_org.update({"name": "European Union"})
@@ -5191,48 +4065,26 @@ class TEDtoOCDSConverter:
                 if item.get("relatedLot") == lot_id:
                     tenders_lots_items.append({"relatedLot": lot_id, **item})
 
-        awards = []
-        for award in self.awards:
-            award_id = award.get("id")
-            award_contracts = [
-                contract
-                for contract in self.get_contracts()
-                if contract.get("awardID") == award_id
-            ]
-            suppliers = []
-            buyers = []
-
-            for contract in award_contracts:
-                suppliers.extend(contract.get("suppliers", []))
-                buyers.extend(contract.get("buyers", []))
-
-            awards.append(
-                {
-                    **award,
-                    "contracts": award_contracts,
-                    "suppliers": suppliers,
-                    "buyers": [{"id": buyer.get("id")} for buyer in buyers],
-                }
-            )
-
-        unique_contracts = list(
-            {contract["id"]: contract for contract in self.get_contracts()}.values()
-        )
-
-        for party in self.parties:
-            if "roles" not in party:
-                party["roles"] = []
+        # The intermediate records become plain OCDS objects here, once
+        contracts = [contract.to_ocds() for contract in self.get_contracts()]
+        contracts_by_award = {}
+        for contract in contracts:
+            contracts_by_award.setdefault(contract.get("awardID"), []).append(contract)
+        awards = [
+            {**award.to_ocds(), "contracts": contracts_by_award.get(award["id"], [])}
+            for award in self.awards
+        ]
 
         release = {
-            "id": str(uuid.uuid4()),
+            "id": self.release.ids.new_id("release"),
             "ocid": ocid,
             "date": dispatch_datetime,
             "initiationType": "tender",
-            "tag": form_type["tag"],
+            "tag": list(form_type["tag"]),
             "language": language.upper(),
-            "parties": self.clean_release_structure(self.parties),
+            "parties": [party.to_ocds() for party in self.parties],
             "tender": {
-                "id": self.parser.find_text(root, ".//cbc:ContractFolderID"),
+                "id": tender_id,
                 "status": form_type.get("tender_status", "planned"),
                 "title": tender_title,
                 "description": additional_info,
@@ -5245,24 +4097,33 @@ class TEDtoOCDSConverter:
                     procedure_type["method"] if procedure_type else None
                 ),
                 "procurementMethodDetails": self.tender.get("procurementMethodDetails"),
+                "lotDetails": self.tender.get("lotDetails"),
                 "procurementMethodRationale": procurement_method_rationale,
                 "procurementMethodRationaleClassifications": procurement_method_rationale_classifications,
                 "classification": {"activities": activities} if activities else None,
-                "contractPeriod": self.parse_contract_period(root),
+                "contractPeriod": contract_period,
                 "procedureFeatures": procedure_features if procedure_features else None,
                 "mainProcurementCategory": "services",  # Adjust mainProcurementCategory as needed
             },
             # Only access 'self.tender' for relatedProcesses
-            "relatedProcesses": self.clean_release_structure(self.tender.get("relatedProcesses", [])),
+            "relatedProcesses": self.tender.get("relatedProcesses", []),
             "awards": awards,
-            "contracts": unique_contracts,
-            "bids": self.tender["bids"],
+            "contracts": contracts,
+            "bids": {
+                **self.tender["bids"],
+                "details": [bid.to_ocds() for bid in self.tender["bids"]["details"]],
+            },
         }
 
-        cleaned_release = self.clean_release_structure(release)
+        if self.lean:
+            # The release is the only reference left to the extracted objects
+            self.reset(None)
+        with self.phase("clean_release_structure"):
+            cleaned_release = self.clean_release_structure(release)
 
-        logging.info("Conversion to OCDS format completed.")
-        logging.info(f"Final release structure: {cleaned_release}")
+        logger.info("Conversion to OCDS format completed.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Final release structure: %s", cleaned_release)
 
         return cleaned_release
 
@@ -5276,12 +4137,11 @@ def main(xml_file):
 
         release_info = converter.convert_tender_to_ocds()
 
-        # result = json.dumps({"releases": [release_info]}, indent=2, ensure_ascii=False)
-        result = json.dumps(release_info, indent=2, ensure_ascii=False)
-        print(result)
+        result = get_serializer(pretty=True).dumps(release_info)
+        print(result.decode("utf-8"))
 
     except Exception as e:
-        logging.error(f"An error occurred: {e}")
+        logger.error("An error occurred: %s", e)
 
 
 if __name__ == "__main__":
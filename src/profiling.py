@@ -0,0 +1,121 @@
+# src/profiling.py
+import json
+import time
+from contextlib import contextmanager
+
+
+class Stats:
+    """Wall time, calls, elements visited and exceptions of one handler or phase."""
+
+    __slots__ = ("kind", "calls", "elements", "errors", "seconds")
+
+    def __init__(self, kind, calls=0, elements=0, errors=0, seconds=0.0):
+        self.kind = kind
+        self.calls = calls
+        self.elements = elements
+        self.errors = errors
+        self.seconds = seconds
+
+    def add(self, other):
+        self.calls += other.calls
+        self.elements += other.elements
+        self.errors += other.errors
+        self.seconds += other.seconds
+
+    def as_dict(self):
+        return {
+            "kind": self.kind,
+            "calls": self.calls,
+            "elements": self.elements,
+            "errors": self.errors,
+            "seconds": self.seconds,
+        }
+
+
+class Profiler:
+    """
+    Collects timings of the field handlers and the conversion phases. One
+    profiler can be shared by every conversion of a batch; profilers of
+    worker processes are combined with merge().
+    """
+
+    def __init__(self):
+        self.stats = {}
+        self.notices = 0
+
+    def record(self, name, kind, seconds, elements=0, errors=0):
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = Stats(kind)
+        stats.calls += 1
+        stats.elements += elements
+        stats.errors += errors
+        stats.seconds += seconds
+
+    @contextmanager
+    def phase(self, name):
+        errors = 0
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            errors = 1
+            raise
+        finally:
+            self.record(name, "phase", time.perf_counter() - start, errors=errors)
+
+    def merge(self, other):
+        self.notices += other.notices
+        for name, stats in other.stats.items():
+            if name in self.stats:
+                self.stats[name].add(stats)
+            else:
+                self.stats[name] = Stats(**stats.as_dict())
+        return self
+
+    def as_dict(self):
+        return {
+            "notices": self.notices,
+            "stats": {name: stats.as_dict() for name, stats in self.stats.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        profiler = cls()
+        profiler.notices = data.get("notices", 0)
+        profiler.stats = {name: Stats(**stats) for name, stats in data["stats"].items()}
+        return profiler
+
+    def write_json(self, file_path):
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump(self.as_dict(), file, indent=2)
+
+    def format_table(self, limit=None):
+        """
+        Returns the stats as a text table, slowest first. Handler shares are of
+        the total handler time, phase shares of the total phase time.
+        """
+        totals = {}
+        for stats in self.stats.values():
+            totals[stats.kind] = totals.get(stats.kind, 0.0) + stats.seconds
+
+        rows = sorted(self.stats.items(), key=lambda item: item[1].seconds, reverse=True)
+        if limit is not None:
+            rows = rows[:limit]
+
+        width = max([len(name) for name, _ in rows] + [len("name")])
+        lines = [
+            f"{'name':<{width}}  {'kind':<7}{'calls':>8}{'elements':>10}{'errors':>8}"
+            f"{'total ms':>11}{'mean ms':>10}{'share':>8}"
+        ]
+        for name, stats in rows:
+            total = totals[stats.kind]
+            share = 100 * stats.seconds / total if total else 0.0
+            mean = stats.seconds / stats.calls if stats.calls else 0.0
+            lines.append(
+                f"{name:<{width}}  {stats.kind:<7}{stats.calls:>8}{stats.elements:>10}"
+                f"{stats.errors:>8}{1000 * stats.seconds:>11.2f}{1000 * mean:>10.3f}"
+                f"{share:>7.1f}%"
+            )
+        lines.append(f"{self.notices} notices profiled")
+        return "\n".join(lines)
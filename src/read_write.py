@@ -1,37 +1,423 @@
 # src/read_write.py
+import argparse
+import glob
 import json
-from lxml import etree
+import logging
+import os
 import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime, timezone
+from io import BytesIO
 
-# Assume mapper.py is stored in the same directory
-from mapper import eform_to_ocds, lookup_form_type, create_release  # Adjust the import path if necessary
+try:
+    # Run as a script from src/, next to mapper.py
+    from cache import DEFAULT_MAX_BYTES, ConversionCache, mapper_version
+    from manifest import Manifest, read_fingerprinted
+    from mapper import XMLParser, TEDtoOCDSConverter, iter_notices
+    from profiling import Profiler
+    from serialization import available_backends, get_serializer, write_json
+except ImportError:
+    from src.cache import DEFAULT_MAX_BYTES, ConversionCache, mapper_version
+    from src.manifest import Manifest, read_fingerprinted
+    from src.mapper import XMLParser, TEDtoOCDSConverter, iter_notices
+    from src.profiling import Profiler
+    from src.serialization import available_backends, get_serializer, write_json
+
+DEFAULT_CHUNK_SIZE = 16
+
+
+def configure_logging(level=logging.WARNING):
+    logging.basicConfig(
+        level=level, format="%(asctime)s - %(levelname)s - %(message)s", force=True
+    )
+
+def verbosity_level(verbose=0, quiet=False):
+    if quiet:
+        return logging.ERROR
+    return {0: logging.WARNING, 1: logging.INFO}.get(verbose, logging.DEBUG)
 
 def read_xml_file(file_path):
     with open(file_path, 'rb') as file:
         return file.read()
 
-def write_json_file(data, file_path):
-    with open(file_path, 'w', encoding='utf-8') as file:
-        json.dump(data, file, ensure_ascii=False, indent=4)
+def write_json_file(data, file_path, serializer=None, profiler=None):
+    if profiler is None:
+        write_json(data, file_path, serializer)
+        return
+    with profiler.phase("serialization"):
+        write_json(data, file_path, serializer)
 
-def main(xml_input_path, json_output_path):
-    try:
-        # Read the XML file
+_converter = None
+
+def process_converter(parser, profiler=None, deterministic_ids=False, lean=False):
+    """Returns the converter of this process, reset for the given notice."""
+    global _converter
+    if _converter is None:
+        _converter = TEDtoOCDSConverter()
+    _converter.profiler = profiler
+    _converter.deterministic_ids = deterministic_ids
+    _converter.lean = lean
+    return _converter.reset(parser)
+
+def convert_file(xml_input_path, profiler=None, deterministic_ids=False, lean=False, xml_data=None):
+    source = xml_input_path if xml_data is None else BytesIO(xml_data)
+    if profiler is None:
+        parser = XMLParser(source)
+    else:
+        with profiler.phase("parse_xml"):
+            parser = XMLParser(source)
+    return process_converter(parser, profiler, deterministic_ids, lean).convert_tender_to_ocds()
+
+def convert_cached(xml_input_path, cache, serializer=None, json_output_path=None, profiler=None, deterministic_ids=False, lean=False, xml_data=None):
+    """
+    Converts a notice through the conversion cache. A notice whose bytes were
+    converted before by the same mapper costs one hash and one read: its
+    serialized release is written out as it is. The file is read unless its
+    xml_data is given. Returns the release, or None when it was written to
+    json_output_path.
+    """
+    serializer = serializer or get_serializer(pretty=True)
+    if xml_data is None:
         xml_data = read_xml_file(xml_input_path)
-        # Convert XML to OCDS format
-        ocds_data = eform_to_ocds(xml_data, lookup_form_type)
-        # Create release(s)
-        releases = create_release(ocds_data)
-        # Write the OCDS JSON to a file
-        write_json_file(releases, json_output_path)
+    key = cache.key(xml_data, serializer, deterministic_ids)
+    encoded = cache.get(key)
+    release = None
+    if encoded is None:
+        if profiler is None:
+            parser = XMLParser(BytesIO(xml_data))
+        else:
+            with profiler.phase("parse_xml"):
+                parser = XMLParser(BytesIO(xml_data))
+        release = process_converter(parser, profiler, deterministic_ids, lean).convert_tender_to_ocds()
+        if profiler is None:
+            encoded = serializer.dumps(release)
+        else:
+            with profiler.phase("serialization"):
+                encoded = serializer.dumps(release)
+        cache.put(key, encoded)
+
+    if json_output_path is not None:
+        with open(json_output_path, "wb") as file:
+            file.write(encoded)
+        return None
+    return release if release is not None else json.loads(encoded)
+
+def convert_bulk_file(xml_input_path, profiler=None, deterministic_ids=False, lean=False):
+    """Yields the release of every notice in a bulk export, streaming the file."""
+    for parser in iter_notices(xml_input_path):
+        yield process_converter(parser, profiler, deterministic_ids, lean).convert_tender_to_ocds()
+
+def collect_notice_files(inputs):
+    """
+    Expands files, directories (every *.xml file below them) and glob patterns
+    into a sorted list of notice files without duplicates.
+    """
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.extend(glob.glob(os.path.join(item, "**", "*.xml"), recursive=True))
+        elif os.path.isfile(item):
+            paths.append(item)
+        else:
+            paths.extend(glob.glob(item, recursive=True))
+    return sorted(set(paths))
+
+def output_path_for(xml_input_path, output_dir, number=None, input_roots=()):
+    """
+    Returns the JSON path of a notice in output_dir. Notices found below one
+    of the input_roots directories keep their path below it, so the output
+    mirrors the subdirectories; other notices are named after the file.
+    """
+    path = os.path.abspath(xml_input_path)
+    name = os.path.basename(path)
+    # The outermost root wins when input directories are nested, so that
+    # notices below it keep their full relative path
+    for root in sorted(map(os.path.abspath, input_roots), key=len):
+        if path.startswith(os.path.join(root, "")):
+            name = os.path.relpath(path, root)
+            break
+    name = os.path.splitext(name)[0]
+    if number is not None:
+        name = f"{name}-{number:06d}"
+    return os.path.join(output_dir, name + ".json")
+
+def convert_chunk(xml_input_paths, output_dir=None, bulk=False, serializer=None, profiler=None, cache=None, deterministic_ids=False, lean=False, input_roots=(), fingerprints=False):
+    """
+    Converts a chunk of notice files in a worker process. With an output
+    directory each release is written there and only the status goes back to
+    the parent; otherwise the releases are returned for the release package.
+    In bulk mode every file is a multi-notice export that is streamed, and the
+    result for the file is the list of its releases.
+    Single-notice files go through the conversion cache when one is given.
+    With fingerprints, each single-notice file is fingerprinted for the
+    manifest from the bytes that are converted.
+    Returns (results, profiler): a list of (path, result, error, fingerprint)
+    tuples and the profiler, which travels back to the parent to be merged.
+    """
+    results = []
+    for xml_input_path in xml_input_paths:
+        fingerprint = None
+        try:
+            xml_data = None
+            if fingerprints and not bulk:
+                xml_data, fingerprint = read_fingerprinted(xml_input_path)
+            if bulk:
+                result = []
+                for number, release in enumerate(convert_bulk_file(xml_input_path, profiler, deterministic_ids, lean), 1):
+                    if output_dir is not None:
+                        write_json_file(release, output_path_for(xml_input_path, output_dir, number, input_roots), serializer, profiler)
+                    else:
+                        result.append(release)
+            elif cache is not None:
+                json_output_path = output_path_for(xml_input_path, output_dir, input_roots=input_roots) if output_dir is not None else None
+                result = convert_cached(xml_input_path, cache, serializer, json_output_path, profiler, deterministic_ids, lean, xml_data)
+            else:
+                result = convert_file(xml_input_path, profiler, deterministic_ids, lean, xml_data)
+                if output_dir is not None:
+                    write_json_file(result, output_path_for(xml_input_path, output_dir, input_roots=input_roots), serializer, profiler)
+                    result = None
+            results.append((xml_input_path, result, None, fingerprint))
+        except Exception as e:
+            results.append((xml_input_path, None, f"{type(e).__name__}: {e}", None))
+    if cache is not None:
+        # workers get their own copy of the cache; keep their hits
+        cache.flush()
+    return results, profiler
+
+def iter_chunks(items, chunk_size):
+    for start in range(0, len(items), chunk_size):
+        yield items[start:start + chunk_size]
+
+def convert_batch(xml_input_paths, output_dir=None, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, bulk=False, log_level=None, serializer=None, profiler=None, cache=None, deterministic_ids=False, manifest=None, lean=False, input_roots=()):
+    """
+    Converts the given notices on a process pool, submitting them in chunks
+    and keeping only a bounded number of chunks in flight. Failures are
+    collected per file and do not stop the batch.
+    Returns (releases, failures): releases maps each converted path to its
+    release, or to its list of releases in bulk mode (None when written to
+    output_dir); failures is a list of (path, error) in input order.
+    Worker processes configure logging with log_level when it is given.
+    With a profiler, the handler and phase timings of every conversion are
+    added to it, including those of the worker processes. With a
+    ConversionCache, notices converted before are served from it. With
+    deterministic_ids, converting the same notices again gives the same ids.
+    With a Manifest, only the notices that are new, changed or converted by
+    another mapper version are converted, and the manifest is updated.
+    With lean, every notice tree is freed before its release is assembled,
+    which lowers the peak memory of each worker.
+    Notices found below one of the input_roots directories are written to
+    the same subdirectories of output_dir. Raises ValueError before
+    converting anything when two notices would be written to the same file.
+    """
+    if manifest is not None and (output_dir is None or bulk):
+        raise ValueError("A manifest needs an output directory and single-notice files")
+    output_paths = {}
+    if output_dir is not None:
+        # Two notices with the same output would overwrite each other
+        written_by = {}
+        for path in xml_input_paths:
+            output_path = output_path_for(path, output_dir, input_roots=input_roots)
+            if output_path in written_by:
+                raise ValueError(
+                    f"{written_by[output_path]} and {path} would both be written to {output_path}"
+                )
+            written_by[output_path] = path
+            output_paths[path] = output_path
+        os.makedirs(output_dir, exist_ok=True)
+        for directory in {os.path.dirname(output_path) for output_path in written_by}:
+            os.makedirs(directory, exist_ok=True)
+    if manifest is not None:
+        xml_input_paths = manifest.pending(xml_input_paths, output_paths)
+
+    # The manifest records the files as they were read for conversion
+    fingerprints = manifest is not None
+    workers = workers or os.cpu_count() or 1
+    results = {}
+    chunks = iter_chunks(list(xml_input_paths), chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            chunk_results, _ = convert_chunk(chunk, output_dir, bulk, serializer, profiler, cache, deterministic_ids, lean, input_roots, fingerprints)
+            for path, release, error, fingerprint in chunk_results:
+                results[path] = (release, error, fingerprint)
+    else:
+        initializer, initargs = (configure_logging, (log_level,)) if log_level is not None else (None, ())
+        with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as executor:
+            max_in_flight = 2 * workers
+            pending = set()
+            for chunk in chunks:
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect_results(done, results, profiler)
+                chunk_profiler = Profiler() if profiler is not None else None
+                pending.add(executor.submit(convert_chunk, chunk, output_dir, bulk, serializer, chunk_profiler, cache, deterministic_ids, lean, input_roots, fingerprints))
+            collect_results(pending, results, profiler)
+
+    releases = {}
+    failures = []
+    for path in xml_input_paths:
+        release, error, _ = results[path]
+        if error is None:
+            releases[path] = release
+        else:
+            failures.append((path, error))
+
+    if manifest is not None:
+        for path in releases:
+            manifest.record(path, output_paths[path], results[path][2])
+        manifest.save()
+    return releases, failures
+
+def collect_results(futures, results, profiler=None):
+    for future in futures:
+        chunk_results, chunk_profiler = future.result()
+        for path, release, error, fingerprint in chunk_results:
+            results[path] = (release, error, fingerprint)
+        if profiler is not None:
+            profiler.merge(chunk_profiler)
+
+def create_release_package(releases):
+    return {
+        "version": "1.1",
+        "publishedDate": datetime.now(timezone.utc).isoformat(),
+        "releases": releases,
+    }
+
+def main(xml_input_path, json_output_path, cache=None, deterministic_ids=False):
+    try:
+        if cache is not None:
+            convert_cached(xml_input_path, cache, json_output_path=json_output_path, deterministic_ids=deterministic_ids)
+        else:
+            release = convert_file(xml_input_path, deterministic_ids=deterministic_ids)
+            write_json_file(release, json_output_path)
         print(f"Successfully converted XML to JSON. Output saved in '{json_output_path}'")
     except Exception as e:
         print(f"An error occurred: {e}", file=sys.stderr)
 
+def batch_main(argv=None):
+    arg_parser = argparse.ArgumentParser(
+        description="Convert eForms notices to OCDS releases."
+    )
+    arg_parser.add_argument(
+        "inputs", nargs="+", help="notice XML files, directories or glob patterns"
+    )
+    output = arg_parser.add_mutually_exclusive_group(required=True)
+    output.add_argument(
+        "-o", "--output-dir", help="write one <notice>.json release per notice here"
+    )
+    output.add_argument(
+        "-p", "--package", help="write all releases into one release package file"
+    )
+    arg_parser.add_argument(
+        "-w", "--workers", type=int, default=None,
+        help="number of worker processes (default: one per CPU)",
+    )
+    arg_parser.add_argument(
+        "--bulk", action="store_true",
+        help="inputs are multi-notice exports; stream them one notice at a time",
+    )
+    arg_parser.add_argument(
+        "-v", "--verbose", action="count", default=0,
+        help="log progress (-v) or debug details (-vv); only warnings by default",
+    )
+    arg_parser.add_argument(
+        "-q", "--quiet", action="store_true", help="only log errors"
+    )
+    arg_parser.add_argument(
+        "--compact", action="store_true", help="write JSON without indentation"
+    )
+    arg_parser.add_argument(
+        "--json-backend", choices=["auto"] + available_backends(), default="auto",
+        help="JSON library to serialize with (default: orjson when installed)",
+    )
+    arg_parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+        help="notices per task sent to a worker (default: %(default)s)",
+    )
+    arg_parser.add_argument(
+        "--deterministic-ids", action="store_true",
+        help="derive generated ids from the notice so repeated conversions give identical output",
+    )
+    arg_parser.add_argument(
+        "--lean", action="store_true",
+        help="free each notice tree before assembling its release, lowering peak memory per worker",
+    )
+    arg_parser.add_argument(
+        "--manifest", metavar="PATH",
+        help="JSON manifest of earlier runs; only convert notices that are new or changed since (needs -o)",
+    )
+    arg_parser.add_argument(
+        "--cache", metavar="PATH",
+        help="SQLite file caching releases by notice content; unchanged notices are not converted again",
+    )
+    arg_parser.add_argument(
+        "--cache-size", type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024), metavar="MB",
+        help="evict least recently used releases beyond this size (default: %(default)s)",
+    )
+    arg_parser.add_argument(
+        "--profile", action="store_true",
+        help="print the time spent in each field handler and conversion phase",
+    )
+    arg_parser.add_argument(
+        "--profile-json", metavar="PATH",
+        help="save the handler and phase timings as JSON",
+    )
+    args = arg_parser.parse_args(argv)
+    if args.manifest and (args.package or args.bulk):
+        arg_parser.error("--manifest works with --output-dir and single-notice files")
+    log_level = verbosity_level(args.verbose, args.quiet)
+    configure_logging(log_level)
+    serializer = get_serializer(args.json_backend, pretty=not args.compact)
+
+    xml_input_paths = collect_notice_files(args.inputs)
+    if not xml_input_paths:
+        print("No notice files found.", file=sys.stderr)
+        return 1
+
+    profiler = Profiler() if args.profile or args.profile_json else None
+    cache = ConversionCache(args.cache, max_bytes=args.cache_size * 1024 * 1024) if args.cache else None
+    manifest = None
+    if args.manifest:
+        options = f"{serializer.name}-{'compact' if args.compact else 'pretty'}-{'deterministic' if args.deterministic_ids else 'random'}"
+        manifest = Manifest(args.manifest, mapper_version(), options)
+    releases, failures = convert_batch(
+        xml_input_paths,
+        output_dir=args.output_dir,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        bulk=args.bulk,
+        log_level=log_level,
+        serializer=serializer,
+        profiler=profiler,
+        cache=cache,
+        deterministic_ids=args.deterministic_ids,
+        manifest=manifest,
+        lean=args.lean,
+        input_roots=[item for item in args.inputs if os.path.isdir(item)],
+    )
+    if args.package:
+        if args.bulk:
+            package_releases = [release for file_releases in releases.values() for release in file_releases]
+        else:
+            package_releases = list(releases.values())
+        write_json_file(create_release_package(package_releases), args.package, serializer, profiler)
+
+    if args.profile:
+        print(profiler.format_table(), file=sys.stderr)
+    if args.profile_json:
+        profiler.write_json(args.profile_json)
+
+    for path, error in failures:
+        print(f"Failed to convert {path}: {error}", file=sys.stderr)
+    print(f"Converted {len(releases)} of {len(xml_input_paths)} notices, {len(failures)} failed.")
+    if manifest is not None:
+        unchanged = len(xml_input_paths) - len(releases) - len(failures)
+        print(f"Skipped {unchanged} unchanged notices.")
+    return 1 if failures else 0
+
 if __name__ == '__main__':
-    if len(sys.argv) != 3:
-        print("Usage: python script.py <input_path.xml> <output_path.json>")
+    args = sys.argv[1:]
+    if len(args) == 2 and os.path.isfile(args[0]) and args[1].endswith(".json"):
+        configure_logging()
+        main(args[0], args[1])
     else:
-        xml_input_path = sys.argv[1]
-        json_output_path = sys.argv[2]
-        main(xml_input_path, json_output_path)
\ No newline at end of file
+        sys.exit(batch_main(args))
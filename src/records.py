@@ -0,0 +1,199 @@
+# src/records.py
+from collections.abc import MutableMapping
+
+_UNSET = object()
+
+
+class Record(MutableMapping):
+    """
+    An intermediate release object (party, lot, bid, award or contract). The
+    OCDS fields the mapping sets are kept in slots instead of a per-object
+    dict; any other field goes to an overflow dict that is only created when
+    needed. Records support the dict operations the field handlers use, so
+    they can be filled like the plain OCDS objects they replace, and are
+    turned into plain objects once, by to_ocds(), when the release is
+    assembled.
+    """
+
+    FIELDS = ()
+    __slots__ = ("_extra",)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Slots are the field names with a leading underscore, so a field
+        # such as "items" does not hide the mapping method of the same name.
+        cls._slots = {field: "_" + field for field in cls.FIELDS}
+
+    def __init__(self, fields=(), **kwargs):
+        self._extra = None
+        for key, value in (fields.items() if hasattr(fields, "items") else fields):
+            self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    @classmethod
+    def of(cls, item):
+        """Returns item as a record of this type, wrapping plain dicts."""
+        return item if isinstance(item, cls) else cls(item)
+
+    def __getitem__(self, key):
+        slot = self._slots.get(key)
+        if slot is not None:
+            value = getattr(self, slot, _UNSET)
+            if value is not _UNSET:
+                return value
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        slot = self._slots.get(key)
+        if slot is not None:
+            setattr(self, slot, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        slot = self._slots.get(key)
+        if slot is not None:
+            try:
+                delattr(self, slot)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        slot = self._slots.get(key)
+        if slot is not None:
+            return hasattr(self, slot)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self):
+        for field, slot in self._slots.items():
+            if hasattr(self, slot):
+                yield field
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __bool__(self):
+        return next(iter(self), _UNSET) is not _UNSET
+
+    def get(self, key, default=None):
+        slot = self._slots.get(key)
+        if slot is not None:
+            return getattr(self, slot, default)
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    def to_ocds(self):
+        """
+        Returns the record as a plain OCDS object, fields in the order of
+        FIELDS, then the other fields in the order they were set. Unset, None
+        and empty fields are left out, and nested records are emitted too.
+        """
+        data = {}
+        for key, value in self.items():
+            if isinstance(value, Record):
+                value = value.to_ocds()
+            elif isinstance(value, list):
+                value = [item.to_ocds() if isinstance(item, Record) else item for item in value]
+            if value is None or value == [] or value == {}:
+                continue
+            data[key] = value
+        return data
+
+
+class Party(Record):
+    FIELDS = (
+        "id",
+        "roles",
+        "name",
+        "identifier",
+        "additionalIdentifiers",
+        "address",
+        "contactPoint",
+        "details",
+        "beneficialOwners",
+    )
+    __slots__ = tuple("_" + field for field in FIELDS)
+
+
+class Lot(Record):
+    FIELDS = (
+        "id",
+        "title",
+        "description",
+        "status",
+        "value",
+        "contractPeriod",
+        "submissionTerms",
+        "secondStage",
+        "awardCriteria",
+        "contractTerms",
+    )
+    __slots__ = tuple("_" + field for field in FIELDS)
+
+
+class Bid(Record):
+    FIELDS = (
+        "id",
+        "relatedLots",
+        "value",
+        "tenderers",
+        "hasSubcontracting",
+        "subcontracting",
+        "rank",
+        "hasRank",
+        "identifiers",
+        "countriesOfOrigin",
+        "variant",
+    )
+    __slots__ = tuple("_" + field for field in FIELDS)
+
+
+class Award(Record):
+    FIELDS = (
+        "id",
+        "relatedLots",
+        "status",
+        "statusDetails",
+        "date",
+        "value",
+        "contracts",
+        "suppliers",
+        "buyers",
+        "documents",
+    )
+    __slots__ = tuple("_" + field for field in FIELDS)
+
+
+class Contract(Record):
+    FIELDS = (
+        "id",
+        "awardID",
+        "relatedBids",
+        "dateSigned",
+        "title",
+        "status",
+        "value",
+        "identifiers",
+        "documents",
+        "buyers",
+        "suppliers",
+    )
+    __slots__ = tuple("_" + field for field in FIELDS)
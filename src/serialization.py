@@ -0,0 +1,81 @@
+# src/serialization.py
+import json
+import logging
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+class StdlibSerializer:
+    """Serializes with the standard library json module, streaming the encoded chunks."""
+
+    name = "json"
+
+    def __init__(self, pretty=False):
+        self.pretty = pretty
+
+    def encoder(self):
+        if self.pretty:
+            return json.JSONEncoder(ensure_ascii=False, indent=2)
+        return json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def dumps(self, data):
+        return self.encoder().encode(data).encode("utf-8")
+
+    def write(self, data, file):
+        for chunk in self.encoder().iterencode(data):
+            file.write(chunk.encode("utf-8"))
+
+
+class OrjsonSerializer:
+    """Serializes with orjson, which encodes straight to UTF-8 bytes."""
+
+    name = "orjson"
+
+    def __init__(self, pretty=False):
+        self.pretty = pretty
+        self.option = orjson.OPT_INDENT_2 if pretty else 0
+        self.fallback = StdlibSerializer(pretty)
+
+    def dumps(self, data):
+        try:
+            return orjson.dumps(data, option=self.option)
+        except orjson.JSONEncodeError as e:
+            # e.g. integers beyond 64 bits, which the stdlib encoder handles
+            logger.warning("orjson could not serialize the release, using json: %s", e)
+            return self.fallback.dumps(data)
+
+    def write(self, data, file):
+        file.write(self.dumps(data))
+
+
+SERIALIZERS = {
+    "orjson": OrjsonSerializer,
+    "json": StdlibSerializer,
+}
+
+
+def available_backends():
+    return [name for name in SERIALIZERS if name != "orjson" or orjson is not None]
+
+
+def get_serializer(backend="auto", pretty=False):
+    """
+    Returns a serializer for the given backend: "orjson", "json", or "auto"
+    for orjson when it is installed and the stdlib otherwise.
+    """
+    if backend == "auto":
+        backend = "orjson" if orjson is not None else "json"
+    if backend not in available_backends():
+        raise ValueError(f"JSON backend not available: {backend}")
+    return SERIALIZERS[backend](pretty=pretty)
+
+
+def write_json(data, file_path, serializer=None):
+    serializer = serializer or get_serializer(pretty=True)
+    with open(file_path, "wb") as file:
+        serializer.write(data, file)
@@ -1,10 +1,44 @@
 import unittest
 from datetime import datetime
 import dateutil.parser  # Ensure this is imported for timezone info
+import json
 import logging
 import os
+import shutil
+import tempfile
+from io import BytesIO
+from unittest import mock
 
-from src.mapper import XMLParser, TEDtoOCDSConverter, parse_iso_date  # Adjust the import as per the actual module
+from lxml import etree
+
+from src.mapper import (
+    FieldMapping,
+    FieldMappingPlan,
+    IndexedList,
+    PartyRoleResolver,
+    ReleaseBuilder,
+    TEDtoOCDSConverter,
+    TreeWalker,
+    XMLParser,
+    XPathCache,
+    handles,
+    iter_notices,
+    merge_roles,
+    parse_iso_date,
+    plan_handlers,
+)
+from src.cache import ConversionCache
+from src.manifest import Manifest
+from src.profiling import Profiler
+from src.records import Award, Bid, Party
+from src.serialization import available_backends, get_serializer, write_json
+from src.read_write import (
+    collect_notice_files,
+    convert_batch,
+    convert_file,
+    create_release_package,
+    verbosity_level,
+)
 
 # Enable logging for testing
 logging.basicConfig(level=logging.DEBUG)
@@ -40,6 +74,209 @@ class TestXMLParser(unittest.TestCase):
         result = self.parser.find_attribute(self.parser.root, ".//cbc:Name", "lang")
         self.assertIsNone(result)  # Since 'lang' attribute doesn't exist in the test XML
 
+    def test_find_node_and_nodes(self):
+        self.assertIsNotNone(self.parser.find_node(self.parser.root, ".//cbc:Name"))
+        self.assertIsNone(self.parser.find_node(self.parser.root, ".//InvalidPath"))
+        self.assertEqual(self.parser.find_nodes(self.parser.root, ".//InvalidPath"), [])
+
+
+class TestIterNotices(unittest.TestCase):
+    def bulk_export(self, *names):
+        notices = []
+        for name in names:
+            with open(os.path.join("tests", "sample_xml", name), "rb") as file:
+                notices.append(file.read().split(b"?>", 1)[1])
+        return BytesIO(b"<Notices>" + b"".join(notices) + b"</Notices>")
+
+    def test_yields_one_notice_at_a_time(self):
+        source = self.bulk_export("example_with_notice_result.xml", "example_with_notice_result.xml")
+        seen = []
+        for parser in iter_notices(source):
+            # Earlier notices are gone from the tree by the time the next one is yielded.
+            self.assertIsNone(parser.root.getprevious())
+            seen.append(parser.find_text(parser.root, "./cbc:ContractFolderID"))
+        self.assertEqual(len(seen), 2)
+
+    def test_streamed_notice_converts_like_a_file(self):
+        path = os.path.join("tests", "sample_xml", "example_with_notice_result.xml")
+        expected = TEDtoOCDSConverter(XMLParser(path)).convert_tender_to_ocds()
+        parser = next(iter_notices(self.bulk_export("example_with_notice_result.xml")))
+        result = TEDtoOCDSConverter(parser).convert_tender_to_ocds()
+        for key in ("parties", "tender", "awards", "contracts", "bids"):
+            self.assertEqual(result[key], expected[key])
+
+
+class TestXPathCache(unittest.TestCase):
+    def test_compiled_expressions_are_reused(self):
+        cache = XPathCache(maxsize=2)
+        first = cache.get(".//cbc:Name")
+        self.assertIs(cache.get(".//cbc:Name"), first)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_cache_is_bounded(self):
+        cache = XPathCache(maxsize=2)
+        for xpath in ("./cbc:ID", "./cbc:Name", "./cbc:Note"):
+            cache.get(xpath)
+        self.assertEqual(cache.info()["size"], 2)
+        cache.get("./cbc:ID")
+        self.assertEqual(cache.misses, 4)
+
+    def test_namespaces_are_part_of_the_key(self):
+        cache = XPathCache()
+        default = cache.get("./x:ID", {"x": "urn:a"})
+        other = cache.get("./x:ID", {"x": "urn:b"})
+        self.assertIsNot(default, other)
+
+
+
+class TestTreeWalker(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = XMLParser(os.path.join("tests", "sample_xml", "example_with_notice_result.xml"))
+        cls.walker = TreeWalker(cls.parser.root)
+
+    def test_walk_groups_scopes(self):
+        self.assertEqual(len(self.walker.elements("lot")), 2)
+        self.assertEqual(len(self.walker.elements("lot_result")), 1)
+        self.assertEqual(len(self.walker.elements("organization")), 2)
+        self.assertEqual(self.walker.elements("notice"), [self.parser.root])
+
+    def test_walk_skips_id_references(self):
+        # LotTender and SettledContract references inside LotResult and
+        # SettledContract must not be handed to the handlers.
+        self.assertEqual(len(self.walker.elements("lot_tender")), 1)
+        self.assertEqual(len(self.walker.elements("settled_contract")), 1)
+        self.assertTrue(self.walker.has_notice_result)
+
+    def test_elements_by_scheme(self):
+        parts = self.walker.elements("lot", "Part")
+        self.assertEqual([self.walker.scheme_name(part) for part in parts], ["Part"])
+
+    def test_dispatch(self):
+        seen = []
+
+        @handles("lot", scheme="Lot")
+        def lot_handler(lot):
+            seen.append(self.parser.find_text(lot, "./cbc:ID"))
+
+        def failing_handler(root):
+            raise ValueError("boom")
+
+        self.walker.dispatch([failing_handler, lot_handler])
+        self.assertEqual(seen, ["LOT-0001"])
+
+
+class TestHandlerPlan(unittest.TestCase):
+    def test_readers_run_after_writers_and_duplicates_once(self):
+        @handles(reads=("awards",))
+        def award_reader(root):
+            pass
+
+        @handles(writes=("parties",))
+        def party_writer(root):
+            pass
+
+        @handles("lot_result", writes=("awards",))
+        def award_writer(lot_result):
+            pass
+
+        plan = plan_handlers([award_reader, party_writer, award_reader, award_writer, party_writer])
+        self.assertEqual([handler.__name__ for handler in plan], ["party_writer", "award_writer", "award_reader"])
+
+    def test_invalid_declarations(self):
+        @handles(reads=("awards",), writes=("parties",))
+        def first(root):
+            pass
+
+        @handles(reads=("parties",), writes=("awards",))
+        def second(root):
+            pass
+
+        def undeclared(root):
+            pass
+
+        with self.assertRaises(ValueError):
+            plan_handlers([first, second])
+        with self.assertRaises(ValueError):
+            plan_handlers([undeclared])
+
+    def test_converter_plan(self):
+        plan = TEDtoOCDSConverter.handler_plan()
+        self.assertEqual(len(plan), len(set(plan)))
+        self.assertEqual(set(plan), set(TEDtoOCDSConverter.HANDLERS))
+        self.assertLess(plan.index("fetch_bt13713_lotresult"), plan.index("fetch_bt720_tender_value"))
+        self.assertLess(plan.index("fetch_bt150_contract_identifier"), plan.index("fetch_opt_300_contract_signatory"))
+
+    def test_plan_without_results(self):
+        plan = TEDtoOCDSConverter.handler_plan(with_results=False)
+        self.assertNotIn("fetch_bt720_tender_value", plan)
+        self.assertNotIn("fetch_bt710_bt711_bid_statistics", plan)
+        self.assertIn("map_notice_fields", plan)
+        self.assertLess(set(plan), set(TEDtoOCDSConverter.handler_plan()))
+
+    def test_competition_notice_skips_result_handlers(self):
+        profiler = Profiler()
+        parser = XMLParser(os.path.join("tests", "sample_xml", "example_with_bt03_notice.xml"))
+        TEDtoOCDSConverter(parser, profiler).convert_tender_to_ocds()
+        self.assertNotIn("fetch_lot_tender", profiler.stats)
+        self.assertIn("map_notice_fields", profiler.stats)
+
+
+class TestElementIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = XMLParser(os.path.join("tests", "sample_xml", "example_with_notice_result.xml"))
+
+    def test_index_is_built_once(self):
+        self.assertIs(self.parser.index, self.parser.index)
+
+    def test_lookup_by_id(self):
+        index = self.parser.index
+        self.assertEqual(set(index.lots), {"LOT-0001", "PAR-0001"})
+        self.assertEqual(index.organization_name("ORG-0002"), "Test Supplier")
+        self.assertIsNone(index.organization_name("ORG-9999"))
+        # The reference inside LotResult must not shadow the NoticeResult child.
+        self.assertIsNotNone(
+            self.parser.find_node(index.lot_tenders["TEN-0001"], "./cbc:RankCode")
+        )
+        self.assertIsNotNone(
+            self.parser.find_node(index.tendering_parties["TPA-0001"], "./efac:Tenderer")
+        )
+
+    def test_reverse_references(self):
+        index = self.parser.index
+        self.assertEqual(index.lot_results_by_contract["CON-0001"], [index.lot_results["RES-0001"]])
+        self.assertEqual(index.settled_contracts_by_tender["TEN-0001"], [index.settled_contracts["CON-0001"]])
+
+
+class TestReleaseBuilder(unittest.TestCase):
+    def test_indexed_list_keeps_order_and_index(self):
+        items = IndexedList([{"id": "b"}, {"id": "a"}])
+        items.append({"id": "c"})
+        self.assertEqual([item["id"] for item in items], ["b", "a", "c"])
+        self.assertIs(items.get("a"), items[1])
+        items.pop(0)
+        self.assertIsNone(items.get("b"))
+
+    def test_party_get_or_create(self):
+        builder = ReleaseBuilder()
+        party = builder.party("ORG-0001", roles=["buyer"])
+        self.assertIs(builder.party("ORG-0001"), party)
+        self.assertEqual(len(builder.parties), 1)
+
+    def test_upsert_merges_existing(self):
+        builder = ReleaseBuilder()
+        merge = lambda existing, new: existing.update(new)
+        builder.upsert(builder.lots, {"id": "LOT-0001", "title": "A"}, merge)
+        builder.upsert(builder.lots, {"id": "LOT-0001", "description": "B"}, merge)
+        self.assertEqual(list(builder.lots), [{"id": "LOT-0001", "title": "A", "description": "B"}])
+
+    def test_contracts_are_indexed(self):
+        builder = ReleaseBuilder()
+        contract = builder.add_contract({"id": "CON-0001"})
+        self.assertIs(builder.contract("CON-0001"), contract)
+        self.assertEqual(len(builder.awards), 0)
+        self.assertEqual(builder.all_contracts(), [contract])
 
 
 class TestTEDtoOCDSConverter(unittest.TestCase):
@@ -48,6 +285,22 @@ class TestTEDtoOCDSConverter(unittest.TestCase):
         cls.parser = XMLParser(os.path.join("tests", "sample_xml", "example.xml"))
         cls.converter = TEDtoOCDSConverter(cls.parser)
 
+    def test_clean_release_structure(self):
+        release = {
+            "id": "1",
+            "empty": "",
+            "zero": 0,
+            "tender": {"lots": [{"id": "LOT-0001", "title": None}, None, {}, []], "items": [{"x": None}]},
+            "parties": [],
+            "awards": [{"suppliers": [], "value": {"amount": None}}],
+        }
+        cleaned = self.converter.clean_release_structure(release)
+        self.assertIs(cleaned, release)
+        self.assertEqual(
+            cleaned,
+            {"id": "1", "tender": {"lots": [{"id": "LOT-0001"}], "items": [{}]}, "awards": [{}]},
+        )
+
     def test_get_dispatch_date_time(self):
         result = self.converter.get_dispatch_date_time()
         self.assertIsNone(result)  # Since IssueDate and IssueTime are missing in the test XML
@@ -139,5 +392,784 @@ class TestTEDtoOCDSConverter(unittest.TestCase):
         self.assertEqual(result.get("tender", {}).get("status"), expected_status)
 
 
+class TestConverterReuse(unittest.TestCase):
+    def test_reset_matches_fresh_converter(self):
+        paths = [
+            os.path.join("tests", "sample_xml", "example_with_notice_result.xml"),
+            os.path.join("tests", "sample_xml", "example_with_bt03_notice.xml"),
+        ]
+        converter = TEDtoOCDSConverter()
+        first = converter.reset(XMLParser(paths[0])).convert_tender_to_ocds()
+        first_parties = json.dumps(first["parties"], sort_keys=True)
+        second = converter.reset(XMLParser(paths[1])).convert_tender_to_ocds()
+        fresh = TEDtoOCDSConverter(XMLParser(paths[1])).convert_tender_to_ocds()
+        self.assertEqual(json.dumps(first["parties"], sort_keys=True), first_parties)
+        self.assertEqual(second["tag"], fresh["tag"])
+        self.assertEqual(len(second.get("parties", [])), len(fresh.get("parties", [])))
+
+    def test_deterministic_ids(self):
+        path = os.path.join("tests", "sample_xml", "example_with_notice_result.xml")
+        releases = [
+            TEDtoOCDSConverter(XMLParser(path), deterministic_ids=True).convert_tender_to_ocds()
+            for _ in range(2)
+        ]
+        self.assertEqual(json.dumps(releases[0]), json.dumps(releases[1]))
+        random_release = TEDtoOCDSConverter(XMLParser(path)).convert_tender_to_ocds()
+        self.assertNotEqual(random_release["id"], releases[0]["id"])
+
+    def test_lean_conversion(self):
+        path = os.path.join("tests", "sample_xml", "example_with_notice_result.xml")
+        release = TEDtoOCDSConverter(XMLParser(path), deterministic_ids=True).convert_tender_to_ocds()
+        parser = XMLParser(path)
+        converter = TEDtoOCDSConverter(parser, deterministic_ids=True, lean=True)
+        lean_release = converter.convert_tender_to_ocds()
+        self.assertEqual(json.dumps(lean_release), json.dumps(release))
+        self.assertIsNone(parser.root)
+        # the id factory keeps the notice path, not the tree
+        self.assertIsInstance(converter.release.ids.root_path, str)
+        self.assertEqual(converter.awards, [])
+        self.assertEqual(converter.parties, [])
+
+    def test_merge_roles_keeps_order(self):
+        self.assertEqual(merge_roles(["tenderer", "buyer"], ["supplier", "tenderer"]), ["tenderer", "buyer", "supplier"])
+
+    def test_code_tables_are_read_only(self):
+        converter = TEDtoOCDSConverter()
+        with self.assertRaises(TypeError):
+            converter.form_type_mapping["planning"] = {}
+        release = converter.reset(
+            XMLParser(os.path.join("tests", "sample_xml", "example_with_bt03_notice.xml"))
+        ).convert_tender_to_ocds()
+        release["tag"].append("planning")
+        self.assertEqual(converter.get_form_type(None, "competition")["tag"], ("tender",))
+        self.assertEqual(converter.convert_language_code("NOR"), "no")
+
+
+class TestFieldMappings(unittest.TestCase):
+    LOT_XML = b"""<cac:ProcurementProjectLot
+        xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+        xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2">
+      <cbc:ID schemeName="Lot">LOT-0001</cbc:ID>
+      <cac:TenderingTerms>
+        <cbc:VariantConstraintCode listName="permission">allowed</cbc:VariantConstraintCode>
+      </cac:TenderingTerms>
+      <cac:TenderingProcess>
+        <cac:EconomicOperatorShortList>
+          <cbc:LimitationDescription>false</cbc:LimitationDescription>
+        </cac:EconomicOperatorShortList>
+      </cac:TenderingProcess>
+    </cac:ProcurementProjectLot>"""
+
+    def test_plan_extracts_nested_values(self):
+        plan = FieldMappingPlan(
+            [
+                FieldMapping("BT-63", "./cbc:ID", "lot.id", scope="lot"),
+                FieldMapping("BT-99", "./cbc:ID/@schemeName", "lot.scheme", str.lower, scope="lot"),
+                FieldMapping("BT-98", "./cbc:Missing", "lot.missing", scope="lot"),
+            ]
+        )
+        lot = etree.fromstring(self.LOT_XML)
+        self.assertEqual(plan.extract(lot, "lot"), {"lot": {"id": "LOT-0001", "scheme": "lot"}})
+        self.assertEqual(plan.extract(lot), {})
+
+    def test_lot_fields(self):
+        lot = etree.fromstring(self.LOT_XML)
+        converter = TEDtoOCDSConverter(XMLParser.from_element(lot))
+        converter.map_lot_fields(lot)
+        self.assertEqual(
+            converter.tender["lots"],
+            [{"id": "LOT-0001", "submissionTerms": {"variantPolicy": "allowed"}}],
+        )
+
+    def test_notice_fields(self):
+        path = os.path.join("tests", "sample_xml", "example_with_bt03_notice.xml")
+        converter = TEDtoOCDSConverter(XMLParser(path))
+        converter.map_notice_fields(converter.parser.root)
+        expected = converter.parser.find_text(
+            converter.parser.root, ".//cac:TenderingProcess/cbc:Description"
+        )
+        self.assertEqual(converter.tender.get("procurementMethodDetails"), expected)
+
+    def convert_with_lot_terms(self, lot_distribution="", part_presentation=""):
+        with open(os.path.join("tests", "sample_xml", "example_with_notice_result.xml"), "rb") as file:
+            xml_data = file.read()
+        xml_data = xml_data.replace(
+            b"  <cac:TenderingProcess>\n",
+            b"  <cac:TenderingTerms><cac:LotDistribution>" + lot_distribution.encode()
+            + b"</cac:LotDistribution></cac:TenderingTerms>\n  <cac:TenderingProcess>\n"
+            + part_presentation.encode(),
+            1,
+        )
+        return TEDtoOCDSConverter(XMLParser(BytesIO(xml_data))).convert_tender_to_ocds()
+
+    def test_lot_details_reach_the_release(self):
+        release = self.convert_with_lot_terms(
+            "<cbc:MaximumLotsAwardedNumeric>2</cbc:MaximumLotsAwardedNumeric>"
+            "<cbc:MaximumLotsSubmittedNumeric>3</cbc:MaximumLotsSubmittedNumeric>"
+        )
+        self.assertEqual(
+            release["tender"]["lotDetails"],
+            {"maximumLotsBidPerSupplier": 3, "maximumLotsAwardedPerSupplier": 2},
+        )
+
+    def test_maximum_lots_take_precedence_over_all_lots_required(self):
+        part_presentation = (
+            '<cbc:PartPresentationCode listName="tenderlot-presentation">all</cbc:PartPresentationCode>'
+        )
+        release = self.convert_with_lot_terms(part_presentation=part_presentation)
+        self.assertEqual(release["tender"]["lotDetails"], {"maximumLotsBidPerSupplier": 1})
+        release = self.convert_with_lot_terms(
+            "<cbc:MaximumLotsSubmittedNumeric>3</cbc:MaximumLotsSubmittedNumeric>", part_presentation
+        )
+        self.assertEqual(release["tender"]["lotDetails"], {"maximumLotsBidPerSupplier": 3})
+
+
+class TestAwardCriteria(unittest.TestCase):
+    LOT_XML = b"""<cac:ProcurementProjectLot
+        xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+        xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
+        xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
+        xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
+        xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
+        xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1">
+      <cbc:ID schemeName="Lot">LOT-0001</cbc:ID>
+      <cac:TenderingTerms>
+        <cac:AwardingTerms>
+          <cac:AwardingCriterion>
+            <cbc:Description>Ordered by importance</cbc:Description>
+            <cbc:CalculationExpression>Weighted sum</cbc:CalculationExpression>
+            <cac:SubordinateAwardingCriterion>
+              <ext:UBLExtensions><ext:UBLExtension><ext:ExtensionContent><efext:EformsExtension>
+                <efac:AwardCriterionParameter>
+                  <efbc:ParameterCode listName="number-weight">percentageExact</efbc:ParameterCode>
+                  <efbc:ParameterNumeric>60</efbc:ParameterNumeric>
+                </efac:AwardCriterionParameter>
+              </efext:EformsExtension></ext:ExtensionContent></ext:UBLExtension></ext:UBLExtensions>
+              <cbc:AwardingCriterionTypeCode listName="award-criterion-type">quality</cbc:AwardingCriterionTypeCode>
+              <cbc:Name>Quality</cbc:Name>
+              <cbc:Description>Quality of the service</cbc:Description>
+            </cac:SubordinateAwardingCriterion>
+            <cac:SubordinateAwardingCriterion>
+              <cbc:AwardingCriterionTypeCode listName="award-criterion-type">price</cbc:AwardingCriterionTypeCode>
+            </cac:SubordinateAwardingCriterion>
+          </cac:AwardingCriterion>
+        </cac:AwardingTerms>
+      </cac:TenderingTerms>
+    </cac:ProcurementProjectLot>"""
+
+    def test_complete_criteria_in_one_pass(self):
+        lot = etree.fromstring(self.LOT_XML)
+        converter = TEDtoOCDSConverter(XMLParser.from_element(lot))
+        converter.fetch_award_criteria(lot)
+        expected = {
+            "weightingDescription": "Weighted sum",
+            "orderRationale": "Ordered by importance",
+            "criteria": [
+                {
+                    "type": "quality",
+                    "description": "Quality of the service",
+                    "numbers": [{"number": 60.0, "weight": "percentageExact"}],
+                    "name": "Quality",
+                },
+                {"type": "price"},
+            ],
+        }
+        self.assertEqual(converter.tender["lots"][0]["awardCriteria"], expected)
+        self.assertIs(converter.lot_award_criteria("LOT-0001", lot), converter.tender["lots"][0]["awardCriteria"])
+
+    def test_lot_without_criteria(self):
+        lot = etree.fromstring(b'<cac:ProcurementProjectLot xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"/>')
+        converter = TEDtoOCDSConverter(XMLParser.from_element(lot))
+        self.assertIsNone(converter.extract_award_criteria(lot))
+
+
+class TestPartyRoles(unittest.TestCase):
+    NOTICE_XML = b"""<ContractNotice
+        xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+        xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2">
+      <cac:ContractingParty>
+        <cac:Party><cac:PartyIdentification><cbc:ID>ORG-0001</cbc:ID></cac:PartyIdentification></cac:Party>
+        <cac:ServiceProviderParty>
+          <cac:Party><cac:PartyIdentification><cbc:ID>ORG-0009</cbc:ID></cac:PartyIdentification></cac:Party>
+        </cac:ServiceProviderParty>
+      </cac:ContractingParty>
+      <cac:ProcurementProjectLot>
+        <cbc:ID schemeName="Lot">LOT-0001</cbc:ID>
+        <cac:TenderingTerms>
+          <cac:EmploymentLegislationDocumentReference>
+            <cbc:ID>Employment</cbc:ID>
+            <cac:IssuerParty><cac:PartyIdentification><cbc:ID>ORG-0002</cbc:ID></cac:PartyIdentification></cac:IssuerParty>
+          </cac:EmploymentLegislationDocumentReference>
+          <cac:DocumentProviderParty><cac:PartyIdentification><cbc:ID>ORG-0001</cbc:ID></cac:PartyIdentification></cac:DocumentProviderParty>
+          <cac:AdditionalInformationParty><cac:PartyIdentification><cbc:ID>ORG-0001</cbc:ID></cac:PartyIdentification></cac:AdditionalInformationParty>
+          <cac:AppealTerms>
+            <cac:MediationParty><cac:PartyIdentification><cbc:ID>ORG-0003</cbc:ID></cac:PartyIdentification></cac:MediationParty>
+          </cac:AppealTerms>
+        </cac:TenderingTerms>
+      </cac:ProcurementProjectLot>
+    </ContractNotice>"""
+
+    def test_resolve_in_document_order(self):
+        root = etree.fromstring(self.NOTICE_XML)
+        roles = TEDtoOCDSConverter.PARTY_ROLES.resolve(root)
+        self.assertEqual(
+            roles,
+            {
+                "ORG-0001": ["buyer", "processContactPoint"],
+                "ORG-0002": ["informationService"],
+                "ORG-0003": ["mediationBody"],
+            },
+        )
+
+    def test_roles_are_merged_into_parties(self):
+        root = etree.fromstring(self.NOTICE_XML)
+        converter = TEDtoOCDSConverter(XMLParser.from_element(root))
+        converter.get_or_create_organization(converter.parties, "ORG-0003", roles=["buyer"])
+        converter.fetch_party_roles(root)
+        self.assertEqual(converter.release.parties.get("ORG-0003")["roles"], ["buyer", "mediationBody"])
+        self.assertEqual([party["id"] for party in converter.parties], ["ORG-0003", "ORG-0001", "ORG-0002"])
+
+    def test_custom_references(self):
+        resolver = PartyRoleResolver([("cac:Party", "cac:ServiceProviderParty", "procurementServiceProvider")])
+        self.assertEqual(
+            resolver.resolve(etree.fromstring(self.NOTICE_XML)),
+            {"ORG-0009": ["procurementServiceProvider"]},
+        )
+
+
+class TestOrganizations(unittest.TestCase):
+    ORGANIZATIONS_XML = b"""<efac:Organizations
+        xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
+        xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1"
+        xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+        xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2">
+      <efac:Organization>
+        <efbc:NaturalPersonIndicator>true</efbc:NaturalPersonIndicator>
+        <efac:UltimateBeneficialOwner><cbc:ID schemeName="ubo">UBO-0001</cbc:ID></efac:UltimateBeneficialOwner>
+        <efac:Company>
+          <cbc:WebsiteURI>https://example.com</cbc:WebsiteURI>
+          <cac:PartyIdentification><cbc:ID schemeName="organization">ORG-0001</cbc:ID></cac:PartyIdentification>
+          <cac:PartyName><cbc:Name>Supplier</cbc:Name></cac:PartyName>
+          <cac:PostalAddress>
+            <cbc:CityName>Oslo</cbc:CityName>
+            <cbc:Department>Sales</cbc:Department>
+          </cac:PostalAddress>
+          <cac:Contact><cbc:ElectronicMail>sales@example.com</cbc:ElectronicMail></cac:Contact>
+        </efac:Company>
+        <efac:TouchPoint>
+          <cac:PartyIdentification><cbc:ID schemeName="touchpoint">TPO-0001</cbc:ID></cac:PartyIdentification>
+          <cac:PartyName><cbc:Name>Supplier desk</cbc:Name></cac:PartyName>
+          <cac:Contact><cbc:Telephone>+47 12345678</cbc:Telephone></cac:Contact>
+        </efac:TouchPoint>
+      </efac:Organization>
+      <efac:Organization>
+        <efac:Company>
+          <efbc:CompanySizeCode>SME</efbc:CompanySizeCode>
+          <cac:PartyIdentification><cbc:ID schemeName="organization">ORG-0002</cbc:ID></cac:PartyIdentification>
+        </efac:Company>
+      </efac:Organization>
+      <efac:UltimateBeneficialOwner>
+        <cbc:ID schemeName="ubo">UBO-0001</cbc:ID>
+        <cbc:FirstName>Kari</cbc:FirstName>
+        <cbc:FamilyName>Nordmann</cbc:FamilyName>
+        <cac:Contact><cbc:ElectronicMail>kari@example.com</cbc:ElectronicMail></cac:Contact>
+      </efac:UltimateBeneficialOwner>
+    </efac:Organizations>"""
+
+    def setUp(self):
+        root = etree.fromstring(self.ORGANIZATIONS_XML)
+        self.converter = TEDtoOCDSConverter(XMLParser.from_element(root))
+        for org_element in TreeWalker(root).elements("organization"):
+            self.converter.fetch_organization(org_element)
+
+    def test_company_party(self):
+        party = self.converter.release.parties.get("ORG-0001")
+        self.assertEqual(party["name"], "Supplier - Sales")
+        self.assertEqual(party["address"]["locality"], "Oslo")
+        self.assertEqual(party["contactPoint"], {"email": "sales@example.com"})
+        self.assertEqual(party["details"], {"url": "https://example.com", "scale": "selfEmployed"})
+        self.assertEqual(self.converter.release.parties.get("ORG-0002")["details"], {"scale": "sme"})
+
+    def test_beneficial_owner_is_resolved(self):
+        party = self.converter.release.parties.get("ORG-0001")
+        self.assertEqual(
+            party["beneficialOwners"],
+            [{"id": "UBO-0001", "name": "Kari Nordmann", "nationality": None, "email": "kari@example.com"}],
+        )
+        # the reference inside the organization must not shadow the owner
+        owner = self.converter.parser.index.beneficial_owners["UBO-0001"]
+        self.assertEqual(etree.QName(owner.getparent()).localname, "Organizations")
+
+    def test_touch_point_is_a_party(self):
+        self.assertEqual([party["id"] for party in self.converter.parties], ["ORG-0001", "TPO-0001", "ORG-0002"])
+        touch_point = self.converter.release.parties.get("TPO-0001")
+        self.assertEqual(touch_point["name"], "Supplier desk")
+        self.assertEqual(touch_point["contactPoint"], {"telephone": "+47 12345678"})
+
+
+class TestLotTenders(unittest.TestCase):
+    NOTICE_RESULT_XML = b"""<efac:NoticeResult
+        xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
+        xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1"
+        xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+        xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2">
+      <efac:LotTender>
+        <cbc:ID schemeName="tender">TEN-0001</cbc:ID>
+        <cbc:RankCode>2</cbc:RankCode>
+        <efbc:TenderVariantIndicator>false</efbc:TenderVariantIndicator>
+        <cac:LegalMonetaryTotal><cbc:PayableAmount currencyID="NOK">1200.5</cbc:PayableAmount></cac:LegalMonetaryTotal>
+        <efac:SubcontractingTerm>
+          <efbc:TermAmount currencyID="NOK">300</efbc:TermAmount>
+          <efbc:TermCode listName="applicability">yes</efbc:TermCode>
+          <efbc:TermDescription>Transport</efbc:TermDescription>
+        </efac:SubcontractingTerm>
+        <efac:TenderingParty><cbc:ID schemeName="tendering-party">TPA-0001</cbc:ID></efac:TenderingParty>
+        <efac:TenderLot><cbc:ID schemeName="Lot">LOT-0001</cbc:ID></efac:TenderLot>
+        <efac:TenderReference><cbc:ID>NO/2024-7</cbc:ID></efac:TenderReference>
+      </efac:LotTender>
+      <efac:LotTender>
+        <cbc:ID schemeName="tender">TEN-0001</cbc:ID>
+        <efac:TenderLot><cbc:ID schemeName="Lot">LOT-0002</cbc:ID></efac:TenderLot>
+      </efac:LotTender>
+      <efac:TenderingParty>
+        <cbc:ID schemeName="tendering-party">TPA-0001</cbc:ID>
+        <efac:Tenderer><cbc:ID schemeName="organization">ORG-0001</cbc:ID></efac:Tenderer>
+        <efac:Tenderer><cbc:ID schemeName="organization">ORG-0002</cbc:ID></efac:Tenderer>
+      </efac:TenderingParty>
+    </efac:NoticeResult>"""
+
+    def setUp(self):
+        root = etree.fromstring(self.NOTICE_RESULT_XML)
+        self.converter = TEDtoOCDSConverter(XMLParser.from_element(root))
+        for lot_tender in TreeWalker(root).elements("lot_tender"):
+            self.converter.fetch_lot_tender(lot_tender)
+
+    def test_bid_is_built_from_the_lot_tender(self):
+        bid = self.converter.release.bids.get("TEN-0001")
+        self.assertEqual(bid["value"], {"amount": 1200.5, "currency": "NOK"})
+        self.assertEqual((bid["rank"], bid["hasRank"], bid["variant"]), (2, True, False))
+        self.assertEqual(bid["identifiers"], [{"id": "NO/2024-7", "scheme": "NO-TENDERNL"}])
+        self.assertTrue(bid["hasSubcontracting"])
+        self.assertEqual(
+            bid["subcontracting"],
+            {"value": {"amount": 300.0, "currency": "NOK"}, "description": "Transport"},
+        )
+
+    def test_repeated_tender_is_one_bid(self):
+        self.assertEqual(len(self.converter.tender["bids"]["details"]), 1)
+        bid = self.converter.release.bids.get("TEN-0001")
+        self.assertEqual(bid["relatedLots"], ["LOT-0001", "LOT-0002"])
+        self.assertEqual(bid["tenderers"], [{"id": "ORG-0001"}, {"id": "ORG-0002"}])
+
+    def test_tenderers_get_the_tenderer_role(self):
+        parties = self.converter.parties
+        self.assertEqual([(party["id"], party["roles"]) for party in parties],
+                         [("ORG-0001", ["tenderer"]), ("ORG-0002", ["tenderer"])])
+
+
+class TestJoinResults(unittest.TestCase):
+    def test_contracts_are_joined_to_their_awards(self):
+        parser = XMLParser(os.path.join("tests", "sample_xml", "example_with_notice_result.xml"))
+        release = TEDtoOCDSConverter(parser).convert_tender_to_ocds()
+        self.assertEqual(release["contracts"][0]["awardID"], "RES-0001")
+        award = release["awards"][0]
+        self.assertEqual(award["id"], "RES-0001")
+        self.assertEqual([contract["id"] for contract in award["contracts"]], ["CON-0001"])
+        self.assertEqual(award["buyers"], [{"id": "ORG-0001"}])
+        self.assertEqual(award["suppliers"], [{"id": "ORG-0002"}])
+
+    NOTICE_RESULT_XML = b"""<efac:NoticeResult
+        xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
+        xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+        xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2">
+      <efac:LotResult>
+        <cbc:ID schemeName="result">RES-0001</cbc:ID>
+        <efac:SettledContract><cbc:ID schemeName="contract">CON-0001</cbc:ID></efac:SettledContract>
+        <efac:SettledContract><cbc:ID schemeName="contract">CON-0002</cbc:ID></efac:SettledContract>
+      </efac:LotResult>
+      <efac:LotTender>
+        <cbc:ID schemeName="tender">TEN-0001</cbc:ID>
+        <efac:TenderingParty><cbc:ID schemeName="tendering-party">TPA-0001</cbc:ID></efac:TenderingParty>
+      </efac:LotTender>
+      <efac:LotTender>
+        <cbc:ID schemeName="tender">TEN-0002</cbc:ID>
+        <efac:TenderingParty><cbc:ID schemeName="tendering-party">TPA-0002</cbc:ID></efac:TenderingParty>
+      </efac:LotTender>
+      <efac:SettledContract>
+        <cbc:ID schemeName="contract">CON-0001</cbc:ID>
+        <efac:LotTender><cbc:ID schemeName="tender">TEN-0001</cbc:ID></efac:LotTender>
+      </efac:SettledContract>
+      <efac:SettledContract>
+        <cbc:ID schemeName="contract">CON-0002</cbc:ID>
+        <efac:LotTender><cbc:ID schemeName="tender">TEN-0002</cbc:ID></efac:LotTender>
+      </efac:SettledContract>
+      <efac:SettledContract>
+        <cbc:ID schemeName="contract">CON-0003</cbc:ID>
+        <efac:LotTender><cbc:ID schemeName="tender">TEN-0001</cbc:ID></efac:LotTender>
+      </efac:SettledContract>
+      <efac:TenderingParty>
+        <cbc:ID schemeName="tendering-party">TPA-0001</cbc:ID>
+        <efac:Tenderer><cbc:ID schemeName="organization">ORG-0001</cbc:ID></efac:Tenderer>
+      </efac:TenderingParty>
+      <efac:TenderingParty>
+        <cbc:ID schemeName="tendering-party">TPA-0002</cbc:ID>
+        <efac:Tenderer><cbc:ID schemeName="organization">ORG-0001</cbc:ID></efac:Tenderer>
+        <efac:Tenderer><cbc:ID schemeName="organization">ORG-0002</cbc:ID></efac:Tenderer>
+      </efac:TenderingParty>
+    </efac:NoticeResult>"""
+
+    def test_join_uses_the_references(self):
+        converter = TEDtoOCDSConverter(XMLParser.from_element(etree.fromstring(self.NOTICE_RESULT_XML)))
+        converter.release.replace_award({"id": "RES-0001"})
+        for contract_id, tender_id in (("CON-0001", "TEN-0001"), ("CON-0002", "TEN-0002"), ("CON-0003", "TEN-0001")):
+            converter.add_or_update_contract(contract_id, {"relatedBids": [tender_id]})
+        converter.join_results()
+
+        award = converter.release.award("RES-0001")
+        self.assertEqual(award["suppliers"], [{"id": "ORG-0001"}, {"id": "ORG-0002"}])
+        self.assertEqual(converter.release.contract("CON-0002")["awardID"], "RES-0001")
+        # CON-0003 is not settled by a lot result: no award, but its tenderer is still a supplier
+        self.assertNotIn("awardID", converter.release.contract("CON-0003"))
+        self.assertEqual(converter.release.parties.get("ORG-0002")["roles"], ["supplier", "tenderer"])
+
+
+    MULTI_RESULT_XML = b"""<efac:NoticeResult
+        xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
+        xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+        xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2">
+      <efac:LotResult>
+        <cbc:ID schemeName="result">RES-0001</cbc:ID>
+        <efac:SettledContract><cbc:ID schemeName="contract">CON-0001</cbc:ID></efac:SettledContract>
+      </efac:LotResult>
+      <efac:LotResult>
+        <cbc:ID schemeName="result">RES-0002</cbc:ID>
+        <efac:SettledContract><cbc:ID schemeName="contract">CON-0002</cbc:ID></efac:SettledContract>
+      </efac:LotResult>
+      <efac:LotResult>
+        <cbc:ID schemeName="result">RES-0003</cbc:ID>
+        <efac:SettledContract><cbc:ID schemeName="contract">CON-0003</cbc:ID></efac:SettledContract>
+      </efac:LotResult>
+      <efac:LotTender>
+        <cbc:ID schemeName="tender">TEN-0001</cbc:ID>
+        <cac:LegalMonetaryTotal><cbc:PayableAmount currencyID="NOK">100</cbc:PayableAmount></cac:LegalMonetaryTotal>
+      </efac:LotTender>
+      <efac:LotTender>
+        <cbc:ID schemeName="tender">TEN-0002</cbc:ID>
+        <cac:LegalMonetaryTotal><cbc:PayableAmount currencyID="NOK">200</cbc:PayableAmount></cac:LegalMonetaryTotal>
+      </efac:LotTender>
+      <efac:LotTender>
+        <cbc:ID schemeName="tender">TEN-0003</cbc:ID>
+        <cac:LegalMonetaryTotal><cbc:PayableAmount currencyID="NOK">300</cbc:PayableAmount></cac:LegalMonetaryTotal>
+      </efac:LotTender>
+      <efac:SettledContract>
+        <cbc:ID schemeName="contract">CON-0001</cbc:ID>
+        <efac:LotTender><cbc:ID schemeName="tender">TEN-0003</cbc:ID></efac:LotTender>
+      </efac:SettledContract>
+      <efac:SettledContract>
+        <cbc:ID schemeName="contract">CON-0002</cbc:ID>
+        <efac:LotTender><cbc:ID schemeName="tender">TEN-0001</cbc:ID></efac:LotTender>
+      </efac:SettledContract>
+      <efac:SettledContract>
+        <cbc:ID schemeName="contract">CON-0003</cbc:ID>
+        <efac:LotTender><cbc:ID schemeName="tender">TEN-0002</cbc:ID></efac:LotTender>
+      </efac:SettledContract>
+    </efac:NoticeResult>"""
+
+    def test_each_award_gets_the_value_of_its_own_tender(self):
+        root = etree.fromstring(self.MULTI_RESULT_XML)
+        converter = TEDtoOCDSConverter(XMLParser.from_element(root))
+        for result_id in ("RES-0001", "RES-0002", "RES-0003"):
+            converter.release.replace_award({"id": result_id})
+        for lot_tender in TreeWalker(root).elements("lot_tender"):
+            converter.fetch_bt720_tender_value(lot_tender)
+
+        values = {
+            result_id: converter.release.award(result_id)["value"]["amount"]
+            for result_id in ("RES-0001", "RES-0002", "RES-0003")
+        }
+        self.assertEqual(values, {"RES-0001": 300.0, "RES-0002": 100.0, "RES-0003": 200.0})
+
+
+class TestRecords(unittest.TestCase):
+    def test_dict_operations(self):
+        party = Party(id="ORG-0001", roles=["buyer"])
+        party.setdefault("details", {})["scale"] = "sme"
+        party["customField"] = "kept"
+        self.assertIn("details", party)
+        self.assertNotIn("name", party)
+        self.assertIsNone(party.get("name"))
+        self.assertEqual(list(party), ["id", "roles", "details", "customField"])
+        self.assertEqual(party, {"id": "ORG-0001", "roles": ["buyer"], "details": {"scale": "sme"}, "customField": "kept"})
+        del party["customField"]
+        with self.assertRaises(KeyError):
+            party["customField"]
+        self.assertFalse(hasattr(party, "__dict__"))
+
+    def test_to_ocds_prunes_empty_fields(self):
+        award = Award(id="RES-0001", relatedLots=[], status=None, contracts=[Bid(id="TEN-0001", rank=1)])
+        self.assertEqual(award.to_ocds(), {"id": "RES-0001", "contracts": [{"id": "TEN-0001", "rank": 1}]})
+        self.assertIs(Bid.of(award["contracts"][0]), award["contracts"][0])
+
+    def test_release_objects_are_records(self):
+        path = os.path.join("tests", "sample_xml", "example_with_notice_result.xml")
+        converter = TEDtoOCDSConverter(XMLParser(path))
+        release = converter.convert_tender_to_ocds()
+        self.assertTrue(all(isinstance(party, Party) for party in converter.parties))
+        self.assertTrue(all(type(party) is dict for party in release["parties"]))
+        self.assertTrue(all(type(award) is dict for award in release.get("awards", [])))
+
+
+class TestBatchConversion(unittest.TestCase):
+    def test_collect_notice_files(self):
+        sample_dir = os.path.join("tests", "sample_xml")
+        paths = collect_notice_files([sample_dir, os.path.join(sample_dir, "example*.xml")])
+        self.assertIn(os.path.join(sample_dir, "invalid.xml"), paths)
+        self.assertEqual(paths, sorted(set(paths)))
+
+    def test_convert_batch_reports_failures(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            broken = os.path.join(tmp_dir, "broken.xml")
+            with open(broken, "w") as file:
+                file.write("<notice")
+            paths = [os.path.join("tests", "sample_xml", "example_with_notice_result.xml"), broken]
+            for workers in (1, 2):
+                output_dir = os.path.join(tmp_dir, f"out{workers}")
+                releases, failures = convert_batch(paths, output_dir=output_dir, workers=workers, chunk_size=1)
+                self.assertEqual(list(releases), paths[:1])
+                self.assertEqual([path for path, error in failures], [broken])
+                self.assertTrue(os.path.exists(os.path.join(output_dir, "example_with_notice_result.json")))
+
+    def test_output_mirrors_input_subdirectories(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_dir = os.path.join(tmp_dir, "in")
+            paths = []
+            for folder in ("a", "b"):
+                os.makedirs(os.path.join(input_dir, folder))
+                paths.append(os.path.join(input_dir, folder, "n.xml"))
+                shutil.copy(os.path.join("tests", "sample_xml", "example_with_notice_result.xml"), paths[-1])
+            output_dir = os.path.join(tmp_dir, "out")
+            releases, failures = convert_batch(
+                collect_notice_files([input_dir]), output_dir=output_dir, workers=2, chunk_size=1, input_roots=[input_dir]
+            )
+            self.assertEqual((len(releases), failures), (2, []))
+            for folder in ("a", "b"):
+                self.assertTrue(os.path.exists(os.path.join(output_dir, folder, "n.json")))
+
+    def test_verbosity_level(self):
+        self.assertEqual(verbosity_level(), logging.WARNING)
+        self.assertEqual(verbosity_level(verbose=1), logging.INFO)
+        self.assertEqual(verbosity_level(verbose=3), logging.DEBUG)
+        self.assertEqual(verbosity_level(verbose=2, quiet=True), logging.ERROR)
+
+    def test_release_package(self):
+        path = os.path.join("tests", "sample_xml", "example_with_notice_result.xml")
+        releases, failures = convert_batch([path], workers=1)
+        package = create_release_package(list(releases.values()))
+        self.assertEqual(package["releases"][0]["tag"], ["award", "contract"])
+
+
+class TestConversionCache(unittest.TestCase):
+    def test_get_put_and_eviction(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = ConversionCache(os.path.join(tmp_dir, "cache.db"), max_bytes=250, version="test")
+            serializer = get_serializer("json")
+            keys = [cache.key(b"<notice>%d</notice>" % number, serializer) for number in range(3)]
+            self.assertIsNone(cache.get(keys[0]))
+            cache.put(keys[0], b"a" * 100)
+            cache.put(keys[1], b"b" * 100)
+            self.assertEqual(cache.get(keys[0]), b"a" * 100)
+            # keys[1] is now the least recently used entry
+            cache.put(keys[2], b"c" * 100)
+            self.assertIsNone(cache.get(keys[1]))
+            self.assertEqual(cache.get(keys[2]), b"c" * 100)
+            self.assertNotEqual(cache.key(b"<notice/>", serializer), cache.key(b"<notice/>", get_serializer("json", pretty=True)))
+            cache.close()
+
+    def test_hits_write_access_times_on_flush(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = ConversionCache(os.path.join(tmp_dir, "cache.db"), version="test")
+            cache.put("key", b"release")
+            cache.connection.execute("UPDATE releases SET accessed = 0")
+            query = "SELECT accessed FROM releases WHERE key = 'key'"
+            self.assertEqual(cache.get("key"), b"release")
+            self.assertEqual(cache.connection.execute(query).fetchone()[0], 0)
+            cache.flush()
+            self.assertGreater(cache.connection.execute(query).fetchone()[0], 0)
+            cache.close()
+
+    def test_batch_uses_cache(self):
+        path = os.path.join("tests", "sample_xml", "example_with_notice_result.xml")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = ConversionCache(os.path.join(tmp_dir, "cache.db"))
+            first, _ = convert_batch([path], workers=1, cache=cache)
+            second, _ = convert_batch([path], workers=1, cache=cache)
+            self.assertEqual((cache.misses, cache.hits), (1, 1))
+            self.assertEqual(json.dumps(first[path], sort_keys=True), json.dumps(second[path], sort_keys=True))
+            output_dir = os.path.join(tmp_dir, "out")
+            convert_batch([path], output_dir=output_dir, workers=2, cache=cache)
+            with open(os.path.join(output_dir, "example_with_notice_result.json"), encoding="utf-8") as file:
+                self.assertEqual(json.load(file)["tag"], ["award", "contract"])
+            cache.close()
+
+
+class TestManifest(unittest.TestCase):
+    def test_only_new_or_changed_notices_are_converted(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "notice.xml")
+            with open(os.path.join("tests", "sample_xml", "example_with_notice_result.xml"), "rb") as file:
+                xml_data = file.read()
+            with open(path, "wb") as file:
+                file.write(xml_data)
+            output_dir = os.path.join(tmp_dir, "out")
+            manifest_path = os.path.join(tmp_dir, "manifest.json")
+
+            def run(version="v1"):
+                releases, _ = convert_batch([path], output_dir=output_dir, workers=1, manifest=Manifest(manifest_path, version))
+                return list(releases)
+
+            self.assertEqual(run(), [path])
+            self.assertEqual(run(), [])
+            # Same bytes with a new mtime are hashed, not converted
+            os.utime(path, ns=(0, 0))
+            self.assertEqual(run(), [])
+            with open(path, "wb") as file:
+                file.write(xml_data.replace(b"Test Buyer", b"Other Buyer"))
+            self.assertEqual(run(), [path])
+            self.assertEqual(run(version="v2"), [path])
+            os.remove(os.path.join(output_dir, "notice.json"))
+            self.assertEqual(run(version="v2"), [path])
+
+    def test_file_changed_during_conversion_is_converted_again(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "notice.xml")
+            shutil.copy(os.path.join("tests", "sample_xml", "example_with_notice_result.xml"), path)
+            output_dir = os.path.join(tmp_dir, "out")
+            manifest_path = os.path.join(tmp_dir, "manifest.json")
+
+            def convert_then_edit(*args, **kwargs):
+                release = convert_file(*args, **kwargs)
+                with open(path, "ab") as file:
+                    file.write(b"<!-- edited -->")
+                return release
+
+            with mock.patch("src.read_write.convert_file", convert_then_edit):
+                convert_batch([path], output_dir=output_dir, workers=1, manifest=Manifest(manifest_path, "v1"))
+            releases, _ = convert_batch([path], output_dir=output_dir, workers=1, manifest=Manifest(manifest_path, "v1"))
+            self.assertEqual(list(releases), [path])
+
+    def test_new_output_directory_converts_again(self):
+        path = os.path.join("tests", "sample_xml", "example_with_notice_result.xml")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            manifest_path = os.path.join(tmp_dir, "manifest.json")
+            for output_dir in ("out1", "out2"):
+                output_dir = os.path.join(tmp_dir, output_dir)
+                releases, _ = convert_batch([path], output_dir=output_dir, workers=1, manifest=Manifest(manifest_path, "v1"))
+                self.assertEqual(list(releases), [path])
+                self.assertTrue(os.path.exists(os.path.join(output_dir, "example_with_notice_result.json")))
+            releases, _ = convert_batch([path], output_dir=output_dir, workers=1, manifest=Manifest(manifest_path, "v1"))
+            self.assertEqual(list(releases), [])
+
+    def test_same_named_notices_in_different_directories(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_dir = os.path.join(tmp_dir, "in")
+            paths = []
+            for folder in ("a", "b"):
+                os.makedirs(os.path.join(input_dir, folder))
+                paths.append(os.path.join(input_dir, folder, "n.xml"))
+                shutil.copy(os.path.join("tests", "sample_xml", "example_with_notice_result.xml"), paths[-1])
+            output_dir = os.path.join(tmp_dir, "out")
+            manifest_path = os.path.join(tmp_dir, "manifest.json")
+
+            # Named after the file alone, both notices would write out/n.json
+            with self.assertRaises(ValueError):
+                convert_batch(paths, output_dir=output_dir, workers=1, manifest=Manifest(manifest_path, "v1"))
+            self.assertFalse(os.path.exists(manifest_path))
+
+            releases, _ = convert_batch(
+                paths, output_dir=output_dir, workers=1, manifest=Manifest(manifest_path, "v1"), input_roots=[input_dir]
+            )
+            self.assertEqual(list(releases), paths)
+            manifest = Manifest(manifest_path, "v1")
+            self.assertEqual(
+                [manifest.entries[path]["output"] for path in paths],
+                [os.path.join(output_dir, "a", "n.json"), os.path.join(output_dir, "b", "n.json")],
+            )
+
+    def test_recording_a_taken_output_drops_the_other_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            first, second = os.path.join(tmp_dir, "first.xml"), os.path.join(tmp_dir, "second.xml")
+            output_path = os.path.join(tmp_dir, "n.json")
+            for path in (first, second, output_path):
+                with open(path, "w") as file:
+                    file.write("<notice/>")
+            manifest = Manifest(os.path.join(tmp_dir, "manifest.json"), "v1")
+            manifest.record(first, output_path)
+            manifest.record(second, output_path)
+            self.assertEqual(list(manifest.entries), [second])
+            self.assertEqual(manifest.pending([first, second]), [first])
+
+
+class TestSerialization(unittest.TestCase):
+    data = {"id": "ORG-0001", "name": "Bærum kommune", "value": {"amount": 1.5}, "roles": ["buyer"]}
+
+    def test_backends_agree(self):
+        for backend in available_backends():
+            for pretty in (False, True):
+                encoded = get_serializer(backend, pretty=pretty).dumps(self.data)
+                self.assertIsInstance(encoded, bytes)
+                self.assertEqual(json.loads(encoded), self.data)
+                self.assertIn("Bærum".encode("utf-8"), encoded)
+                self.assertEqual(b"\n" in encoded, pretty)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            get_serializer("yaml")
+
+    def test_write_json(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "release.json")
+            write_json(self.data, path, get_serializer("json"))
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(json.load(file), self.data)
+
+
+class TestProfiler(unittest.TestCase):
+    def test_converter_records_handlers_and_phases(self):
+        profiler = Profiler()
+        parser = XMLParser(os.path.join("tests", "sample_xml", "example_with_notice_result.xml"))
+        TEDtoOCDSConverter(parser, profiler).convert_tender_to_ocds()
+        self.assertEqual(profiler.notices, 1)
+        for phase in ("fetch_loop", "parse_lots", "parse_classifications",
+                      "clean_release_structure"):
+            self.assertEqual(profiler.stats[phase].kind, "phase")
+            self.assertEqual(profiler.stats[phase].calls, 1)
+        stats = profiler.stats["fetch_lot_tender"]
+        self.assertEqual((stats.kind, stats.calls, stats.elements), ("handler", 1, 1))
+        self.assertIn("fetch_loop", profiler.format_table())
+
+    def test_batch_profile_is_merged_across_workers(self):
+        paths = [
+            os.path.join("tests", "sample_xml", "example_with_notice_result.xml"),
+            os.path.join("tests", "sample_xml", "example.xml"),
+        ]
+        for workers in (1, 2):
+            profiler = Profiler()
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                convert_batch(paths, output_dir=tmp_dir, workers=workers, chunk_size=1, profiler=profiler)
+            self.assertEqual(profiler.notices, 2)
+            self.assertEqual(profiler.stats["serialization"].calls, 2)
+            restored = Profiler.from_dict(json.loads(json.dumps(profiler.as_dict())))
+            self.assertEqual(restored.stats["fetch_loop"].calls, 2)
+
+    def test_releases_from_workers(self):
+        paths = [
+            os.path.join("tests", "sample_xml", "example_with_notice_result.xml"),
+            os.path.join("tests", "sample_xml", "example.xml"),
+        ]
+        releases, failures = convert_batch(paths, workers=2, chunk_size=1)
+        self.assertEqual(failures, [])
+        self.assertIn("ORG-0001", [party["id"] for party in releases[paths[0]]["parties"]])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file